@@ -38,6 +38,7 @@ import os
 import sys
 import argparse
 from datetime import datetime, timedelta, date
+from typing import TextIO
 from collections import defaultdict, Counter
 
 # Fügt das Projekt-Root-Verzeichnis zum Python-Pfad hinzu
@@ -88,7 +89,8 @@ def get_status_at_date(key_activities: list, target_date: date, default_status:
 
 
 # --- MODIFIZIERT: 'issue_type' als Parameter, gibt jetzt dict zurück ---
-def analyze_epic_dynamics(root_key: str, start_date: date, stop_date: date, issue_type: str):
+def analyze_epic_dynamics(root_key: str, start_date: date, stop_date: date, issue_type: str,
+                          data_provider: ProjectDataProvider = None, out: TextIO = None):
     """
     Führt eine Analyse der Dynamik für einen Jira-Root-Knoten und
     einen bestimmten Issue-Typ durch.
@@ -98,10 +100,16 @@ def analyze_epic_dynamics(root_key: str, start_date: date, stop_date: date, issu
         start_date (date): Das Startdatum des Analysezeitraums.
         stop_date (date): Das Enddatum des Analysezeitraums.
         issue_type (str): Der zu analysierende Issue-Typ (z.B. 'Epic').
+        data_provider (ProjectDataProvider, optional): Ein bereits geladener Provider
+            für `root_key` (mit `JIRA_TREE_FULL`). Wird keiner übergeben, wird er neu erstellt.
+        out (TextIO, optional): Ziel-Stream für den Bericht. Standard: sys.stdout.
 
     Returns:
         dict: Ein Dictionary mit den Schlüsselmetriken für die CSV-Zusammenfassung.
     """
+    if out is None:
+        out = sys.stdout
+
     date_range_str = f"{start_date.strftime('%d.%m.%Y')} - {stop_date.strftime('%d.%m.%Y')}"
     logger.info(f"Starte {issue_type}-Dynamik-Analyse für Root-Knoten: {root_key} (Zeitraum: {date_range_str})")
 
@@ -116,8 +124,9 @@ def analyze_epic_dynamics(root_key: str, start_date: date, stop_date: date, issu
         "Epics Statusänderung": 0,
     }
 
-    # 1. Daten-Provider initialisieren
-    data_provider = ProjectDataProvider(epic_id=root_key, hierarchy_config=JIRA_TREE_FULL)
+    # 1. Daten-Provider initialisieren (falls nicht übergeben)
+    if data_provider is None:
+        data_provider = ProjectDataProvider(epic_id=root_key, hierarchy_config=JIRA_TREE_FULL)
     if not data_provider.is_valid():
         logger.error(f"Konnte keine gültigen Daten für das Epic '{root_key}' laden oder Hierarchie ist leer.")
         print(f"Fehler: Konnte keine gültigen Daten für das Epic '{root_key}' laden oder die Hierarchie ist leer.", file=sys.stderr)
@@ -243,11 +252,11 @@ def analyze_epic_dynamics(root_key: str, start_date: date, stop_date: date, issu
     }
 
     # --- Ausgabe der Ergebnisse (BLEIBT UNVERÄNDERT FÜR DAS TEXT-LOG) ---
-    print(f"\n===== {issue_type}-Analyse für Root-Knoten {root_key} ({date_range_str}) =====")
+    print(f"\n===== {issue_type}-Analyse für Root-Knoten {root_key} ({date_range_str}) =====", file=out)
 
-    print(f"\n--- 📊 Übersicht (Stand Heute: {datetime.now().date().strftime('%d.%m.%Y')}) ---")
-    print(f"Gesamtzahl der {issue_type}s unter {root_key}: {len(all_issues_data)}")
-    print(f"Aktueller Status der {issue_type}s:")
+    print(f"\n--- 📊 Übersicht (Stand Heute: {datetime.now().date().strftime('%d.%m.%Y')}) ---", file=out)
+    print(f"Gesamtzahl der {issue_type}s unter {root_key}: {len(all_issues_data)}", file=out)
+    print(f"Aktueller Status der {issue_type}s:", file=out)
 
     status_order = [
         "FUNNEL", "BACKLOG", "REVIEW", "ANALYSIS", "IN PROGRESS",
@@ -258,46 +267,46 @@ def analyze_epic_dynamics(root_key: str, start_date: date, stop_date: date, issu
     for status in status_order:
         if status in status_counts:
             count = status_counts[status]
-            print(f"  - {status:<20}: {count} Issue(s)")
+            print(f"  - {status:<20}: {count} Issue(s)", file=out)
             printed_statuses.add(status)
 
     remaining_statuses = sorted([s for s in status_counts if s not in printed_statuses])
     if remaining_statuses:
-         print("  --- Andere Status ---")
+         print("  --- Andere Status ---", file=out)
          for status in remaining_statuses:
               count = status_counts[status]
-              print(f"  - {status:<20}: {count} Issue(s)")
+              print(f"  - {status:<20}: {count} Issue(s)", file=out)
 
-    print(f"\n--- 📈 Dynamik im Zeitraum ({date_range_str}) ---")
-    print(f"Neu erstellte {issue_type}s: {len(newly_created_issues)}")
-    print(f"Abgeschlossene {issue_type}s ('Closed'/'Resolved'): {len(recently_closed_issues)}")
-    print(f"{issue_type}s mit Statusänderung (die vorher existierten): {len(status_changed_issues)}")
+    print(f"\n--- 📈 Dynamik im Zeitraum ({date_range_str}) ---", file=out)
+    print(f"Neu erstellte {issue_type}s: {len(newly_created_issues)}", file=out)
+    print(f"Abgeschlossene {issue_type}s ('Closed'/'Resolved'): {len(recently_closed_issues)}", file=out)
+    print(f"{issue_type}s mit Statusänderung (die vorher existierten): {len(status_changed_issues)}", file=out)
 
-    print(f"\n--- ✨ Details: {len(newly_created_issues)} Kürzlich erstellte {issue_type}s ---")
+    print(f"\n--- ✨ Details: {len(newly_created_issues)} Kürzlich erstellte {issue_type}s ---", file=out)
     if newly_created_issues:
         for issue in sorted(newly_created_issues, key=lambda x: x['start_date'], reverse=True):
             days_ago = (datetime.now().date() - issue['start_date']).days
-            print(f"  - {issue['key']:<15} | Erstellt am: {issue['start_date'].strftime('%d.%m.%Y')} (vor {days_ago} Tagen)")
+            print(f"  - {issue['key']:<15} | Erstellt am: {issue['start_date'].strftime('%d.%m.%Y')} (vor {days_ago} Tagen)", file=out)
     else:
-        print(f"  Keine {issue_type}s in diesem Zeitraum erstellt.")
+        print(f"  Keine {issue_type}s in diesem Zeitraum erstellt.", file=out)
 
-    print(f"\n--- ✅ Details: {len(recently_closed_issues)} Kürzlich abgeschlossene {issue_type}s ---")
+    print(f"\n--- ✅ Details: {len(recently_closed_issues)} Kürzlich abgeschlossene {issue_type}s ---", file=out)
     if recently_closed_issues:
         for issue in sorted(recently_closed_issues, key=lambda x: x['end_date'], reverse=True):
             laufzeit = (issue['end_date'] - issue['start_date']).days
             start_str = issue['start_date'].strftime('%d.%m.%Y')
             end_str = issue['end_date'].strftime('%d.%m.%Y')
-            print(f"  - {issue['key']:<15} | Erstellt: {start_str} | Abgeschlossen: {end_str} (Laufzeit: {laufzeit} Tage)")
+            print(f"  - {issue['key']:<15} | Erstellt: {start_str} | Abgeschlossen: {end_str} (Laufzeit: {laufzeit} Tage)", file=out)
     else:
-        print(f"  Keine {issue_type}s in diesem Zeitraum abgeschlossen.")
+        print(f"  Keine {issue_type}s in diesem Zeitraum abgeschlossen.", file=out)
 
-    print(f"\n--- 🔄 Details: {len(status_changed_issues)} {issue_type}s mit Statusänderung ---")
+    print(f"\n--- 🔄 Details: {len(status_changed_issues)} {issue_type}s mit Statusänderung ---", file=out)
     if status_changed_issues:
         sorted_changed = sorted(status_changed_issues, key=lambda x: (x['status_at_start_date'], x['status_at_stop_date']))
         for issue in sorted_changed:
-            print(f"  - {issue['key']:<15} | Statusänderung von '{issue['status_at_start_date']}' zu '{issue['status_at_stop_date']}'")
+            print(f"  - {issue['key']:<15} | Statusänderung von '{issue['status_at_start_date']}' zu '{issue['status_at_stop_date']}'", file=out)
     else:
-        print(f"  Keine {issue_type}s mit Statusänderung im Zeitraum gefunden.")
+        print(f"  Keine {issue_type}s mit Statusänderung im Zeitraum gefunden.", file=out)
 
     # --- NEU: Rückgabe der Metriken ---
     return metrics
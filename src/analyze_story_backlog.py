@@ -46,6 +46,7 @@ import os
 import sys
 import argparse
 from datetime import datetime, timedelta, date
+from typing import TextIO
 from collections import defaultdict
 
 # Fügt das Projekt-Root-Verzeichnis zum Python-Pfad hinzu
@@ -57,7 +58,8 @@ from utils.project_data_provider import ProjectDataProvider
 from utils.config import JIRA_TREE_FULL
 from utils.logger_config import logger
 
-def analyze_story_backlog(epic_key: str, start_date: date, stop_date: date):
+def analyze_story_backlog(epic_key: str, start_date: date, stop_date: date,
+                          data_provider: ProjectDataProvider = None, out: TextIO = None):
     """
     Führt eine umfassende Analyse des Story-Backlogs für ein Business Epic durch.
 
@@ -65,10 +67,16 @@ def analyze_story_backlog(epic_key: str, start_date: date, stop_date: date):
         epic_key (str): Der Jira-Key des Business Epics.
         start_date (date): Das Startdatum (inklusiv) des Analysezeitraums.
         stop_date (date): Das Enddatum (inklusiv) des Analysezeitraums.
+        data_provider (ProjectDataProvider, optional): Ein bereits geladener Provider
+            für `epic_key` (mit `JIRA_TREE_FULL`). Wird keiner übergeben, wird er neu erstellt.
+        out (TextIO, optional): Ziel-Stream für den Bericht. Standard: sys.stdout.
 
     Returns:
         dict: Ein Dictionary mit den Schlüsselmetriken für die CSV-Zusammenfassung.
     """
+    if out is None:
+        out = sys.stdout
+
     date_range_str = f"{start_date.strftime('%d.%m.%Y')} - {stop_date.strftime('%d.%m.%Y')}"
     logger.info(f"Starte umfassende Backlog-Analyse für Epic: {epic_key} (Zeitraum: {date_range_str})")
 
@@ -81,8 +89,9 @@ def analyze_story_backlog(epic_key: str, start_date: date, stop_date: date):
         "Backlog-Änderung Stories": 0,
     }
 
-    # 1. Daten-Provider initialisieren
-    data_provider = ProjectDataProvider(epic_id=epic_key, hierarchy_config=JIRA_TREE_FULL)
+    # 1. Daten-Provider initialisieren (falls nicht übergeben)
+    if data_provider is None:
+        data_provider = ProjectDataProvider(epic_id=epic_key, hierarchy_config=JIRA_TREE_FULL)
     if not data_provider.is_valid():
         logger.error(f"Konnte keine gültigen Daten für das Epic '{epic_key}' laden.")
         return default_metrics
@@ -177,29 +186,29 @@ def analyze_story_backlog(epic_key: str, start_date: date, stop_date: date):
 
 
     # --- Ausgabe der Ergebnisse (BLEIBT UNVERÄNDERT FÜR DAS TEXT-LOG) ---
-    print(f"\n===== Backlog-Analyse für Epic {epic_key} ({date_range_str}) =====")
-    print("\n--- 📈 Backlog-Veränderung ---")
-    print(f"Gesamtzahl der Stories unter {epic_key}: {total_stories}")
+    print(f"\n===== Backlog-Analyse für Epic {epic_key} ({date_range_str}) =====", file=out)
+    print("\n--- 📈 Backlog-Veränderung ---", file=out)
+    print(f"Gesamtzahl der Stories unter {epic_key}: {total_stories}", file=out)
     if backlog_change > 0:
-        print(f"Der Story-Backlog ist im Zeitraum {date_range_str} um {backlog_change} Stories gewachsen.")
+        print(f"Der Story-Backlog ist im Zeitraum {date_range_str} um {backlog_change} Stories gewachsen.", file=out)
     elif backlog_change < 0:
-        print(f"Der Story-Backlog ist im Zeitraum {date_range_str} um {abs(backlog_change)} Stories geschrumpft.")
+        print(f"Der Story-Backlog ist im Zeitraum {date_range_str} um {abs(backlog_change)} Stories geschrumpft.", file=out)
     else:
-        print(f"Der Story-Backlog ist im Zeitraum {date_range_str} konstant geblieben.")
-    print(f"(Neu erstellt: {num_created}, Abgeschlossen: {num_closed})\n")
+        print(f"Der Story-Backlog ist im Zeitraum {date_range_str} konstant geblieben.", file=out)
+    print(f"(Neu erstellt: {num_created}, Abgeschlossen: {num_closed})\n", file=out)
 
 
-    print(f"--- ✨ {len(newly_created_stories)} Im Zeitraum erstellte Stories ---")
+    print(f"--- ✨ {len(newly_created_stories)} Im Zeitraum erstellte Stories ---", file=out)
     if newly_created_stories:
         sorted_new = sorted(newly_created_stories, key=lambda x: x['start_date'], reverse=True)
         for story in sorted_new:
             days_ago = (datetime.now().date() - story['start_date']).days
-            print(f"  - {story['key']:<15} | Erstellt am: {story['start_date'].strftime('%d.%m.%Y')} (vor {days_ago} Tagen)")
+            print(f"  - {story['key']:<15} | Erstellt am: {story['start_date'].strftime('%d.%m.%Y')} (vor {days_ago} Tagen)", file=out)
     else:
-        print("  Keine Stories in diesem Zeitraum erstellt.")
-    print()
+        print("  Keine Stories in diesem Zeitraum erstellt.", file=out)
+    print(file=out)
 
-    print(f"--- ✅ {len(recently_closed_stories)} Im Zeitraum abgeschlossene Stories ---")
+    print(f"--- ✅ {len(recently_closed_stories)} Im Zeitraum abgeschlossene Stories ---", file=out)
     if recently_closed_stories:
         valid_closed_stories = []
         for story in recently_closed_stories:
@@ -210,13 +219,13 @@ def analyze_story_backlog(epic_key: str, start_date: date, stop_date: date):
         sorted_closed = sorted(valid_closed_stories, key=lambda x: x['end_date'], reverse=True)
 
         for story in sorted_closed:
-            print(f"  - {story['key']:<15} | Erstellt: {story['start_date'].strftime('%d.%m.%Y')} | Abgeschlossen: {story['end_date'].strftime('%d.%m.%Y')} (Laufzeit: {story['laufzeit']} Tage)")
+            print(f"  - {story['key']:<15} | Erstellt: {story['start_date'].strftime('%d.%m.%Y')} | Abgeschlossen: {story['end_date'].strftime('%d.%m.%Y')} (Laufzeit: {story['laufzeit']} Tage)", file=out)
     else:
-        print("  Keine Stories in diesem Zeitraum abgeschlossen.")
-    print()
+        print("  Keine Stories in diesem Zeitraum abgeschlossen.", file=out)
+    print(file=out)
 
 
-    print(f"--- 📝 {len(open_stories_data)} Offene Stories (sortiert nach Status und letzter Aktivität) ---")
+    print(f"--- 📝 {len(open_stories_data)} Offene Stories (sortiert nach Status und letzter Aktivität) ---", file=out)
     if open_stories_data:
         status_order_list = [
             "FUNNEL", "ANALYSIS", "REFINEMENT", "BACKLOG", "IN PROGRESS", "WAITING",
@@ -234,9 +243,9 @@ def analyze_story_backlog(epic_key: str, start_date: date, stop_date: date):
         for story in sorted_open:
             last_activity_days_ago = (datetime.now().date() - story['last_activity_date']).days
             status_display = story.get('status', 'N/A')
-            print(f"  - {story['key']:<15} | Status: {status_display:<20} | Letzte Aktivität: {story['last_activity_date'].strftime('%d.%m.%Y')} (vor {last_activity_days_ago} Tagen)")
+            print(f"  - {story['key']:<15} | Status: {status_display:<20} | Letzte Aktivität: {story['last_activity_date'].strftime('%d.%m.%Y')} (vor {last_activity_days_ago} Tagen)", file=out)
     else:
-        print("  Alle Stories sind geschlossen oder erledigt.")
+        print("  Alle Stories sind geschlossen oder erledigt.", file=out)
 
     # --- NEU: Metriken-Dictionary zurückgeben ---
     metrics = {
@@ -10,7 +10,10 @@ Business Value zu extrahieren, und liest die Akzeptanzkriterien aus.
 
 Das Hauptziel ist die Aktualisierung oder erstmalige Erfassung dieser spezifischen
 Felder in den lokalen JSON-Dateien (`data/jira_issues`). Es wird eine einzige,
-persistente Browser-Session genutzt, um den Login-Overhead zu minimieren.
+Browser-Session pro Worker genutzt: Ein kleiner Pool von `SCRAPER_POOL_SIZE`
+Browsern arbeitet die Keys parallel ab. Die Browser werden vorab nacheinander
+angemeldet; nur der erste Login ist ggf. interaktiv, die übrigen übernehmen die
+gespeicherte Sitzung.
 
 Anwendungsfälle:
 -   Aktualisierung des Business Value nach manueller Überarbeitung in Jira.
@@ -21,6 +24,11 @@ Anwendungsfälle:
 
 import os
 import sys
+import time
+import argparse
+import queue
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Fügt das Projekt-Root-Verzeichnis zum Python-Pfad hinzu
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -30,22 +38,117 @@ if project_root not in sys.path:
 from utils.jira_scraper import JiraScraper
 from utils.azure_ai_client import AzureAIClient
 from utils.prompt_loader import load_prompt_template
-from utils.config import JIRA_EMAIL, LLM_MODEL_BUSINESS_VALUE
+from utils.config import JIRA_EMAIL, LLM_MODEL_BUSINESS_VALUE, JIRA_ISSUES_DIR, SCRAPER_CHECK_DAYS, ensure_dirs
 from utils.logger_config import logger
 
-def scrape_epics_from_file(file_path: str):
+# Anzahl paralleler Browser-Sessions (begrenzt durch Speicher und Jira-Rate-Limits)
+SCRAPER_POOL_SIZE = 3
+BASE_JIRA_URL = "https://jira.telekom.de/"
+
+
+def _create_scraper(ai_client: AzureAIClient) -> JiraScraper:
+    """Erzeugt eine neue JiraScraper-Instanz für einen Pool-Worker."""
+    return JiraScraper(
+        url=BASE_JIRA_URL,
+        email=JIRA_EMAIL,
+        model=LLM_MODEL_BUSINESS_VALUE,
+        scrape_mode='true',
+        azure_client=ai_client
+    )
+
+
+def _is_fresh(issue_key: str, max_age_days: float = SCRAPER_CHECK_DAYS) -> bool:
+    """Prüft, ob die lokale JSON-Datei eines Issues jünger als `max_age_days` ist."""
+    try:
+        mtime = os.stat(os.path.join(JIRA_ISSUES_DIR, f"{issue_key}.json")).st_mtime
+    except FileNotFoundError:
+        return False
+    return time.time() - mtime < max_age_days * 86400
+
+
+def _close_scraper(scraper: JiraScraper):
+    """Schließt die Browser-Sitzung eines Scrapers, sofern eine geöffnet ist."""
+    if hasattr(scraper, 'login_handler') and scraper.login_handler and scraper.login_handler.driver:
+        scraper.login_handler.close()
+
+
+def _login_scrapers(pool_size: int, ai_client: AzureAIClient) -> list:
+    """
+    Erzeugt die Scraper des Pools und meldet sie nacheinander an (wie `DriverPool`).
+
+    Der erste Login ist ggf. interaktiv (MFA, AppleScript-Tastendruck) und speichert
+    die Sitzung; alle weiteren Browser übernehmen sie ohne erneute MFA. Logins laufen
+    bewusst nie parallel, da sich die Browser sonst Fokus und Tastatureingaben
+    gegenseitig wegnehmen würden.
+    """
+    scrapers = []
+    for worker_id in range(1, pool_size + 1):
+        scraper = _create_scraper(ai_client)
+        if scraper.login():
+            scrapers.append(scraper)
+            logger.info(f"[Worker {worker_id}] Browser {worker_id}/{pool_size} angemeldet.")
+            continue
+
+        logger.error(f"[Worker {worker_id}] Login fehlgeschlagen.")
+        _close_scraper(scraper)
+        if not scrapers:
+            # Ohne gespeicherte Sitzung würde jeder weitere Versuch erneut interaktiv anmelden
+            break
+    return scrapers
+
+
+def _scrape_worker(worker_id: int, scraper: JiraScraper, key_queue: queue.Queue):
+    """
+    Pool-Worker: Arbeitet mit seinem bereits angemeldeten Scraper Keys aus der
+    gemeinsamen Queue ab, bis diese leer ist. Jeder Key wird in eine eigene
+    JSON-Datei geschrieben, daher ist keine Synchronisation der Schreibzugriffe nötig.
+    """
+    try:
+        while True:
+            try:
+                issue_key = key_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            logger.info(f"[Worker {worker_id}] --- Starte Verarbeitung für: {issue_key} ---")
+            issue_url = f"{BASE_JIRA_URL}browse/{issue_key}"
+            try:
+                issue_data = scraper.extract_and_save_issue_data(issue_url, issue_key)
+
+                if issue_data:
+                    json_path = os.path.join('data', 'jira_issues', f"{issue_key}.json")
+                    logger.info(f"Scraping für {issue_key} erfolgreich. Gespeichert unter: {os.path.abspath(json_path)}")
+                else:
+                    logger.warning(f"Fehler beim Scraping von {issue_key}. Es wurde keine Datei erstellt.")
+            except Exception as e:
+                logger.error(f"[Worker {worker_id}] Unerwarteter Fehler bei {issue_key}: {e}")
+            finally:
+                key_queue.task_done()
+            logger.info(f"[Worker {worker_id}] --- Verarbeitung für {issue_key} abgeschlossen ---")
+
+    finally:
+        # Browser-Sitzung des Workers am Ende schließen
+        _close_scraper(scraper)
+        logger.info(f"[Worker {worker_id}] Browser-Sitzung wurde ordnungsgemäß beendet.")
+
+
+def scrape_epics_from_file(file_path: str, skip_fresh: bool = False):
     """
     Liest eine Liste von Jira-Keys aus einer Datei ein und führt für jeden
     einzelnen Key einen Scraping-Lauf durch, um Business Value & Akzeptanzkriterien
     zu aktualisieren.
+
+    Standardmäßig wird jeder Key neu gescraped, damit in Jira überarbeitete
+    Business Values sicher übernommen werden. Mit `skip_fresh` werden Keys
+    übersprungen, deren lokale JSON-Datei jünger als `SCRAPER_CHECK_DAYS` ist.
     """
     logger.info(f"Starte Batch-Scraping für Business Epics aus der Datei: {file_path}")
 
     # 1. Lese die Liste der Jira-Keys aus der Datei
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # Filtere leere Zeilen und entferne Whitespace
-            issue_keys = [line.strip().lstrip('- ').strip() for line in f if line.strip()]
+        # Filtere leere Zeilen und entferne Whitespace (Datei in einem Stück lesen)
+        issue_keys = [k.lstrip('- ').strip() for line in Path(file_path).read_text(encoding='utf-8').splitlines()
+                      if (k := line.strip())]
         if not issue_keys:
             logger.error(f"Die Datei {file_path} ist leer oder enthält keine gültigen Keys.")
             return
@@ -54,52 +157,55 @@ def scrape_epics_from_file(file_path: str):
         logger.error(f"Fehler: Die Eingabedatei '{file_path}' wurde nicht gefunden.")
         return
 
-    # 2. Initialisiere den AI-Client und den Scraper einmal für die gesamte Sitzung
+    # Optional: kürzlich gescrapte Issues überspringen (spart Browser-Start und Seitenaufruf)
+    if skip_fresh:
+        fresh_keys = [key for key in issue_keys if _is_fresh(key)]
+        if fresh_keys:
+            logger.warning(f"{len(fresh_keys)} Keys sind jünger als {SCRAPER_CHECK_DAYS} Tag(e) und werden "
+                           f"übersprungen (ohne --skip-fresh erneut scrapen): {', '.join(fresh_keys)}")
+        fresh = set(fresh_keys)
+        issue_keys = [key for key in issue_keys if key not in fresh]
+        if not issue_keys:
+            logger.info("Alle Issues sind aktuell. Nichts zu tun.")
+            return
+
+    # 2. Initialisiere den AI-Client einmal für die gesamte Sitzung (wird von allen Workern geteilt)
     business_value_system_prompt = load_prompt_template("business_value_prompt.yaml", "system_prompt")
     ai_client = AzureAIClient(system_prompt=business_value_system_prompt)
-    base_jira_url = "https://jira.telekom.de/"
 
-    # Der Scraper wird ohne URL initialisiert, da diese in der Schleife dynamisch gesetzt wird
-    scraper = JiraScraper(
-        url=base_jira_url,
-        email=JIRA_EMAIL,
-        model=LLM_MODEL_BUSINESS_VALUE,
-        scrape_mode='true',
-        azure_client=ai_client
-    )
+    # 3. Keys in eine gemeinsame Queue legen, aus der die Pool-Worker konsumieren
+    key_queue = queue.Queue()
+    for issue_key in issue_keys:
+        key_queue.put(issue_key)
 
+    # 4. Browser nacheinander anmelden, danach arbeiten die Worker parallel
+    pool_size = min(SCRAPER_POOL_SIZE, len(issue_keys))
+    scrapers = _login_scrapers(pool_size, ai_client)
+    if not scrapers:
+        logger.error("Login fehlgeschlagen. Der Batch-Lauf wird abgebrochen.")
+        return
+    logger.info(f"Starte {len(scrapers)} parallele Scraper-Sessions.")
     try:
-        # 3. Logge dich einmal für den gesamten Batch-Lauf ein
-        if not scraper.login():
-            logger.error("Login fehlgeschlagen. Der Batch-Lauf wird abgebrochen.")
-            return
-
-        # 4. Iteriere über alle Keys und scrape die Daten
-        for issue_key in issue_keys:
-            logger.info(f"--- Starte Verarbeitung für: {issue_key} ---")
-            issue_url = f"https://jira.telekom.de/browse/{issue_key}"
-
-            issue_data = scraper.extract_and_save_issue_data(issue_url, issue_key)
-
-            if issue_data:
-                json_path = os.path.join('data', 'jira_issues', f"{issue_key}.json")
-                logger.info(f"Scraping für {issue_key} erfolgreich. Gespeichert unter: {os.path.abspath(json_path)}")
-            else:
-                logger.warning(f"Fehler beim Scraping von {issue_key}. Es wurde keine Datei erstellt.")
-            logger.info(f"--- Verarbeitung für {issue_key} abgeschlossen ---")
-
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            futures = [executor.submit(_scrape_worker, worker_id, scraper, key_queue)
+                       for worker_id, scraper in enumerate(scrapers, start=1)]
+            for future in futures:
+                future.result()
     except Exception as e:
         logger.error(f"Ein unerwarteter Fehler ist während des Batch-Laufs aufgetreten: {e}")
 
-    finally:
-        # 5. Stelle sicher, dass die Browser-Sitzung am Ende geschlossen wird
-        if hasattr(scraper, 'login_handler') and scraper.login_handler and scraper.login_handler.driver:
-            scraper.login_handler.close()
-            logger.info("Browser-Sitzung wurde ordnungsgemäß beendet.")
+    if not key_queue.empty():
+        logger.warning(f"{key_queue.qsize()} Keys wurden nicht verarbeitet (z.B. wegen fehlgeschlagener Logins).")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aktualisiert Business Value & Akzeptanzkriterien für eine Liste von Epics.")
+    parser.add_argument("--skip-fresh", action="store_true",
+                        help=f"Issues überspringen, deren lokale Datei jünger als {SCRAPER_CHECK_DAYS} Tag(e) ist.")
+    args = parser.parse_args()
+    ensure_dirs()
+
     # Der Dateiname ist nun fest im Skript verankert
     input_file = 'business_value_epic_list.txt'
 
     # Starte den Prozess
-    scrape_epics_from_file(input_file)
+    scrape_epics_from_file(input_file, skip_fresh=args.skip_fresh)
@@ -4,7 +4,7 @@ Orchestriert die Ausführung einer Reihe von modularen Analyzer-Klassen.
 Diese Klasse dient als zentraler "Dirigent" für den Analyseprozess. Ihre Hauptaufgabe
 ist es, die Hauptanwendung von der Kenntnis über die spezifischen, einzelnen
 Analyseschritte zu entkoppeln. Sie nimmt eine Liste von beliebigen Analyzer-Klassen
-entgegen, führt deren `analyze`-Methode nacheinander aus und sammelt die
+entgegen, führt deren `analyze`-Methode parallel aus und sammelt die
 Ergebnisse in einem einzigen, strukturierten Dictionary.
 
 Dieses Design fördert die Modularität und Erweiterbarkeit des Systems. Neue
@@ -14,7 +14,9 @@ Ablaufsteuerung in der Hauptanwendung geändert werden muss.
 
 Hauptfunktionalität:
 -   Nimmt eine Liste von Analyzer-Klassen entgegen (nicht Instanzen).
--   Iteriert durch jede Klasse, instanziiert sie und ruft ihre `analyze`-Methode auf.
+-   Instanziiert jede Klasse und ruft ihre `analyze`-Methode in einem Thread-Pool auf.
+    Die Analyzer sind voneinander unabhängig und lesen den Provider nur; ein
+    Prozess-Pool scheidet aus, da der Provider nicht picklebar ist (SQLite-Verbindung).
 -   Verwendet einen `ProjectDataProvider`, um allen Analyzern eine konsistente
     und effiziente Datenbasis zur Verfügung zu stellen.
 -   Sammelt die Ergebnisse und gibt sie in einem Dictionary zurück, wobei die
@@ -23,6 +25,8 @@ Hauptfunktionalität:
     Analyzers nicht den gesamten Prozess zum Absturz bringt.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from utils.project_data_provider import ProjectDataProvider
 from utils.logger_config import logger
 
@@ -32,7 +36,7 @@ class AnalysisRunner:
 
     Diese Klasse entkoppelt die Hauptanwendung von der Kenntnis über die
     spezifischen Analyseschritte. Sie nimmt eine Liste von Analyzer-Klassen,
-    führt sie nacheinander aus und sammelt die Ergebnisse in einem
+    führt sie parallel aus und sammelt die Ergebnisse in einem
     strukturierten Dictionary.
     """
 
@@ -62,18 +66,27 @@ class AnalysisRunner:
         all_results = {}
         logger.info(f"Starte Ausführung von {len(self.analyzer_classes)} Analysen für Epic '{data_provider.epic_id}'.")
 
-        for analyzer_class in self.analyzer_classes:
-            analyzer_name = analyzer_class.__name__
-            try:
-                logger.info(f"-> Führe {analyzer_name} aus...")
-                # 1. Instanziiere den Analyzer
-                analyzer_instance = analyzer_class()
-                # 2. Führe die Analyse durch und speichere das Ergebnis
-                analysis_result = analyzer_instance.analyze(data_provider)
-                all_results[analyzer_name] = analysis_result
-                logger.info(f"<- {analyzer_name} erfolgreich abgeschlossen.")
-            except Exception as e:
-                logger.error(f"Fehler bei der Ausführung von {analyzer_name}: {e}", exc_info=True)
-                all_results[analyzer_name] = {"error": str(e)}
-
-        return all_results
+        if not self.analyzer_classes:
+            return all_results
+
+        with ThreadPoolExecutor(max_workers=len(self.analyzer_classes)) as executor:
+            futures = {executor.submit(self._run_single, analyzer_class, data_provider): analyzer_class.__name__
+                       for analyzer_class in self.analyzer_classes}
+
+            for future in as_completed(futures):
+                analyzer_name = futures[future]
+                try:
+                    all_results[analyzer_name] = future.result()
+                    logger.info(f"<- {analyzer_name} erfolgreich abgeschlossen.")
+                except Exception as e:
+                    logger.error(f"Fehler bei der Ausführung von {analyzer_name}: {e}", exc_info=True)
+                    all_results[analyzer_name] = {"error": str(e)}
+
+        # Ergebnisse in der konfigurierten Reihenfolge zurückgeben
+        return {cls.__name__: all_results[cls.__name__] for cls in self.analyzer_classes}
+
+    @staticmethod
+    def _run_single(analyzer_class, data_provider: ProjectDataProvider):
+        """Instanziiert einen Analyzer und führt seine Analyse aus (läuft im Worker-Thread)."""
+        logger.info(f"-> Führe {analyzer_class.__name__} aus...")
+        return analyzer_class().analyze(data_provider)
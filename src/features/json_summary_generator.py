@@ -23,20 +23,73 @@ Kernfunktionen:
 -   Konstruiert Dateipfade für eingebettete Artefakte wie Plots.
 -   Speichert das finale, angereicherte JSON-Dokument, das als Kontext für
     die HTML-Generierung dient.
+-   Versieht jede Zusammenfassung mit einem Cache-Schlüssel (SHA-256), damit
+    veraltete Cache-Dateien im 'check'-Modus erkannt werden.
+-   Speichert die Zusammenfassung gzip-komprimiert (`_complete_summary.json.gz`),
+    was Speicherplatz und OneDrive-Synchronisation deutlich reduziert.
 """
 
+import gzip
+import hashlib
 import json
 import os
 from datetime import datetime
 
-from src.utils.config import JSON_SUMMARY_DIR, PLOT_DIR
+from collections import deque
+
+from src.utils.config import (
+    JSON_SUMMARY_DIR, PLOT_DIR, JIRA_ISSUES_DIR, JIRA_TREE_FULL,
+    LLM_MODEL_SUMMARY, LLM_MODEL_HTML_GENERATOR
+)
 from src.utils.logger_config import logger
+from src.utils.prompt_loader import load_prompt_template
 from src.utils.formatting_helpers import (
     format_timedelta_to_months_days,
     calculate_duration_string,
     format_iso_to_dd_mm_yyyy
 )
 
+# Muss erhöht werden, sobald sich die Struktur von *_complete_summary.json
+# ändert, aber auch bei Änderungen an den Analyzern (features/*_analyzer.py):
+# Der Cache-Schlüssel erfasst Roh-Daten, Modelle und Prompts, nicht aber den
+# Code, der sie auswertet. Eine Erhöhung macht alle bestehenden Cache-Dateien ungültig.
+SUMMARY_SCHEMA_VERSION = "2"
+
+# Modelle und Prompt-Vorlagen, aus denen Zusammenfassung und HTML entstehen.
+# Sie fließen in den Cache-Schlüssel ein, damit ein Modell- oder Prompt-Wechsel
+# den Cache ebenfalls ungültig macht.
+_CACHE_KEY_MODELS = (LLM_MODEL_SUMMARY, LLM_MODEL_HTML_GENERATOR)
+_CACHE_KEY_PROMPTS = (
+    ("summary_prompt.yaml", "user_prompt_template"),
+    ("html_generator_prompt.yaml", "user_prompt_template"),
+)
+
+# Niedrige Kompressionsstufe: schnelles Schreiben bei dennoch guter Kompression
+GZIP_COMPRESS_LEVEL = 3
+
+
+def read_summary_file(summary_path: str) -> dict:
+    """
+    Liest eine vollständige Zusammenfassung. Bevorzugt wird die komprimierte
+    Variante (`<summary_path>.gz`); ältere, unkomprimierte Dateien werden
+    weiterhin unterstützt.
+
+    Raises:
+        FileNotFoundError: Wenn weder die komprimierte noch die
+                           unkomprimierte Datei existiert.
+    """
+    gz_path = f"{summary_path}.gz"
+    if os.path.exists(gz_path):
+        with gzip.open(gz_path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    with open(summary_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def summary_file_exists(summary_path: str) -> bool:
+    """Prüft, ob eine Zusammenfassung (komprimiert oder unkomprimiert) existiert."""
+    return os.path.exists(f"{summary_path}.gz") or os.path.exists(summary_path)
+
 class JsonSummaryGenerator:
     """
     Erzeugt eine umfassende, formatierte JSON-Zusammenfassung aus allen
@@ -44,10 +97,93 @@ class JsonSummaryGenerator:
     durch ein LLM und die finale HTML-Generierung optimiert ist.
     """
 
+    @staticmethod
+    def get_summary_path(epic_id: str) -> str:
+        """
+        Gibt den logischen Pfad der vollständigen JSON-Zusammenfassung zurück.
+        Die Datei selbst liegt komprimiert unter `<Pfad>.gz`.
+        """
+        return os.path.join(JSON_SUMMARY_DIR, f"{epic_id}_complete_summary.json")
+
+    def compute_cache_key(self, epic_id: str) -> str:
+        """
+        Berechnet den Cache-Schlüssel für die Zusammenfassung eines Epics.
+
+        Der Schlüssel basiert auf der Schema-Version, den verwendeten Modellen,
+        den geladenen Prompt-Vorlagen und dem Inhalt der Roh-JSON-Dateien aller
+        Issues im Baum des Epics (Verknüpfungen gemäß `JIRA_TREE_FULL`), da die
+        Zusammenfassung aus dem gesamten Baum entsteht. Ändert sich eine Story,
+        ihr Status, eine Schätzung, ein Modell oder ein Prompt, ändert sich damit
+        auch der Schlüssel. Alles ist ohne Analyse-Lauf verfügbar, sodass der
+        Vergleich vor jeder teuren Neuberechnung erfolgen kann.
+        """
+        hasher = hashlib.sha256(SUMMARY_SCHEMA_VERSION.encode('utf-8'))
+        for model in _CACHE_KEY_MODELS:
+            hasher.update(f"\0{model}".encode('utf-8'))
+        for filename, key in _CACHE_KEY_PROMPTS:
+            hasher.update(f"\0{filename}:{key}\0".encode('utf-8'))
+            hasher.update(load_prompt_template(filename, key).encode('utf-8'))
+        visited = {epic_id}
+        queue = deque([epic_id])
+        while queue:
+            issue_key = queue.popleft()
+            hasher.update(f"\0{issue_key}\0".encode('utf-8'))
+            try:
+                with open(os.path.join(JIRA_ISSUES_DIR, f"{issue_key}.json"), 'rb') as f:
+                    raw = f.read()
+            except OSError:
+                hasher.update(b"missing")
+                continue
+            hasher.update(raw)
+
+            try:
+                issue = json.loads(raw)
+            except ValueError:
+                continue
+            relations = JIRA_TREE_FULL.get(issue.get('issue_type', ''), [])
+            for link in issue.get('issue_links') or []:
+                child_key = link.get('key')
+                if child_key and child_key not in visited and link.get('relation_type') in relations:
+                    visited.add(child_key)
+                    queue.append(child_key)
+        return hasher.hexdigest()
+
+    def load_cached_summary(self, epic_id: str) -> dict | None:
+        """
+        Lädt eine gecachte Zusammenfassung, sofern ihr gespeicherter
+        Cache-Schlüssel mit dem aktuellen übereinstimmt.
+
+        Returns:
+            dict | None: Die gecachten Daten oder None, wenn der Cache fehlt,
+                         veraltet oder nicht lesbar ist.
+        """
+        summary_path = self.get_summary_path(epic_id)
+        key_path = f"{summary_path}.key"
+        if not summary_file_exists(summary_path):
+            return None
+
+        try:
+            with open(key_path, 'r', encoding='utf-8') as f:
+                stored_key = f.read().strip()
+        except OSError:
+            logger.info(f"Kein Cache-Schlüssel für {epic_id} vorhanden. Zusammenfassung wird neu erstellt.")
+            return None
+
+        if stored_key != self.compute_cache_key(epic_id):
+            logger.info(f"Cache-Schlüssel für {epic_id} veraltet. Zusammenfassung wird neu erstellt.")
+            return None
+
+        try:
+            return read_summary_file(summary_path)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.info(f"Konnte Cache-Datei nicht lesen ({e}). Erstelle Zusammenfassung neu.")
+            return None
+
     def generate_and_save_complete_summary(self, analysis_results: dict, content_summary: dict, epic_id: str) -> dict:
         """
         Fusioniert die metrischen Analyseergebnisse mit der inhaltlichen
-        Zusammenfassung und speichert sie als eine einzige JSON-Datei.
+        Zusammenfassung und speichert sie als eine einzige, gzip-komprimierte
+        JSON-Datei.
 
         Args:
             analysis_results (dict): Die Ergebnisse aus dem AnalysisRunner.
@@ -69,12 +205,17 @@ class JsonSummaryGenerator:
         complete_data.update(metric_summary) # Fügt die Schlüssel aus metric_summary hinzu
 
         # 3. Pfad für die Ausgabedatei definieren
-        output_path = os.path.join(JSON_SUMMARY_DIR, f"{epic_id}_complete_summary.json")
+        output_path = self.get_summary_path(epic_id)
 
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(complete_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Vollständige JSON-Zusammenfassung erfolgreich gespeichert: {output_path}")
+            with gzip.open(f"{output_path}.gz", 'wt', encoding='utf-8', compresslevel=GZIP_COMPRESS_LEVEL) as f:
+                json.dump(complete_data, f, ensure_ascii=False)
+            with open(f"{output_path}.key", 'w', encoding='utf-8') as f:
+                f.write(self.compute_cache_key(epic_id))
+            # Veraltete, unkomprimierte Version entfernen, damit sie nicht statt der neuen gelesen wird
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            logger.info(f"Vollständige JSON-Zusammenfassung erfolgreich gespeichert: {output_path}.gz")
         except Exception as e:
             logger.error(f"Fehler beim Speichern der vollständigen JSON-Zusammenfassung für {epic_id}: {e}")
 
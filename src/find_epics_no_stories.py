@@ -15,6 +15,7 @@ oder zur Bereinigung von Projekt-Backlogs dienen.
 """
 
 import os
+import gzip
 import json
 import logging
 
@@ -49,11 +50,13 @@ def find_epics_with_zero_stories(input_dir: str, output_file: str):
 
     # 1. Iteriere über alle Dateien im Verzeichnis
     for filename in os.listdir(input_dir):
-        if filename.endswith("_complete_summary.json"):
+        # Zusammenfassungen liegen gzip-komprimiert (.json.gz) oder als ältere .json-Dateien vor
+        if filename.endswith("_complete_summary.json") or filename.endswith("_complete_summary.json.gz"):
             file_path = os.path.join(input_dir, filename)
 
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
+                opener = gzip.open if filename.endswith(".gz") else open
+                with opener(file_path, 'rt', encoding='utf-8') as f:
                     data = json.load(f)
 
                 # 2. Extrahiere den Wert von "total_stories"
@@ -64,7 +67,7 @@ def find_epics_with_zero_stories(input_dir: str, output_file: str):
                 # 3. Wenn "total_stories" == 0, füge den Epic-Key zur Liste hinzu
                 if total_stories == 0:
                     # Extrahiere den Epic-Key aus dem Dateinamen
-                    epic_key = filename.replace("_complete_summary.json", "")
+                    epic_key = filename.split("_complete_summary.json")[0]
                     epics_with_zero_stories.append(epic_key)
                     logging.info(f"-> Gefunden: {epic_key} hat 0 Stories.")
 
@@ -98,7 +98,8 @@ def find_issues():
                 summary_filename = f"{key}_complete_summary.json"
                 summary_filepath = os.path.join(JSON_SUMMARY_DIR, summary_filename)
 
-                if not os.path.exists(summary_filepath):
+                # Zusammenfassungen werden gzip-komprimiert (.json.gz) gespeichert
+                if not (os.path.exists(summary_filepath + ".gz") or os.path.exists(summary_filepath)):
                     logging.info(f"-> Fehlende Zusammenfassung für {key} (Status: {status})")
                     keys_needing_summary.append(key)
 
@@ -33,18 +33,17 @@ import contextlib # NEU: Für Keep-Awake Context Manager
 import ctypes     # NEU: Für Windows API (Keep-Awake)
 from datetime import datetime
 from requests.exceptions import RequestException
-from dotenv import load_dotenv, find_dotenv
 
 # --- 1. Konfiguration & Initialisierung ---
-load_dotenv(find_dotenv())
 project_root = os.path.abspath(os.path.dirname(__file__))
 src_path = os.path.join(project_root, 'src')
 if src_path not in sys.path:
     sys.path.insert(0, src_path)
 
-from utils.config import LOGS_DIR, JIRA_ISSUES_DIR
+from utils.config import LOGS_DIR, JIRA_ISSUES_DIR, load_env
 from utils.jira_data_transformer import JiraDataTransformer
 
+load_env()
 JIRA_SERVER = os.getenv("JIRA_SERVER_URL", 'https://jira.telekom.de')
 JIRA_API_TOKEN = os.getenv("JIRA_ACCESS_TOKEN")
 
@@ -38,10 +38,14 @@ Die Konfiguration der einzelnen Schritte erfolgt über Kommandozeilenargumente.
 
 import os
 import re
+import mmap
 import sys
-import json
 import argparse
 import yaml
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
 import time
 import threading
 import subprocess
@@ -66,6 +70,8 @@ from utils.json_parser import LLMJsonParser
 from utils.html_translator import HtmlTranslator
 from utils.project_data_provider import ProjectDataProvider
 from utils.keep_awake import prevent_screensaver
+from utils.prompt_loader import split_prompt_template
+from pre_cache_files import pre_cache_directory
 
 # Importiere die spezifischen Analyzer-Klassen
 from features.scope_analyzer import ScopeAnalyzer
@@ -79,11 +85,11 @@ from features.json_summary_generator import JsonSummaryGenerator
 
 from utils.config import (
     # Pfade
-    JSON_SUMMARY_DIR,
     HTML_REPORTS_DIR,
     PROMPTS_DIR,
     TOKEN_LOG_FILE,
     ISSUE_LOG_FILE,
+    JIRA_ISSUES_DIR,
 
     # Modelle
     LLM_MODEL_HTML_GENERATOR,
@@ -94,6 +100,8 @@ from utils.config import (
     # Tree Configs
     JIRA_TREE_MANAGEMENT,
     JIRA_TREE_FULL,
+    ensure_dirs,
+)
 
 MAX_TOKEN_BUDGET_FOR_SUMMARY = 40000
 
@@ -121,13 +129,14 @@ def perform_final_retry(token_tracker):
     with open(ISSUE_LOG_FILE, 'r') as f:
         failed_keys = [line.strip() for line in f if line.strip()]
 
-    # Extrahiere nur gültige Jira-Keys, um fehlerhafte Zeilen zu ignorieren
+    # Extrahiere nur gültige Jira-Keys, um fehlerhafte Zeilen zu ignorieren.
+    # Ein Set verhindert, dass doppelte Log-Einträge mehrfach geladen werden.
     key_pattern = re.compile(r'([A-Z][A-Z0-9]*-\d+)')
-    valid_failed_keys = []
+    valid_failed_keys = set()
     for line in failed_keys:
         match = key_pattern.search(line)
         if match:
-            valid_failed_keys.append(match.group(1))
+            valid_failed_keys.add(match.group(1))
 
     if not valid_failed_keys:
         logger.info("Log-Datei enthält keine gültigen Jira-Keys. Kein Retry notwendig.")
@@ -140,7 +149,15 @@ def perform_final_retry(token_tracker):
     # --- ENDE NEU ---
 
     successful_retries, persistent_failures = [], []
-    for key in valid_failed_keys:
+    # Keys, die in diesem Retry-Lauf bereits geladen wurden (z.B. als Kind eines
+    # zuvor verarbeiteten Keys) und daher nicht erneut angefragt werden müssen.
+    already_fetched = set()
+    for key in sorted(valid_failed_keys):
+        if key in already_fetched:
+            logger.info(f"Issue {key} wurde in diesem Retry-Lauf bereits geladen. Überspringe.")
+            successful_retries.append(key)
+            continue
+
         logger.info(f"Dritter Versuch (API-Modus, rekursiv) für Issue: {key}")
 
         # --- NEU: API-Aufruf statt Scraper ---
@@ -149,6 +166,8 @@ def perform_final_retry(token_tracker):
         try:
             # Führe den rekursiven Ladevorgang für diesen einen Key aus
             tree_loader.run(start_key=key)
+            # processed_keys enthält nur erfolgreich verarbeitete Keys
+            already_fetched.update(tree_loader.processed_keys)
 
             # Prüfen, ob der *spezifische Key* selbst fehlgeschlagen ist
             if key in tree_loader.issues_to_retry:
@@ -174,7 +193,7 @@ def load_prompt(filename, key):
     file_path = os.path.join(PROMPTS_DIR, filename)
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            prompts = yaml.safe_load(file)
+            prompts = yaml.load(file, Loader=CSafeLoader)
             return prompts[key]
     except (FileNotFoundError, KeyError) as e:
         logger.error(f"Fehler beim Laden des Prompts: {e}")
@@ -196,13 +215,19 @@ def get_business_epics_from_file(file_path=None):
         return []
 
     business_epics = []
-    epic_id_pattern = re.compile(r'[A-Z][A-Z0-9]*-\d+')
+    # Erster Key jeder Zeile; die gesamte Datei wird in einem Durchlauf
+    # von der C-Regex-Engine über die gemappten Bytes gescannt.
+    epic_id_pattern = re.compile(rb'^[^\n]*?([A-Z][A-Z0-9]*-\d+)', re.MULTILINE)
 
-    with open(file_to_try, 'r', encoding='utf-8') as file:
-        for line in file:
-            match = epic_id_pattern.search(line)
-            if match:
-                business_epics.append(match.group(0))
+    if os.path.getsize(file_to_try) > 0:
+        with open(file_to_try, 'rb') as file:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                matches = epic_id_pattern.findall(mm)
+            finally:
+                mm.close()
+        # Duplikate entfernen, Reihenfolge beibehalten
+        business_epics = list(dict.fromkeys(match.decode('ascii') for match in matches))
 
     print(f"{len(business_epics)} Business Epics gefunden.")
     return business_epics
@@ -227,12 +252,19 @@ def main():
              "'none' (überspringt den gesamten Ladevorgang)."
     )
     args = parser.parse_args()
+    ensure_dirs()
 
     stop_event = threading.Event()
     keep_awake_thread = threading.Thread(target=prevent_screensaver, args=(stop_event,))
     keep_awake_thread.daemon = True
     keep_awake_thread.start()
+
+    # OneDrive-Dateien im Hintergrund herunterladen, während der Loader läuft
+    prefetch_thread = threading.Thread(target=pre_cache_directory, args=(JIRA_ISSUES_DIR,), kwargs={'verbose': False})
+    prefetch_thread.daemon = True
+    prefetch_thread.start()
     tree_generator_full = None
+    token_tracker = None
 
     try:
         token_tracker = TokenUsage(log_file_path=TOKEN_LOG_FILE)
@@ -292,19 +324,28 @@ def main():
             print("\n--- Analyse / Reporting gestartet ---")
 
             # Initialisierung der benötigten Clients und Generatoren
-            dna_bot_summary_client = DnaBotClient()
+            # Ein einziger DnaBotClient für alle LLM-Aufgaben (Summary, HTML, Übersetzung).
+            # System-Prompts werden pro Aufruf übergeben, der Client hält keinen Aufgaben-Zustand.
+            logger.info("Initialisiere gemeinsamen DnaBotClient...")
+            dna_bot_client = DnaBotClient()
             visualizer = JiraTreeVisualizer(format='png')
             context_generator = JiraContextGenerator()
 
-            # --- GEÄNDERT: DnaBotClient wird erstellt und injiziert ---
-            logger.info("Initialisiere DnaBotClient für HTML-Generator...")
-            dna_bot_html_client = DnaBotClient()  # Den Client für die HTML-Generierung erstellen
             html_generator = EpicHtmlGenerator(
-                ai_client=dna_bot_html_client,   # Den Client hier "injizieren"
+                ai_client=dna_bot_client,
                 model=LLM_MODEL_HTML_GENERATOR,
                 token_tracker=token_tracker
             )
-            # --- ENDE ÄNDERUNG ---
+            html_translator = HtmlTranslator(
+                ai_client=dna_bot_client,
+                token_tracker=token_tracker,
+                model_name=LLM_MODEL_TRANSLATOR
+            )
+
+            # Summary-Prompt einmalig laden und am Platzhalter vorzerlegen
+            summary_prompt_prefix, summary_prompt_suffix = split_prompt_template(
+                load_prompt("summary_prompt.yaml", "user_prompt_template"), "json_context"
+            )
 
             json_parser = LLMJsonParser()
             analysis_runner = AnalysisRunner(ANALYZERS_TO_RUN)
@@ -315,23 +356,23 @@ def main():
             for epic in business_epics:
                 print(f"\n--- Starte Verarbeitung für {epic} ---")
                 complete_epic_data = None
-                complete_summary_path = os.path.join(JSON_SUMMARY_DIR, f"{epic}_complete_summary.json")
 
                 # Schritt 1: Prüfen, ob eine gecachte Datei verwendet werden soll ('check'-Modus)
-                if args.html_summary == 'check' and os.path.exists(complete_summary_path):
-                    logger.info(f"Lade vollständige Zusammenfassung aus Cache: {complete_summary_path}")
-                    try:
-                        with open(complete_summary_path, 'r', encoding='utf-8') as f:
-                            complete_epic_data = json.load(f)
-                    except (json.JSONDecodeError, IOError) as e:
-                        logger.info(f"Konnte Cache-Datei nicht lesen ({e}). Erstelle Zusammenfassung neu.")
+                # Der Cache wird nur genutzt, wenn sein Schlüssel zum aktuellen Datenstand passt.
+                if args.html_summary == 'check':
+                    complete_epic_data = json_summary_generator.load_cached_summary(epic)
+                    if complete_epic_data is not None:
+                        logger.info(f"Lade vollständige Zusammenfassung aus Cache für {epic}.")
 
                 # Schritt 2: Wenn keine Cache-Datei vorhanden oder '--html_summary true', alles neu generieren
                 if complete_epic_data is None:
                     logger.info("Keine gültige Cache-Datei gefunden oder Neuerstellung erzwungen. Generiere alle Daten...")
 
                     # 2a: Metrische Analysen durchführen
-                    data_provider = ProjectDataProvider(epic_id=epic, hierarchy_config=JIRA_TREE_FULL)
+                    # Gemeinsamer Issue-Cache: Die Rohdaten werden nur einmal gelesen und
+                    # von beiden Baum-Ansichten (FULL und MANAGEMENT) wiederverwendet.
+                    issue_cache = {}
+                    data_provider = ProjectDataProvider(epic_id=epic, hierarchy_config=JIRA_TREE_FULL, preloaded_issues=issue_cache)
                     if not data_provider.is_valid():
                         logger.error(f"Fehler: Konnte keine gültigen Daten für Analyse von Epic '{epic}' laden. Verarbeitung wird übersprungen.")
                         continue
@@ -343,7 +384,7 @@ def main():
 
                     # 1. Erstelle IMMER den vollen Management-Baum als Datenbasis
                     logger.info(f"Erstelle vollständigen Baum (Datenbasis) für {epic} mit JIRA_TREE_MANAGEMENT.")
-                    data_provider = ProjectDataProvider(epic_id=epic, hierarchy_config=JIRA_TREE_MANAGEMENT)
+                    data_provider = ProjectDataProvider(epic_id=epic, hierarchy_config=JIRA_TREE_MANAGEMENT, preloaded_issues=issue_cache)
                     issue_graph_data = data_provider.issue_tree
                     if issue_graph_data is None:
                          logger.warning(f"Konnte keine Graph-Daten für {epic} erstellen (Root-Key fehlt?). Überspringe Visualisierung und Summary.")
@@ -364,12 +405,11 @@ def main():
                     if json_context == "{}":
                         logger.error(f"Konnte LLM-Kontext für {epic} nicht erstellen (selbst Root zu groß). Überspringe Summary-Generierung.")
                         continue
-                    summary_prompt_template = load_prompt("summary_prompt.yaml", "user_prompt_template")
-                    summary_prompt = summary_prompt_template.format(json_context=json_context)
+                    summary_prompt = summary_prompt_prefix + json_context + summary_prompt_suffix
                     print(f"     - Erstelle Summary für {epic} - Promptlänge ca {len(summary_prompt)/4:,.0f} Token")
 
                     # 1. Generator abrufen
-                    response_generator = dna_bot_summary_client.completion(
+                    response_generator = dna_bot_client.completion(
                         model_name=LLM_MODEL_SUMMARY,
                         user_prompt=summary_prompt,
                         max_tokens=60000,
@@ -379,12 +419,11 @@ def main():
 
                     # 2. Stream konsumieren und Text zusammensetzen
                     # (Hierbei werden im Client automatisch <think>-Tags gefiltert und Usage-Daten gesammelt)
-                    full_response_text = ""
-                    for chunk in response_generator:
-                        full_response_text += chunk
+                    # str.join sammelt alle Chunks in C und kopiert den Text nur einmal.
+                    full_response_text = "".join(response_generator)
 
                     # 3. Usage-Daten aus dem Client-Status abrufen (erst NACH dem Stream verfügbar)
-                    usage = dna_bot_summary_client.last_stream_usage
+                    usage = dna_bot_client.last_stream_usage
 
                     # 4. Token-Usage protokollieren
                     if token_tracker and usage:
@@ -420,15 +459,6 @@ def main():
                     logger.error(f"Konnte keine vollständigen Daten für die HTML-Erstellung von {epic} erzeugen.")
 
                 if args.translate != 'false':
-                    # Eigener AI Client für den Übersetzer, da der System-Prompt spezialisiert ist.
-                    # Der HtmlTranslator setzt den korrekten System-Prompt selbst.
-                    dna_bot_translator_client = DnaBotClient()
-                    html_translator = HtmlTranslator(
-                        ai_client=dna_bot_translator_client,
-                        token_tracker=token_tracker,
-                        model_name=LLM_MODEL_TRANSLATOR
-                    )
-
                     german_html_path = os.path.join(HTML_REPORTS_DIR, f"{epic}_summary.html")
                     english_html_path = os.path.join(HTML_REPORTS_DIR, f"{epic}_summary_englisch.html")
 
@@ -455,10 +485,15 @@ def main():
                             except Exception as e:
                                 logger.error(f"Fehler bei der Übersetzung von {epic}: {e}")
 
+                # Token-Verbrauch dieses Epics gesammelt in die Log-Datei schreiben
+                token_tracker.flush()
+
         else:
             print("\n--- Analyse und HTML-Summary übersprungen ---")
 
     finally:
+        if token_tracker is not None:
+            token_tracker.flush()
         logger.info("Hauptprogramm wird beendet. Stoppe den Keep-Awake-Thread...")
         stop_event.set()
         keep_awake_thread.join(timeout=2)
@@ -38,25 +38,55 @@ Führen Sie das Skript einfach über die Konsole aus, *bevor* Sie die
 eigentliche Analyse starten:
 
 $ python pre_cache_files.py
+
+Alternativ startet `main_epic_loader.py` die Funktion `pre_cache_directory`
+automatisch in einem Hintergrund-Thread, sodass das Herunterladen parallel
+zu den Jira-API-Aufrufen läuft.
 """
 
 import os
 from pathlib import Path
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- HIER ANPASSEN ---
 # Der Pfad zu Ihrem OneDrive-Verzeichnis, wie Sie ihn in config.py eingetragen haben.
 ONEDRIVE_JIRA_DIR = Path("/Users/A763630/Library/CloudStorage/OneDrive-DeutscheTelekomAG/_Dokumente/GitHub/business-epic-analyzer/data/jira_issues")
 # --- ENDE ANPASSEN ---
 
-def pre_cache_directory(directory: Path):
+# Anzahl paralleler Lesezugriffe; das Herunterladen ist I/O-gebunden
+PRE_CACHE_WORKERS = 8
+
+def _touch_file(file_path: str):
+    """Liest 1 Byte einer Datei, um den Download von OneDrive auszulösen."""
+    # Low-Level-Zugriff ohne Python-Dateiobjekt: öffnen und 1 Byte lesen.
+    # Das ist der minimal nötige Zugriff, um den Download auszulösen.
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        os.read(fd, 1)
+    finally:
+        os.close(fd)
+
+def pre_cache_directory(directory: Path, verbose: bool = True):
     """
     Durchläuft ein Verzeichnis und liest 1 Byte von jeder .json-Datei,
-    um den Download von OneDrive zu erzwingen.
+    um den Download von OneDrive zu erzwingen. Die Dateien werden parallel
+    mit PRE_CACHE_WORKERS Threads angefasst.
+
+    Args:
+        directory (Path): Das zu verarbeitende Verzeichnis.
+        verbose (bool): Wenn False, erfolgen keine Konsolenausgaben
+                        (z.B. beim Lauf in einem Hintergrund-Thread).
     """
-    print(f"Starte Pre-Caching für Verzeichnis:\n{directory}\n")
+    # Konsolenausgaben nur im verbose-Modus
+    def report(message):
+        if verbose:
+            print(message)
+
+    directory = Path(directory)
+    report(f"Starte Pre-Caching für Verzeichnis:\n{directory}\n")
     if not directory.is_dir():
-        print(f"Fehler: Verzeichnis nicht gefunden: {directory}")
+        report(f"Fehler: Verzeichnis nicht gefunden: {directory}")
         return
 
     start_time = time.time()
@@ -65,49 +95,52 @@ def pre_cache_directory(directory: Path):
 
     # Zuerst alle Dateien auflisten, um eine Gesamtzahl zu haben
     try:
-        print("Suche nach .json-Dateien...")
-        json_files = list(directory.glob("*.json"))
+        report("Suche nach .json-Dateien...")
+        # os.scandir liefert Name und Typ direkt aus dem Verzeichniseintrag,
+        # ohne jede Datei einzeln per stat() abzufragen (teuer auf OneDrive).
+        with os.scandir(directory) as it:
+            json_files = [
+                entry.path for entry in it
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)
+            ]
         total_files = len(json_files)
         if total_files == 0:
-            print("Keine .json-Dateien im Verzeichnis gefunden.")
+            report("Keine .json-Dateien im Verzeichnis gefunden.")
             return
-        print(f"{total_files} .json-Dateien gefunden. Starte Download/Caching...")
+        report(f"{total_files} .json-Dateien gefunden. Starte Download/Caching...")
     except Exception as e:
-        print(f"Fehler beim Auflisten der Dateien: {e}")
+        report(f"Fehler beim Auflisten der Dateien: {e}")
         return
 
-    # Jetzt jede Datei durchgehen und "anfassen"
-    for i, file_path in enumerate(json_files):
-        try:
-            # 'rb' (read bytes) öffnen und 1 Byte lesen.
-            # Das ist der minimal nötige Zugriff, um den Download auszulösen.
-            with file_path.open('rb') as f:
-                f.read(1)
-
-            file_count += 1
+    # Jetzt jede Datei parallel "anfassen"
+    with ThreadPoolExecutor(max_workers=PRE_CACHE_WORKERS) as executor:
+        future_to_path = {executor.submit(_touch_file, file_path): file_path for file_path in json_files}
+        for i, future in enumerate(as_completed(future_to_path)):
+            try:
+                future.result()
+                file_count += 1
+            except Exception as e:
+                report(f"Fehler beim Lesen von {os.path.basename(future_to_path[future])}: {e}")
+                errors += 1
 
             # Fortschrittsanzeige, damit Sie sehen, dass etwas passiert
             if (i + 1) % 100 == 0 or (i + 1) == total_files:
                 progress = (i + 1) / total_files * 100
-                print(f"  ... {i + 1} / {total_files} verarbeitet ({progress:.1f}%)")
-
-        except Exception as e:
-            print(f"Fehler beim Lesen von {file_path.name}: {e}")
-            errors += 1
+                report(f"  ... {i + 1} / {total_files} verarbeitet ({progress:.1f}%)")
 
     end_time = time.time()
     duration = end_time - start_time
 
-    print("\n--- Pre-Caching abgeschlossen ---")
-    print(f"Erfolgreich gelesen: {file_count} Dateien")
-    print(f"Fehler:              {errors} Dateien")
-    print(f"Dauer:               {duration:.2f} Sekunden")
-    print("---------------------------------")
+    report("\n--- Pre-Caching abgeschlossen ---")
+    report(f"Erfolgreich gelesen: {file_count} Dateien")
+    report(f"Fehler:              {errors} Dateien")
+    report(f"Dauer:               {duration:.2f} Sekunden")
+    report("---------------------------------")
 
     if errors == 0:
-        print("Alle Dateien sind jetzt lokal zwischengespeichert.")
+        report("Alle Dateien sind jetzt lokal zwischengespeichert.")
     else:
-        print("Warnung: Einige Dateien konnten nicht gelesen werden.")
+        report("Warnung: Einige Dateien konnten nicht gelesen werden.")
 
 if __name__ == "__main__":
     pre_cache_directory(ONEDRIVE_JIRA_DIR)
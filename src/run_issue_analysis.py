@@ -4,14 +4,19 @@ Führt eine Stapelverarbeitung von Jira-Analysen für eine Liste von Epic Keys d
 Dieses Skript liest eine Liste von Jira-Keys aus der Datei 'Jira_Issues_for_analysis.txt'
 (die sich eine Ebene über diesem Skript befinden muss).
 
-Anschließend iteriert es über jeden Key und ruft nacheinander die folgenden
-zwei Analyseskripte auf:
+Anschließend ruft es für jeden Key die folgenden zwei Analyseskripte auf:
 1. analyze_issue_dynamics.py (für die Epic/Initiative-Dynamik)
 2. analyze_story_backlog.py (für die Story-Backlog-Analyse)
 
-Alle Konsolenausgaben (stdout) der aufgerufenen Funktionen werden
+Die Keys werden parallel in einem Prozess-Pool (ein Worker pro CPU-Kern)
+verarbeitet; die Ausgaben jedes Keys werden im Worker gepuffert und im
+Hauptprozess in der Reihenfolge der Fertigstellung in die Log-Datei geschrieben.
+Abgeschlossene Keys werden in einer Checkpoint-Datei festgehalten; mit `--resume`
+setzt ein abgebrochener Lauf dort fort (Blockgröße über `--chunk-size`).
+
+Die Berichte der aufgerufenen Funktionen werden direkt
 in eine EINZIGE, zeitgestempelte Log-Datei im Verzeichnis
-'data/backlog_analyse' umgeleitet.
+'data/backlog_analyse' geschrieben.
 
 ZUSÄTZLICH werden die von den Funktionen zurückgegebenen Metriken gesammelt
 und eine ZUSAMMENFASSENDE TABELLE im CSV-Format (Semikolon-getrennt)
@@ -23,21 +28,195 @@ im selben Verzeichnis gespeichert.
 import os
 import sys
 import argparse
+from pathlib import Path
 # import subprocess # NICHT MEHR NÖTIG
 from datetime import datetime
 # import re # NICHT MEHR NÖTIG
 import csv
+import json
 import traceback
-import contextlib # NEU: Für stdout-Umleitung
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # NEU: Direkter Import der Analysefunktionen
 from analyze_issue_dynamics import analyze_epic_dynamics
 from analyze_story_backlog import analyze_story_backlog
+from utils.project_data_provider import ProjectDataProvider
+from utils.config import JIRA_TREE_FULL
+
+# Puffergröße für die Ausgabedateien (Log und CSV, 1 MB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Checkpoint-Datei (im Ausgabeverzeichnis) mit den bereits abgeschlossenen Keys
+PROGRESS_FILENAME = ".progress.jsonl"
+# Anzahl Keys, die gleichzeitig an den Prozess-Pool übergeben werden
+DEFAULT_CHUNK_SIZE = 50
+
+# Standard-Metriken für Fehlerfälle
+DEFAULT_DYNAMICS_METRICS = {
+    "Gesamtzahl Epics": 0, "% Backlog": 0, "% In Progress": 0,
+    "% Closed": 0, "Erstellte Epics": 0, "Abgeschl. Epics": 0,
+    "Epics Statusänderung": 0,
+}
+
+DEFAULT_BACKLOG_METRICS = {
+    "Gesamtzahl Stories": 0,
+    "Offene Stories": 0,
+    "Erstellte Stories": 0,
+    "Abgeschl. Stories": 0,
+    "Backlog-Änderung Stories": 0,
+}
+
+# ############################################################################
+# WORKER (läuft im Prozess-Pool)
+# ############################################################################
+
+def _run_one(key, start_date_obj, stop_date_obj):
+    """
+    Führt beide Analysen für einen Key aus und puffert alle Ausgaben.
+    Die Analysen schreiben ihren Bericht direkt in den Puffer (`out`); nur
+    stderr wird in den Puffer umgeleitet.
+
+    Returns:
+        tuple: (key, key_results, log_text) - die gesammelten Metriken und der
+               komplette Log-Text dieses Keys.
+    """
+    log = io.StringIO()
+    key_results = {"Issue Key": key}
+
+    # stderr (z.B. Warnungen von pandas oder Fehlermeldungen der Analysen) landet
+    # ebenfalls im Puffer, damit das Log pro Key vollständig und zusammenhängend ist.
+    # Jeder Worker-Prozess bearbeitet nur einen Key gleichzeitig, die Umleitung ist also lokal.
+    with contextlib.redirect_stderr(log):
+        # Daten einmal pro Key laden und an beide Analysen übergeben
+        data_provider = None
+        try:
+            data_provider = ProjectDataProvider(epic_id=key, hierarchy_config=JIRA_TREE_FULL)
+        except Exception as e:
+            log.write(f"Konnte Daten für {key} nicht vorab laden: {e}\n")
+
+        # --- Aufruf 1: analyze_issue_dynamics.py ---
+        try:
+            log.write("--- Start analyze_issue_dynamics ---\n")
+            dynamics_data = analyze_epic_dynamics(
+                root_key=key,
+                start_date=start_date_obj,
+                stop_date=stop_date_obj,
+                issue_type='Epic', # Wie im alten Skript implizit
+                data_provider=data_provider,
+                out=log
+            )
+            log.write("\n--- Ende analyze_issue_dynamics ---\n")
+            key_results.update(dynamics_data or DEFAULT_DYNAMICS_METRICS)
+
+        except Exception as e:
+            log.write(f"\n--- KRITISCHER FEHLER (analyze_issue_dynamics.py) ---\n")
+            log.write(f"Konnte Funktion nicht ausführen: {e}\n")
+            traceback.print_exc(file=log)
+            log.write("--- Fahre mit nächstem Skript fort ---\n\n")
+            key_results.update(DEFAULT_DYNAMICS_METRICS) # Standardwerte bei Fehler
+
+        # --- Aufruf 2: analyze_story_backlog.py ---
+        try:
+            log.write("\n--- Start analyze_story_backlog ---\n")
+            backlog_data = analyze_story_backlog(
+                epic_key=key,
+                start_date=start_date_obj,
+                stop_date=stop_date_obj,
+                data_provider=data_provider,
+                out=log
+            )
+            log.write("\n--- Ende analyze_story_backlog ---\n")
+            key_results.update(backlog_data or DEFAULT_BACKLOG_METRICS)
+
+        except Exception as e:
+            log.write(f"\n--- KRITISCHER FEHLER (analyze_story_backlog.py) ---\n")
+            log.write(f"Konnte Funktion nicht ausführen: {e}\n")
+            traceback.print_exc(file=log)
+            key_results.update(DEFAULT_BACKLOG_METRICS) # Standardwerte bei Fehler
+
+    return key, key_results, log.getvalue()
+
+# ############################################################################
+# CHECKPOINTING
+# ############################################################################
+
+def _load_progress(progress_path, period):
+    """
+    Liest die Checkpoint-Datei und gibt {key: key_results} aller Keys zurück,
+    die für denselben Analyse-Zeitraum bereits abgeschlossen wurden.
+    """
+    done = {}
+    try:
+        with open(progress_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue # z.B. unvollständige letzte Zeile nach einem Absturz
+                if entry.get("period") == period:
+                    done[entry["key"]] = entry["results"]
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _append_progress(progress_file, period, key, key_results):
+    """Hängt einen abgeschlossenen Key an die Checkpoint-Datei an und schreibt ihn sofort auf die Platte."""
+    progress_file.write(json.dumps({"period": period, "key": key, "results": key_results}, ensure_ascii=False) + "\n")
+    progress_file.flush()
+    os.fsync(progress_file.fileno())
 
 # ############################################################################
 # CSV-SCHREIBER
 # ############################################################################
 
+# Spaltenüberschriften der CSV-Zusammenfassung
+_SUMMARY_HEADERS = (
+    "Issue Key",
+    "Gesamtzahl Epics",
+    "%-Anteil Epics (Backlog-Typ)",
+    "%-Anteil Epics (IN PROGRESS)",
+    "%-Anteil Epics (Closed-Typ)",
+    "Anzahl erstellte Epics",
+    "Anzahl abgeschl. Epics",
+    "Anzahl Epics mit Statusänderung",
+    "Gesamtzahl Stories",
+    "Anzahl offener Stories",
+    "Anzahl erstellte Stories",
+    "Anzahl abgeschl. Stories",
+    "Anzahl Backlogänderung (erstelle Stories minus abgeschlossene Stories)",
+)
+
+# Mapping von den CSV-Headern zu unseren internen Daten-Keys
+_KEY_MAP = {
+    "Issue Key": "Issue Key",
+    "Gesamtzahl Epics": "Gesamtzahl Epics",
+    "%-Anteil Epics (Backlog-Typ)": "% Backlog",
+    "%-Anteil Epics (IN PROGRESS)": "% In Progress",
+    "%-Anteil Epics (Closed-Typ)": "% Closed",
+    "Anzahl erstellte Epics": "Erstellte Epics",
+    "Anzahl abgeschl. Epics": "Abgeschl. Epics",
+    "Anzahl Epics mit Statusänderung": "Epics Statusänderung",
+    "Gesamtzahl Stories": "Gesamtzahl Stories",
+    "Anzahl offener Stories": "Offene Stories",
+    "Anzahl erstellte Stories": "Erstellte Stories",
+    "Anzahl abgeschl. Stories": "Abgeschl. Stories",
+    "Anzahl Backlogänderung (erstelle Stories minus abgeschlossene Stories)": "Backlog-Änderung Stories",
+}
+
+_ORDERED_KEYS = tuple(_KEY_MAP[h] for h in _SUMMARY_HEADERS)
+
+# Nur die Prozent-Spalten enthalten Floats; sie werden ohne Nachkommastellen
+# ausgegeben (damit entfällt auch das Ersetzen des Dezimalpunkts)
+_FLOAT_COLUMNS = frozenset({"% Backlog", "% In Progress", "% Closed"})
+
+
+def _format_float(value):
+    return f"{value:.0f}" if isinstance(value, float) else value
+
+
 def write_summary_csv(results, csv_filepath):
     """
     Schreibt die gesammelten Ergebnisse in eine CSV-Datei (Semikolon-getrennt).
@@ -46,60 +225,16 @@ def write_summary_csv(results, csv_filepath):
         print("Keine Daten zum Schreiben in die CSV-Datei gefunden.")
         return
 
-    # Spaltenüberschriften
-    headers = [
-        "Issue Key",
-        "Gesamtzahl Epics",
-        "%-Anteil Epics (Backlog-Typ)",
-        "%-Anteil Epics (IN PROGRESS)",
-        "%-Anteil Epics (Closed-Typ)",
-        "Anzahl erstellte Epics",
-        "Anzahl abgeschl. Epics",
-        "Anzahl Epics mit Statusänderung",
-        "Gesamtzahl Stories",
-        "Anzahl offener Stories",
-        "Anzahl erstellte Stories",
-        "Anzahl abgeschl. Stories",
-        "Anzahl Backlogänderung (erstelle Stories minus abgeschlossene Stories)"
+    # Alle Zeilen vorab formatieren und in einem Aufruf schreiben
+    rows = [
+        [_format_float(d.get(k, "")) if k in _FLOAT_COLUMNS else d.get(k, "") for k in _ORDERED_KEYS]
+        for d in results
     ]
 
-    # Mapping von unseren internen Daten-Keys zu den CSV-Headern
-    key_map = {
-        "Issue Key": "Issue Key",
-        "Gesamtzahl Epics": "Gesamtzahl Epics",
-        "%-Anteil Epics (Backlog-Typ)": "% Backlog",
-        "%-Anteil Epics (IN PROGRESS)": "% In Progress",
-        "%-Anteil Epics (Closed-Typ)": "% Closed",
-        "Anzahl erstellte Epics": "Erstellte Epics",
-        "Anzahl abgeschl. Epics": "Abgeschl. Epics",
-        "Anzahl Epics mit Statusänderung": "Epics Statusänderung",
-        "Gesamtzahl Stories": "Gesamtzahl Stories",
-        "Anzahl offener Stories": "Offene Stories",
-        "Anzahl erstellte Stories": "Erstellte Stories",
-        "Anzahl abgeschl. Stories": "Abgeschl. Stories",
-        "Anzahl Backlogänderung (erstelle Stories minus abgeschlossene Stories)": "Backlog-Änderung Stories"
-    }
-
-    internal_keys_ordered = [key_map[h] for h in headers]
-
-    with open(csv_filepath, 'w', newline='', encoding='utf-8-sig') as f:
+    with open(csv_filepath, 'w', newline='', encoding='utf-8-sig', buffering=WRITE_BUFFER_SIZE) as f:
         writer = csv.writer(f, delimiter=';')
-
-        # 1. Header schreiben
-        writer.writerow(headers)
-
-        # 2. Datenzeilen schreiben
-        for data_dict in results:
-            row = []
-            for internal_key in internal_keys_ordered:
-                value = data_dict.get(internal_key, "")
-
-                # Floats für deutsche Lokaliseirung (Komma statt Punkt)
-                if isinstance(value, float):
-                    row.append(f"{value:.0f}".replace('.', ','))
-                else:
-                    row.append(value)
-            writer.writerow(row)
+        writer.writerow(_SUMMARY_HEADERS)
+        writer.writerows(rows)
 
 # ############################################################################
 # HAUPTFUNKTION
@@ -139,6 +274,17 @@ def run_analysis():
         type=str,
         help="Synonym für --stop_date."
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Anzahl Keys, die pro Block an den Prozess-Pool übergeben werden. Standard: {DEFAULT_CHUNK_SIZE}"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Setzt einen abgebrochenen Lauf fort und überspringt bereits abgeschlossene Keys."
+    )
     args = parser.parse_args()
 
     # --- NEU: Datums-Objekte ZENTRAL erstellen ---
@@ -169,8 +315,9 @@ def run_analysis():
         print(f"FEHLER: Eingabedatei nicht gefunden unter:\n{input_file_path}", file=sys.stderr)
         sys.exit(1)
 
-    with open(input_file_path, 'r', encoding='utf-8') as f:
-        issue_keys = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    # Datei in einem Stück lesen und in C splitten statt zeilenweise zu iterieren
+    issue_keys = [k for line in Path(input_file_path).read_text(encoding='utf-8').splitlines()
+                  if (k := line.strip()) and not k.startswith('#')]
 
     if not issue_keys:
         print(f"WARNUNG: Keine Jira-Keys in '{input_file_path}' gefunden. Beende.", file=sys.stderr)
@@ -189,92 +336,50 @@ def run_analysis():
     # --- 5. Iteration und Ausführung (MODIFIZIERT) ---
     total_start_time = datetime.now()
 
-    all_results_data = []
-
-    # Standard-Metriken für Fehlerfälle
-    default_dynamics_metrics = {
-        "Gesamtzahl Epics": 0, "% Backlog": 0, "% In Progress": 0,
-        "% Closed": 0, "Erstellte Epics": 0, "Abgeschl. Epics": 0,
-        "Epics Statusänderung": 0,
-    }
-
-    # --- MODIFIZIERT: Gesamtzahl Stories auf 0 statt "N/A" ---
-    default_backlog_metrics = {
-        "Gesamtzahl Stories": 0,
-        "Offene Stories": 0,
-        "Erstellte Stories": 0,
-        "Abgeschl. Stories": 0,
-        "Backlog-Änderung Stories": 0,
-    }
+    # --- Checkpoint laden (nur bei --resume) ---
+    period = f"{start_date_obj.isoformat()}_{stop_date_obj.isoformat()}"
+    progress_path = os.path.join(output_dir, PROGRESS_FILENAME)
+    if args.resume:
+        results_by_key = _load_progress(progress_path, period)
+        if results_by_key:
+            print(f"Fortsetzung: {len(results_by_key)} Keys wurden bereits abgeschlossen und werden übersprungen.")
+    else:
+        results_by_key = {}
+        if os.path.exists(progress_path):
+            os.remove(progress_path)
 
+    pending_keys = [key for key in dict.fromkeys(issue_keys) if key not in results_by_key]
+    chunk_size = max(1, args.chunk_size)
 
-    with open(output_filepath, 'w', encoding='utf-8') as outfile:
+    # Großer Schreibpuffer: jeder Key wird als ein Block geschrieben, ohne Zwischen-Flushes
+    with open(output_filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as outfile, \
+         open(progress_path, 'a', encoding='utf-8') as progress_file:
         outfile.write(f"Batch-Analyse gestartet am: {total_start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        outfile.write(f"Verarbeite {len(issue_keys)} Issues\n")
+        outfile.write(f"Verarbeite {len(pending_keys)} Issues\n")
         outfile.write(f"Analyse-Zeitraum: {args.start_date} bis {args.stop_date or 'Heute'}\n")
         outfile.write(f"{'='*120}\n\n")
 
-        for i, key in enumerate(issue_keys, 1):
-            print(f"Verarbeite Key {i}/{len(issue_keys)}: {key} ...")
-
-            section_header = f"=== Analyse für Issue {i}/{len(issue_keys)}: {key} ==="
-            outfile.write(f"\n{'='*len(section_header)}\n{section_header}\n{'='*len(section_header)}\n\n")
+        # Keys blockweise an den Prozess-Pool übergeben; Ausgaben in Fertigstellungs-Reihenfolge schreiben
+        i = 0
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for chunk_start in range(0, len(pending_keys), chunk_size):
+                chunk = pending_keys[chunk_start:chunk_start + chunk_size]
+                futures = [executor.submit(_run_one, key, start_date_obj, stop_date_obj) for key in chunk]
 
-            # NEU: Aggregations-Dict für den Key
-            key_results = {"Issue Key": key}
+                for future in as_completed(futures):
+                    key, key_results, log_text = future.result()
+                    i += 1
+                    print(f"Key {i}/{len(pending_keys)} abgeschlossen: {key}")
 
-            # --- Aufruf 1: analyze_issue_dynamics.py (ersetzt subprocess) ---
-            try:
-                outfile.write("--- Start analyze_issue_dynamics ---\n")
-                outfile.flush() # Puffer leeren
+                    section_header = f"=== Analyse für Issue {i}/{len(pending_keys)}: {key} ==="
+                    outfile.write(f"\n{'='*len(section_header)}\n{section_header}\n{'='*len(section_header)}\n\n")
+                    outfile.write(log_text)
+                    outfile.write(f"\n\n")
+                    results_by_key[key] = key_results
+                    _append_progress(progress_file, period, key, key_results)
 
-                # NEU: Direkter Aufruf mit stdout-Umleitung in die Log-Datei
-                with contextlib.redirect_stdout(outfile):
-                    dynamics_data = analyze_epic_dynamics(
-                        root_key=key,
-                        start_date=start_date_obj,
-                        stop_date=stop_date_obj,
-                        issue_type='Epic' # Wie im alten Skript implizit
-                    )
-
-                outfile.write("\n--- Ende analyze_issue_dynamics ---\n")
-
-                # NEU: Ergebnisse mergen
-                key_results.update(dynamics_data or default_dynamics_metrics)
-
-            except Exception as e:
-                outfile.write(f"\n--- KRITISCHER FEHLER (analyze_issue_dynamics.py) ---\n")
-                outfile.write(f"Konnte Funktion nicht ausführen: {e}\n")
-                traceback.print_exc(file=outfile)
-                outfile.write("--- Fahre mit nächstem Skript fort ---\n\n")
-                key_results.update(default_dynamics_metrics) # Standardwerte bei Fehler
-
-            # --- Aufruf 2: analyze_story_backlog.py (ersetzt subprocess) ---
-            try:
-                outfile.write("\n--- Start analyze_story_backlog ---\n")
-                outfile.flush()
-
-                # NEU: Direkter Aufruf mit stdout-Umleitung
-                with contextlib.redirect_stdout(outfile):
-                    backlog_data = analyze_story_backlog(
-                        epic_key=key,
-                        start_date=start_date_obj,
-                        stop_date=stop_date_obj
-                    )
-
-                outfile.write("\n--- Ende analyze_story_backlog ---\n")
-
-                # NEU: Ergebnisse mergen
-                key_results.update(backlog_data or default_backlog_metrics)
-
-            except Exception as e:
-                outfile.write(f"\n--- KRITISCHER FEHLER (analyze_story_backlog.py) ---\n")
-                outfile.write(f"Konnte Funktion nicht ausführen: {e}\n")
-                traceback.print_exc(file=outfile)
-                key_results.update(default_backlog_metrics) # Standardwerte bei Fehler
-
-            outfile.write(f"\n\n")
-            all_results_data.append(key_results)
+        # CSV-Zeilen in der Reihenfolge der Eingabedatei
+        all_results_data = [results_by_key[key] for key in dict.fromkeys(issue_keys)]
 
         total_end_time = datetime.now()
         duration = total_end_time - total_start_time
@@ -299,6 +404,9 @@ def run_analysis():
 
         print(f"Zusammenfassung erfolgreich gespeichert unter: {csv_filepath}")
 
+        # Lauf vollständig abgeschlossen: Checkpoint wird nicht mehr benötigt
+        os.remove(progress_path)
+
     except Exception as e:
         print(f"\n--- KRITISCHER FEHLER beim Erstellen der CSV-Zusammenfassung ---", file=sys.stderr)
         print(f"Fehlermeldung: {e}", file=sys.stderr)
@@ -24,38 +24,31 @@ Usage:
 import os
 import sys
 import argparse
-import json
 
 # Fügt das Projekt-Root-Verzeichnis zum Python-Pfad hinzu, um utils und features zu finden
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-# Importiert die notwendigen Bausteine
-from utils.project_data_provider import ProjectDataProvider
-from utils.config import JIRA_TREE_FULL
-from utils.logger_config import logger
-
-from features.analysis_runner import AnalysisRunner
-from features.console_reporter import ConsoleReporter
-
-# Importiert alle verfügbaren Analyzer-Klassen
-from features.scope_analyzer import ScopeAnalyzer
-from features.dynamics_analyzer import DynamicsAnalyzer
-from features.status_analyzer import StatusAnalyzer
-from features.time_creep_analyzer import TimeCreepAnalyzer
-from features.backlog_analyzer import BacklogAnalyzer
-#from features.maturity_analyzer import MaturityAnalyzer
-
-# Konfiguriert die Liste aller Analyzer, die ausgeführt werden sollen
-ALL_ANALYZERS = [
-    ScopeAnalyzer,
-    DynamicsAnalyzer,
-    StatusAnalyzer,
-    TimeCreepAnalyzer,
-    BacklogAnalyzer,
-    #MaturityAnalyzer,
-]
+# Die Projekt-Module (Provider, Analyzer, Reporter inkl. pandas/matplotlib) werden
+# erst in run_quick_analysis() importiert, damit z.B. `--help` sofort antwortet.
+
+
+def _load_analyzers() -> list:
+    """Importiert alle Analyzer-Klassen, die ausgeführt werden sollen."""
+    from features.scope_analyzer import ScopeAnalyzer
+    from features.dynamics_analyzer import DynamicsAnalyzer
+    from features.status_analyzer import StatusAnalyzer
+    from features.time_creep_analyzer import TimeCreepAnalyzer
+    from features.backlog_analyzer import BacklogAnalyzer
+
+    return [
+        ScopeAnalyzer,
+        DynamicsAnalyzer,
+        StatusAnalyzer,
+        TimeCreepAnalyzer,
+        BacklogAnalyzer,
+    ]
 
 def run_quick_analysis(epic_key: str):
     """
@@ -64,6 +57,14 @@ def run_quick_analysis(epic_key: str):
     Args:
         epic_key (str): Der Jira-Key des zu analysierenden Business Epics.
     """
+    from utils.project_data_provider import ProjectDataProvider
+    from utils.config import JIRA_TREE_FULL
+    from utils.logger_config import logger
+    from features.analysis_runner import AnalysisRunner
+    from features.console_reporter import ConsoleReporter
+
+    all_analyzers = _load_analyzers()
+
     print(f"\n{'='*60}")
     print(f"  Starte schnelle Analyse für Business Epic: {epic_key}")
     print(f"{'='*60}\n")
@@ -78,8 +79,8 @@ def run_quick_analysis(epic_key: str):
     logger.info("Daten erfolgreich geladen.")
 
     # 2. Analysen ausführen
-    logger.info(f"Führe {len(ALL_ANALYZERS)} Analysen aus...")
-    analysis_runner = AnalysisRunner(analyzer_classes=ALL_ANALYZERS)
+    logger.info(f"Führe {len(all_analyzers)} Analysen aus...")
+    analysis_runner = AnalysisRunner(analyzer_classes=all_analyzers)
     all_results = analysis_runner.run_analyses(data_provider)
     logger.info("Alle Analysen abgeschlossen.")
 
@@ -120,12 +121,6 @@ def run_quick_analysis(epic_key: str):
         # Plot für die Backlog-Entwicklung erstellen
         reporter.create_backlog_plot(all_results['BacklogAnalyzer'], epic_key)
 
-    # Maturity-Analyse (Reifegrad)
-    if 'MaturityAnalyzer' in all_results:
-        print("\n--- Analyse des Reifegrads ---")
-        # Da es keine dedizierte Reporter-Funktion gibt, geben wir das JSON formatiert aus
-        print(json.dumps(all_results['MaturityAnalyzer'], indent=2, ensure_ascii=False))
-
     print(f"\n{'='*60}")
     print(f"  Analyse für {epic_key} abgeschlossen.")
     print(f"{'='*60}\n")
@@ -341,7 +341,7 @@ def main():
             combined_result = {**scope_result}
             combined_result['business_epic_key'] = epic_key
 
-            # HINWEIS: Stelle sicher, dass 'title' in _build_issue_details_cache hinzugefügt wurde!
+            # HINWEIS: Stelle sicher, dass 'title' in _add_issue_data hinzugefügt wurde!
             combined_result['title'] = data_provider.issue_details.get(epic_key, {}).get('title', 'N/A')
 
             combined_result['coding_start_time'] = coding_start
@@ -0,0 +1,119 @@
+"""
+Tests für den DataExtractor: REST-Pfad und Issue-Seite müssen dasselbe Schema liefern.
+
+Beide Pfade werden ohne Browser und ohne Netzwerk ausgeführt: die Issue-Seite über
+einen gespeicherten Seiteninhalt (`page_source`), der REST-Pfad über eine bereits
+normalisierte API-Antwort (wie von `_fetch_issue_json` geliefert).
+
+Ausführen mit `python -m pytest src/test_data_extractor.py` oder direkt mit
+`python src/test_data_extractor.py`.
+"""
+import os
+import sys
+
+# Pfad-Setup: Füge 'src' zum Suchpfad hinzu, damit Module gefunden werden
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.data_extractor import DataExtractor
+
+BASE_URL = "https://jira.example.com/"
+ISSUE_KEY = "ABC-0"
+
+# Gespeicherte Issue-Seite (auf die vom Extractor gelesenen Elemente reduziert)
+PAGE_SOURCE = """<html><body>
+<div id="summary-val"><h2> My Epic Title </h2></div>
+<span id="type-val"> <img/> Business Epic</span>
+<div id="description-val" class="user-content-block">
+ <h3>Business Value / Cost of Delay</h3>
+ <p>Business Impact</p><div class="table-wrap"><table><tr><th>Scale</th><th>Rev</th><th>Risk</th><th>Just</th></tr><tr><td>3</td><td>more money</td><td>less loss</td><td>because</td></tr></table></div>
+ <p>Strategic Enablement/Risk Reduktion</p><div class="table-wrap"><table><tr><th>a</th></tr><tr><td>2</td><td>rm</td><td>se</td><td>j2</td></tr></table></div>
+ <p>Time Criticality</p><div class="table-wrap"><table><tr><th>a</th></tr><tr><td>1</td><td>Q3</td><td>j3</td></tr></table></div>
+ <div class="panel"><div class="panelHeader"><b>Business Epic Nutzenstatement</b></div><div class="panelContent"><p>Nutzen line 1</p><p>Nutzen line 2</p></div></div>
+ <div class="panel"><div class="panelHeader"><b>In Scope / Akzeptanzkriterien</b></div><div class="panelContent"><ul><li>AC 1</li><li>In Scope/Akzeptanzkriterien: siehe Ausfüllhilfe</li><li>AC 2</li></ul></div></div>
+</div>
+<strong title="Business Scope">Business Scope</strong><div><p>Scope a</p><p>Scope b</p></div>
+<a class="aui-dropdown2-trigger opsbar-transitions__status-category_indeterminate"><span class="dropdown-text">In Progress</span></a>
+<strong title="Story Points"><label>Story Points</label></strong><div> 5 </div>
+<span id="assignee-val" class="user-hover">Jane Doe</span>
+<span id="priority-val"> Major </span>
+<span id="fixVersions-field"><a href="/issues/?jql=1">Q3_25</a>, <a href="/issues/?jql=2">Q4_25</a></span>
+<span data-name="Target start"><time datetime="2025-01-01">1 Jan</time></span>
+<span data-name="Target end"><time datetime="2025-06-30">30 Jun</time></span>
+<ol id="attachment_thumbnails" class="item-attachments"><li class="attachment-content" data-downloadurl="image/png:pic.png:https://jira.example.com/secure/pic.png"><dd class="attachment-size">12 kB</dd><time datetime="2025-02-02T10:00">x</time></li></ol>
+<span id="components-val"><a href="/issues/?c=1" title="Comp One">C1</a></span>
+<div class="labels-wrap"><a class="lozenge">lab1</a><a class="lozenge">lab2</a></div>
+<dl class="links-list"><dt title="is realized by">is realized by</dt><dd><div class="link-content"><p><a class="issue-link" data-issue-key="ABC-1" href="/browse/ABC-1">ABC-1</a><span class="link-summary">Sum 1</span></p></div></dd></dl>
+</body></html>"""
+
+
+def _issue_json():
+    """Dasselbe Issue als normalisierte REST-Antwort (Felder bereits nach `names` benannt)."""
+    description_html = PAGE_SOURCE.split('class="user-content-block">', 1)[1].split("\n</div>\n<strong", 1)[0]
+    return {
+        "key": ISSUE_KEY,
+        "fields": {
+            "Summary": "My Epic Title",
+            "Issue Type": {"name": "Business Epic"},
+            "Status": {"name": "In Progress"},
+            "Resolution": None,
+            "Story Points": 5.0,
+            "Assignee": {"displayName": "Jane Doe"},
+            "Priority": {"name": "Major"},
+            "Target start": "2025-01-01",
+            "Target end": "2025-06-30",
+            "Fix Version/s": [{"name": "Q3_25"}, {"name": "Q4_25"}],
+            "Component/s": [{"name": "C1", "description": "Comp One"}],
+            "Labels": ["lab1", "lab2"],
+            "Attachment": [{"filename": "pic.png", "content": "https://jira.example.com/secure/pic.png",
+                            "mimeType": "image/png", "size": 12288, "created": "2025-02-02T10:00"}],
+            "Linked Issues": [
+                {"type": {"outward": "realizes", "inward": "is realized by"},
+                 "inwardIssue": {"key": "ABC-1", "fields": {"summary": "Sum 1"}}},
+            ],
+        },
+        "renderedFields": {
+            "Description": description_html,
+            "Business Scope": "<p>Scope a</p><p>Scope b</p>",
+        },
+    }
+
+
+class _SavedPageDriver:
+    """Minimaler WebDriver-Ersatz, der nur den gespeicherten Seiteninhalt liefert."""
+    page_source = PAGE_SOURCE
+    current_url = f"{BASE_URL}browse/{ISSUE_KEY}"
+
+
+def _schema(value):
+    """Reduziert einen Wert auf seine Struktur (Schlüssel und Typen, keine Inhalte)."""
+    if isinstance(value, dict):
+        return {key: _schema(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_schema(item) for item in value]
+    return type(value).__name__
+
+
+def _extract_both():
+    extractor = DataExtractor()
+    page_data = extractor.extract_issue_data(_SavedPageDriver(), ISSUE_KEY)
+    rest_data, ai_input, business_scope = extractor._issue_data_from_json(BASE_URL, _issue_json())
+    extractor._finish_issue_data(rest_data, ai_input, business_scope)
+    return page_data, rest_data
+
+
+def test_rest_and_page_return_same_schema():
+    page_data, rest_data = _extract_both()
+    assert list(rest_data) == list(page_data)
+    assert _schema(rest_data) == _schema(page_data)
+
+
+def test_rest_and_page_return_same_values():
+    page_data, rest_data = _extract_both()
+    assert rest_data == page_data
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"OK   {name}")
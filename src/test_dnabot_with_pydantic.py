@@ -1,6 +1,7 @@
 import sys
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import ValidationError
 
 # Pfad-Setup: Füge 'src' zum Suchpfad hinzu, damit Module gefunden werden
@@ -10,78 +11,101 @@ from utils.dna_bot_client import DnaBotClient
 from utils.business_impact_api import AIResponse
 from utils.json_parser import LLMJsonParser  # <--- NEU: Import des Parsers
 
-def test_pydantic_integration():
-    print("--- Starte Test: DNA Bot mit Pydantic Modellen (mit Parser) ---\n")
-
-    # 1. Client & Parser initialisieren
-    try:
-        client = DnaBotClient()
-        parser = LLMJsonParser() # <--- NEU: Parser Instanz
-    except ValueError as e:
-        print(f"Fehler bei der Initialisierung (Fehlen Env-Vars?): {e}")
-        return
+# JSON-Schema einmalig beim Import erzeugen (kompakte Form spart zusätzlich Prompt-Tokens)
+_JSON_SCHEMA_STR = json.dumps(AIResponse.model_json_schema(), separators=(',', ':'))
 
-    # 2. Das JSON-Schema aus dem Pydantic-Modell extrahieren
-    json_schema = json.dumps(AIResponse.model_json_schema(), indent=2)
+# Maximale Anzahl paralleler Anfragen an den DNA Bot (Rate-Limit des Servers beachten)
+MAX_CONCURRENT_REQUESTS = 4
 
-    # 3. Test-Szenario definieren
-    test_description = (
-        "Wir müssen das Legacy-System abschalten, da der Support ausläuft. "
-        "Dadurch sparen wir 50k Lizenzkosten pro Jahr. Es ist kritisch für die Security-Compliance "
-        "und muss bis Ende Q3 fertig sein."
-    )
-
-    system_prompt = f"""
+SYSTEM_PROMPT = f"""
     Du bist ein Business Analyst. Extrahiere den Business Value aus dem Text.
     
     WICHTIG: Deine Antwort MUSS ein valides JSON-Objekt sein, das exakt diesem Schema entspricht:
-    {json_schema}
+    {_JSON_SCHEMA_STR}
     """
 
-    print(f"Sende Anfrage für Text: '{test_description[:50]}...'\n")
+# Test-Szenarien
+TEST_DESCRIPTIONS = [
+    (
+        "Wir müssen das Legacy-System abschalten, da der Support ausläuft. "
+        "Dadurch sparen wir 50k Lizenzkosten pro Jahr. Es ist kritisch für die Security-Compliance "
+        "und muss bis Ende Q3 fertig sein."
+    ),
+    (
+        "Die Self-Service-Funktion im Kundenportal reduziert die Anrufe im Callcenter um ca. 15%. "
+        "Das Feature ist Voraussetzung für die geplante Portal-Migration und sollte bis Q1 live sein."
+    ),
+]
+
 
-    # 4. Abfrage an den DNA Bot
+def _analyze_description(client, parser, description):
+    """
+    Sendet eine Beschreibung an den DNA Bot, bereinigt die Antwort und validiert sie.
+    Läuft in einem Worker-Thread; alle Ausgaben werden gesammelt zurückgegeben,
+    damit sie sich in der Konsole nicht vermischen.
+    """
+    lines = [f"Anfrage für Text: '{description[:50]}...'\n"]
     try:
         result = client.completion(
             model_name="Mistral-Small-3.2-24B-Instruct-2506", 
-            user_prompt=test_description,
-            system_prompt=system_prompt,
+            user_prompt=description,
+            system_prompt=SYSTEM_PROMPT,
             temperature=0.1,
             response_format={"type": "json_object"}
         )
-        
+
         raw_text = result['text']
-        print(f"Rohe Antwort vom LLM:\n{raw_text}\n")
-        print("-" * 30)
+        lines.append(f"Rohe Antwort vom LLM:\n{raw_text}\n")
+        lines.append("-" * 30)
 
-        # 5. BEREINIGUNG: Nutze den LLMJsonParser
+        # BEREINIGUNG: Nutze den LLMJsonParser
         # Dies entfernt Markdown-Blöcke (```json ... ```) und repariert kleine Syntaxfehler
-        print("Bereinige Antwort mit LLMJsonParser...")
         parsed_dict = parser.extract_and_parse_json(raw_text)
-        
-        if not parsed_dict:
-            print("❌ FEHLER: Parser konnte kein valides JSON extrahieren.")
-            return
 
-        print("JSON erfolgreich extrahiert.")
+        if not parsed_dict:
+            lines.append("❌ FEHLER: Parser konnte kein valides JSON extrahieren.")
+            return "\n".join(lines)
 
-        # 6. Validierung gegen Pydantic
+        # Validierung gegen Pydantic
         # Wir validieren nun das Python-Dict, nicht den rohen String!
-        print("Versuche Pydantic-Validierung...")
         parsed_obj = AIResponse.model_validate(parsed_dict)
-        
-        print("\n✅ ERFOLG! Das Extrahierte JSON entspricht dem Pydantic-Modell.")
-        print("=" * 30)
-        print(f"Cleaned Description: {parsed_obj.cleaned_description}")
-        print(f"Impact Scale:        {parsed_obj.business_value.business_impact.scale}")
-        print(f"Cost Saving:         {parsed_obj.business_value.business_impact.cost_saving}")
-        print(f"Time Criticality:    {parsed_obj.business_value.time_criticality.time}")
-        print("=" * 30)
+
+        lines.append("\n✅ ERFOLG! Das Extrahierte JSON entspricht dem Pydantic-Modell.")
+        lines.append("=" * 30)
+        lines.append(f"Cleaned Description: {parsed_obj.cleaned_description}")
+        lines.append(f"Impact Scale:        {parsed_obj.business_value.business_impact.scale}")
+        lines.append(f"Cost Saving:         {parsed_obj.business_value.business_impact.cost_saving}")
+        lines.append(f"Time Criticality:    {parsed_obj.business_value.time_criticality.time}")
+        lines.append("=" * 30)
 
     except ValidationError as e:
-        print(f"\n❌ VALIDIERUNGSFEHLER: Das JSON passt nicht zum Schema.\n{e}")
+        lines.append(f"\n❌ VALIDIERUNGSFEHLER: Das JSON passt nicht zum Schema.\n{e}")
     except Exception as e:
-        print(f"\n❌ UNERWARTETER FEHLER: {e}")
+        lines.append(f"\n❌ UNERWARTETER FEHLER: {e}")
+
+    return "\n".join(lines)
+
+
+def test_pydantic_integration(descriptions=TEST_DESCRIPTIONS):
+    print("--- Starte Test: DNA Bot mit Pydantic Modellen (mit Parser) ---\n")
+
+    # 1. Client & Parser initialisieren
+    try:
+        client = DnaBotClient()
+        parser = LLMJsonParser() # <--- NEU: Parser Instanz
+    except ValueError as e:
+        print(f"Fehler bei der Initialisierung (Fehlen Env-Vars?): {e}")
+        return
+
+    # 2. Alle Anfragen parallel senden (der Client teilt sich einen Connection-Pool)
+    print(f"Sende {len(descriptions)} Anfragen (max. {MAX_CONCURRENT_REQUESTS} parallel)...\n")
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        reports = executor.map(lambda desc: _analyze_description(client, parser, desc), descriptions)
+
+        # 3. Ergebnisse in Eingabereihenfolge ausgeben
+        for report in reports:
+            print(report)
+            print()
 
 if __name__ == "__main__":
-    test_pydantic_integration()
\ No newline at end of file
+    test_pydantic_integration()
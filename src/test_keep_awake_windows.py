@@ -15,8 +15,31 @@ Wartezeit kann der Benutzer beobachten, ob der PC wie erwartet aktiv bleibt.
 
 import ctypes
 import sys
+import threading
 import time
 
+# Testdauer in Sekunden und Intervall der Fortschrittsausgabe
+TEST_DURATION = 3600
+PROGRESS_INTERVAL = 30
+
+
+def _start_progress_timer(deadline: float) -> threading.Timer:
+    """
+    Startet einen Daemon-Timer, der alle PROGRESS_INTERVAL Sekunden die
+    verbleibende Zeit ausgibt, statt den Hauptthread jede Sekunde aufzuwecken.
+    """
+    def _report():
+        remaining = int(deadline - time.monotonic())
+        if remaining <= 0:
+            return
+        print(f"\rVerbleibende Zeit: {remaining}s  ", end="", flush=True)
+        _start_progress_timer(deadline)
+
+    timer = threading.Timer(PROGRESS_INTERVAL, _report)
+    timer.daemon = True
+    timer.start()
+    return timer
+
 def test_windows_keep_awake_v2():
     """
     Testet die Windows-spezifische "Keep-Awake"-Funktion
@@ -60,7 +83,7 @@ def test_windows_keep_awake_v2():
     reset_flags = ES_CONTINUOUS
 
     try:
-        print("\n--- START TEST (Dauer: 2 Minuten) ---")
+        print(f"\n--- START TEST (Dauer: {TEST_DURATION // 60} Minuten) ---")
 
         # 1. Keep-Awake-Zustand SETZEN
         print(f"[{time.strftime('%H:%M:%S')}] SETZE Keep-Awake: System + Display (0x{keep_awake_flags:X})")
@@ -70,13 +93,12 @@ def test_windows_keep_awake_v2():
             print("FEHLER: SetThreadExecutionState konnte nicht gesetzt werden.")
             return
 
-        print("\nSystem wird jetzt für 2 Minuten aktiv gehalten...")
+        print(f"\nSystem wird jetzt für {TEST_DURATION // 60} Minuten aktiv gehalten...")
         print("Bitte PC nicht berühren und beobachten.")
 
-        # 2. Warten (in 1-Sekunden-Schritten, um auf Strg+C zu reagieren)
-        for i in range(3600):
-            time.sleep(1)
-            print(f"\rVerbleibende Zeit: {3600 - i}s  ", end="")
+        # 2. Warten: ein einziger Sleep; Strg+C unterbricht ihn trotzdem
+        _start_progress_timer(time.monotonic() + TEST_DURATION)
+        time.sleep(TEST_DURATION)
 
         print("\n\n--- TEST ABGESCHLOSSEN ---")
         print("Wenn Ihr PC *nicht* gesperrt wurde und *nicht* in den Ruhezustand ging,")
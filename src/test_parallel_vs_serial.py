@@ -32,6 +32,8 @@ MODEL_NAME = "gpt-oss-120b"
 NUM_CALLS = 20
 PROMPT = "Erkläre ausführlich, was ein Business Epic im Kontext von Jira ist. Antworte mit mindestens 150 Wörtern."
 MAX_TOKENS = 1000
+# Obergrenze für parallele Worker (Sweet-Spot der API-Parallelität)
+MAX_WORKERS = min(NUM_CALLS, 16)
 # Wir initialisieren den Client VOR den Tests, damit der Token nur einmal geholt wird
 CLIENT = DnaBotClient(verify_ssl=False)
 
@@ -77,27 +79,18 @@ def run_serial_test(num_calls):
 
 
 def run_parallel_test(num_calls):
-    """Führt parallele Aufrufe mit einem ThreadPoolExecutor aus."""
-    print(f"\n{'='*50}\n Starte Parallelen Test ({num_calls} Worker)...")
+    """Führt parallele Aufrufe mit einem begrenzten ThreadPoolExecutor aus."""
+    max_workers = min(num_calls, MAX_WORKERS)
+    print(f"\n{'='*50}\n Starte Parallelen Test ({num_calls} Aufrufe, {max_workers} Worker)...")
     results = []
     total_start = time.time()
 
-    # Definiere die maximale Anzahl der Worker (gleich der Anzahl der Aufrufe)
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_calls) as executor:
-
-        # Sende alle Aufgaben gleichzeitig
-        future_to_worker = {executor.submit(run_single_completion, i): i for i in range(1, num_calls + 1)}
-
-        # Warte auf die Ergebnisse
-        for future in concurrent.futures.as_completed(future_to_worker):
-            worker_id = future_to_worker[future]
-            try:
-                worker_id, duration, status, length = future.result()
-                print(f"  <- Worker {worker_id} abgeschlossen. Dauer: {duration:.2f}s, Status: {status.split(':')[0]}")
-                results.append(duration)
-            except Exception as e:
-                print(f"  <- Worker {worker_id} ist abgestürzt: {e}")
-                results.append(0) # 0, da der Fehler die Gesamtlaufzeit nicht beeinflusst
+    # Pool auf die API-Parallelität begrenzen statt einen Thread pro Aufruf zu starten.
+    # run_single_completion fängt Fehler selbst ab, daher genügt executor.map.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for worker_id, duration, status, length in executor.map(run_single_completion, range(1, num_calls + 1)):
+            print(f"  <- Worker {worker_id} abgeschlossen. Dauer: {duration:.2f}s, Status: {status.split(':')[0]}")
+            results.append(duration)
 
     total_duration = time.time() - total_start
     return total_duration, results
@@ -126,7 +119,7 @@ def main():
     print(f"\n{'='*50}\n ZUSAMMENFASSUNG")
     print(f"Anzahl erfolgreicher Aufrufe: {NUM_CALLS}")
     print(f"Modell: {MODEL_NAME}")
-    print(f"Anzahl Worker: {NUM_CALLS}")
+    print(f"Anzahl Worker: {MAX_WORKERS}")
 
     print("\n--- Laufzeit Vergleich ---")
     print(f"Seriell (Gesamtdauer): {serial_total_time:.2f} Sekunden")
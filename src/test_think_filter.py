@@ -0,0 +1,45 @@
+"""
+Tests für das Entfernen von <think>...</think> Blöcken im DnaBotClient.
+
+Ausführen mit `python -m pytest src/test_think_filter.py` oder direkt mit
+`python src/test_think_filter.py`.
+"""
+import os
+import sys
+
+# Pfad-Setup: Füge 'src' zum Suchpfad hinzu, damit Module gefunden werden
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.dna_bot_client import _ThinkFilter, _clean_reasoning_text_cached
+
+
+def _stream(chunks, **kwargs):
+    think_filter = _ThinkFilter(**kwargs)
+    return "".join(think_filter.feed(chunk) for chunk in chunks) + think_filter.flush()
+
+
+def test_closed_block_is_removed():
+    assert _clean_reasoning_text_cached('<think>a\nb</think>\n\n{"x": 1}') == '{"x": 1}'
+    assert _clean_reasoning_text_cached("a<Think>b</THINK>c<think>d</think>e") == "ace"
+
+
+def test_unclosed_block_is_kept_unchanged():
+    assert _clean_reasoning_text_cached("<think>abgeschnitten") == "<think>abgeschnitten"
+    assert _clean_reasoning_text_cached("x <think>a</think> b <think>c") == "x  b <think>c"
+
+
+def test_split_tags_in_stream():
+    chunks = ["Vor <th", "ink>geheim</thi", "nk> nach <", "b> x <", "THINK>y</think>z"]
+    assert _stream(chunks) == "Vor  nach <b> x z"
+
+
+def test_unclosed_block_in_stream():
+    assert _stream(["Antwort <thi", "nk>abgeschnitten"]) == "Antwort "
+    assert _stream(["Antwort <thi", "nk>abgeschnitten"], keep_unclosed=True) == "Antwort <think>abgeschnitten"
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_") and callable(test):
+            test()
+            print(f"OK   {name}")
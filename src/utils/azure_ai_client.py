@@ -23,6 +23,8 @@ from azure.ai.inference import ChatCompletionsClient
 from azure.ai.inference.models import SystemMessage, UserMessage
 from azure.core.credentials import AzureKeyCredential
 
+from utils.config import load_env
+
 
 class AzureAIClient:
     """
@@ -88,6 +90,7 @@ class AzureAIClient:
     def _initialize_openai_client(self):
         """Initializes the Azure OpenAI client if it hasn't been already."""
         if self.openai_client is None:
+            load_env()
             self.openai_client = AzureOpenAI(
                 api_key=os.environ.get("AZURE_OPENAI_API_KEY"),
                 api_version=os.environ.get("AZURE_OPENAI_API_VERSION"),
@@ -98,6 +101,7 @@ class AzureAIClient:
     def _initialize_foundation_client(self):
         """Initializes the Azure AI Foundation client if it hasn't been already."""
         if self.foundation_client is None:
+            load_env()
             self.foundation_client = ChatCompletionsClient(
                 endpoint=os.environ.get("AZURE_AIFOUNDRY_ENDPOINT"),
                 credential=AzureKeyCredential(os.environ.get("AZURE_AIFOUNDRY_API_KEY")),
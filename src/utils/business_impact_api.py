@@ -10,17 +10,26 @@ It uses the DnaBotClient exclusively. Since DnaBot does not support native
 Pydantic parsing via the API, this module injects the JSON schema into the
 system prompt and uses the LLMJsonParser to clean and validate the output.
 
+For many descriptions, `process_descriptions_batch` packs up to `BATCH_SIZE`
+descriptions into a single DnaBot call, reducing the number of round-trips,
+and `process_many` sends individual requests concurrently.
+
 CLI Usage:
-    python src/utils/business_impact_api.py --issue BEB2B-1234
+    python src/utils/business_impact_api.py --issue BEB2B-1234 [BEB2B-5678 ...]
+    python src/utils/business_impact_api.py --issues BEB2B-1234,BEB2B-5678
 """
 
 import json
 import os
 import sys
 import argparse
-from typing import Optional, Dict, Any
+import functools
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from pydantic import BaseModel, Field, ValidationError
-from dotenv import load_dotenv, find_dotenv
 
 # --- PATH SETUP FOR DIRECT EXECUTION ---
 # Fügt 'src' zum Suchpfad hinzu, damit 'from utils...' funktioniert,
@@ -35,10 +44,18 @@ from utils.dna_bot_client import DnaBotClient
 from utils.json_parser import LLMJsonParser
 from utils.prompt_loader import load_prompt_template
 from utils.logger_config import logger
-from utils.config import JIRA_ISSUES_DIR, LLM_MODEL_BUSINESS_VALUE, TOKEN_LOG_FILE
+from utils.config import JIRA_ISSUES_DIR, LLM_MODEL_BUSINESS_VALUE, TOKEN_LOG_FILE, BV_CACHE_FILE, load_env
 from utils.token_usage_class import TokenUsage
 
-_ = load_dotenv(find_dotenv())
+load_env()
+
+# Anzahl der Beschreibungen pro Batch-Aufruf (größere Batches verlängern die
+# Antwort und erhöhen das Risiko unvollständiger JSON-Ausgaben)
+BATCH_SIZE = 5
+# Maximale Anzahl paralleler DnaBot-Anfragen in process_many
+MAX_CONCURRENT_REQUESTS = 16
+# Bei Änderungen an Prompt-Logik oder Schema erhöhen, um den Ergebnis-Cache zu invalidieren
+PROMPT_VERSION = 1
 
 # --- Pydantic Models (Unverändert) ---
 class BusinessImpact(BaseModel):
@@ -73,6 +90,104 @@ class AIResponse(BaseModel):
     cleaned_description: str = Field(..., description="The description text, cleaned of any business value information.")
     business_value: BusinessValue
 
+class BatchAIResponseItem(AIResponse):
+    """One analyzed description within a batch response, identified by its item id."""
+    item_id: str = Field(..., description="The id of the input item (from the <<<ITEM id=...>>> marker).")
+
+class BatchAIResponse(BaseModel):
+    """The top-level model for batch requests: one entry per input item."""
+    items: List[BatchAIResponseItem]
+
+
+# --- Statische Prompt-Bestandteile (einmalig beim Import erzeugt) ---
+# Kompaktes JSON spart Prompt-Tokens; das Schema ändert sich zur Laufzeit nicht.
+_AI_RESPONSE_SCHEMA_JSON = json.dumps(AIResponse.model_json_schema(), separators=(",", ":"))
+_BATCH_RESPONSE_SCHEMA_JSON = json.dumps(BatchAIResponse.model_json_schema(), separators=(",", ":"))
+
+_SYSTEM_PROMPT = f"""
+    You are a Business Analyst. Extract event information and business value from the description.
+    Separate the core text from the business value data.
+
+    IMPORTANT: You must output a valid JSON object that strictly conforms to this schema:
+    {_AI_RESPONSE_SCHEMA_JSON}
+    """
+
+_BATCH_SYSTEM_PROMPT = f"""
+    You are a Business Analyst. Extract event information and business value from each of the given descriptions.
+    Separate the core text from the business value data. Every description is enclosed in <<<ITEM id=...>>> and <<<END>>>;
+    analyze each one independently and return exactly one entry per item with the matching item_id.
+
+    IMPORTANT: You must output a valid JSON object that strictly conforms to this schema:
+    {_BATCH_RESPONSE_SCHEMA_JSON}
+    """
+
+
+@functools.lru_cache(maxsize=None)
+def _get_user_prompt_template() -> str:
+    """Lädt das User-Prompt-Template einmalig aus der YAML-Datei."""
+    return load_prompt_template("business_impact_prompt.yaml", "user_prompt_template")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_batch_user_prompt_template() -> str:
+    """Lädt das User-Prompt-Template für Batch-Aufrufe (Ausgabe als `items`-Liste) einmalig."""
+    return load_prompt_template("business_impact_prompt.yaml", "batch_user_prompt_template")
+
+
+# --- Persistenter Ergebnis-Cache ---
+_cache_lock = threading.Lock()
+_cache_conn: Optional[sqlite3.Connection] = None
+
+
+def _cache_key(description_text: str, model: str) -> str:
+    """Builds the cache key from model, prompt version and description."""
+    raw = f"{model}|{PROMPT_VERSION}|{description_text}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _get_cache_conn() -> Optional[sqlite3.Connection]:
+    """Opens the SQLite cache on first use; returns None if it is unavailable."""
+    global _cache_conn
+    if _cache_conn is None:
+        try:
+            os.makedirs(os.path.dirname(BV_CACHE_FILE), exist_ok=True)
+            conn = sqlite3.connect(BV_CACHE_FILE, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS bv_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            conn.commit()
+            _cache_conn = conn
+        except sqlite3.Error as e:
+            logger.warning(f"Business value cache unavailable ({BV_CACHE_FILE}): {e}")
+            return None
+    return _cache_conn
+
+
+def _cache_get(key: str) -> Optional[dict]:
+    """Returns the cached result for `key` or None."""
+    with _cache_lock:
+        conn = _get_cache_conn()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT value FROM bv_cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Business value cache read failed: {e}")
+            return None
+    return json.loads(row[0]) if row else None
+
+
+def _cache_put(key: str, result: dict) -> None:
+    """Stores a validated result in the cache."""
+    value = json.dumps(result, ensure_ascii=False, separators=(",", ":"))
+    with _cache_lock:
+        conn = _get_cache_conn()
+        if conn is None:
+            return
+        try:
+            conn.execute("INSERT OR REPLACE INTO bv_cache (key, value) VALUES (?, ?)", (key, value))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Business value cache write failed: {e}")
+
 
 def get_empty_business_value_dict() -> dict:
     """Returns a default empty business value structure as a dictionary."""
@@ -93,35 +208,31 @@ def process_description(description_text: str, model: str, token_tracker, ai_cli
     if not description_text:
         return get_empty_business_value_dict()
 
-    # 1. Prompts laden und vorbereiten
-    prompt_template = load_prompt_template("business_impact_prompt.yaml", "user_prompt_template")
-    user_prompt = prompt_template.format(description_text=description_text)
-
-    # Schema für den System-Prompt generieren
-    json_schema = json.dumps(AIResponse.model_json_schema(), indent=2)
-    system_prompt = f"""
-    You are a Business Analyst. Extract event information and business value from the description.
-    Separate the core text from the business value data.
+    # 0. Cache-Treffer ersparen den LLM-Aufruf komplett
+    cache_key = _cache_key(description_text, model)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
 
-    IMPORTANT: You must output a valid JSON object that strictly conforms to this schema:
-    {json_schema}
-    """
+    # 1. Prompt vorbereiten (Template und System-Prompt sind gecacht)
+    user_prompt = _get_user_prompt_template().format(description_text=description_text)
 
     try:
-        # 2. API-Aufruf an DnaBot
-        response = ai_client.completion(
+        # 2. API-Aufruf an DnaBot (gestreamt; <think>-Blöcke filtert bereits der Client)
+        response_stream = ai_client.completion(
             model_name=model,
             user_prompt=user_prompt,
-            system_prompt=system_prompt,
+            system_prompt=_SYSTEM_PROMPT,
             temperature=0.1,
-            response_format={"type": "json_object"}
+            response_format={"type": "json_object"},
+            stream=True
         )
 
-        raw_text = response['text']
+        raw_text = "".join(response_stream)
 
-        # 3. Token Logging
-        if token_tracker and 'usage' in response:
-            usage = response['usage']
+        # 3. Token Logging (Usage liegt erst nach dem vollständig konsumierten Stream vor)
+        usage = ai_client.last_stream_usage
+        if token_tracker and usage:
             input_t = usage.get('prompt_tokens', 0)
             output_t = usage.get('completion_tokens', 0)
             total_t = usage.get('total_tokens', 0)
@@ -144,10 +255,12 @@ def process_description(description_text: str, model: str, token_tracker, ai_cli
         # 5. Validierung gegen Pydantic
         ai_response_object = AIResponse.model_validate(parsed_dict)
 
-        return {
+        result = {
             "description": ai_response_object.cleaned_description.strip(),
             "business_value": ai_response_object.business_value.model_dump(),
         }
+        _cache_put(cache_key, result)
+        return result
 
     except (ValidationError, json.JSONDecodeError) as e:
         logger.error(f"Validation/JSON Error in process_description: {e}")
@@ -158,46 +271,192 @@ def process_description(description_text: str, model: str, token_tracker, ai_cli
         return {"description": description_text, "business_value": get_empty_business_value_dict()["business_value"]}
 
 
+def process_descriptions_batch(items: List[Tuple[str, str]], model: str, token_tracker, ai_client: DnaBotClient,
+                               batch_size: int = BATCH_SIZE) -> Dict[str, dict]:
+    """
+    Analyzes several descriptions with as few DnaBot calls as possible.
+
+    The descriptions are sent in chunks of `batch_size`, each wrapped in
+    `<<<ITEM id=...>>> ... <<<END>>>` markers; the model answers with one JSON
+    object containing an `items` list. Items missing from a batch answer are
+    processed individually via `process_description`. Descriptions already in the
+    result cache are answered from it and never sent; validated batch items are
+    written back to the cache.
+
+    Args:
+        items: List of (key, description_text) tuples.
+
+    Returns:
+        dict: {key: {"description": ..., "business_value": ...}} for every input key.
+    """
+    results = {}
+
+    # Leere Beschreibungen und Cache-Treffer brauchen keinen API-Aufruf
+    pending = []
+    for key, description_text in items:
+        if not description_text:
+            results[key] = get_empty_business_value_dict()
+            continue
+        cached = _cache_get(_cache_key(description_text, model))
+        if cached is not None:
+            results[key] = cached
+        else:
+            pending.append((key, description_text))
+
+    if not pending:
+        return results
+
+    prompt_template = _get_batch_user_prompt_template()
+    parser = LLMJsonParser()
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        items_block = "\n\n".join(f"<<<ITEM id={key}>>>\n{text}\n<<<END>>>" for key, text in batch)
+        user_prompt = prompt_template.format(items_block=items_block)
+
+        try:
+            response = ai_client.completion(
+                model_name=model,
+                user_prompt=user_prompt,
+                system_prompt=_BATCH_SYSTEM_PROMPT,
+                temperature=0.1,
+                response_format={"type": "json_object"}
+            )
+
+            if token_tracker and 'usage' in response:
+                usage = response['usage']
+                token_tracker.log_usage(
+                    model=model,
+                    input_tokens=usage.get('prompt_tokens', 0),
+                    output_tokens=usage.get('completion_tokens', 0),
+                    total_tokens=usage.get('total_tokens', 0),
+                    task_name="business_impact_dnabot_batch"
+                )
+
+            # Schneller Pfad: reines JSON wird in einem Durchgang geparst und validiert;
+            # nur bei Abweichungen (Code-Fences, Begleittext) greift der tolerante Parser
+            try:
+                batch_response = BatchAIResponse.model_validate_json(response['text'])
+            except ValidationError:
+                parsed_dict = parser.extract_and_parse_json(response['text'])
+                batch_response = BatchAIResponse.model_validate(parsed_dict)
+            batch_texts = dict(batch)
+            for item in batch_response.items:
+                if item.item_id in batch_texts:
+                    result = {
+                        "description": item.cleaned_description.strip(),
+                        "business_value": item.business_value.model_dump(),
+                    }
+                    results[item.item_id] = result
+                    _cache_put(_cache_key(batch_texts[item.item_id], model), result)
+
+        except (ValidationError, json.JSONDecodeError) as e:
+            logger.error(f"Validation/JSON Error in process_descriptions_batch: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error in process_descriptions_batch: {e}")
+
+        # Fallback: fehlende Items einzeln verarbeiten
+        for key, description_text in batch:
+            if key not in results:
+                logger.warning(f"Kein Batch-Ergebnis für {key}. Verarbeite die Beschreibung einzeln.")
+                results[key] = process_description(description_text, model, token_tracker, ai_client)
+
+    return results
+
+
+def process_many(items: List[Tuple[str, str]], model: str, token_tracker, ai_client: DnaBotClient,
+                 concurrency: int = MAX_CONCURRENT_REQUESTS) -> Dict[str, dict]:
+    """
+    Analyzes several descriptions with one DnaBot request each, sent concurrently.
+
+    The requests are I/O-bound and share the client's pooled keep-alive session,
+    so a bounded thread pool lets up to `concurrency` requests be in flight at once.
+
+    Args:
+        items: List of (key, description_text) tuples.
+
+    Returns:
+        dict: {key: {"description": ..., "business_value": ...}} for every input key.
+    """
+    if not items:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        results = executor.map(
+            lambda item: process_description(item[1], model, token_tracker, ai_client),
+            items
+        )
+        return {key: result for (key, _), result in zip(items, results)}
+
+
 # --- MAIN EXECUTION BLOCK (CLI) ---
-if __name__ == "__main__":
-    # 1. Argumente parsen
-    parser = argparse.ArgumentParser(description="Extract Business Impact for a specific Jira Issue.")
-    parser.add_argument("--issue", required=True, help="The Jira Issue Key (e.g., BEB2B-1234)")
-    args = parser.parse_args()
+# Parallele Lesezugriffe beim Laden der Issue-Dateien (I/O-gebunden, z.B. OneDrive)
+MAX_FILE_READERS = 16
 
-    issue_key = args.issue
 
-    # 2. Issue-Daten laden
+def _read_issue_json(issue_key: str):
+    """Liest die Issue-Datei; gibt die Daten, None (Datei fehlt) oder die Exception zurück."""
     json_path = os.path.join(JIRA_ISSUES_DIR, f"{issue_key}.json")
-    if not os.path.exists(json_path):
-        print(f"❌ Fehler: Datei nicht gefunden: {json_path}")
-        print(f"   Bitte stellen Sie sicher, dass das Issue '{issue_key}' bereits gescraped wurde.")
-        sys.exit(1)
-
     try:
         with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            return json.load(f)
+    except FileNotFoundError:
+        return None
     except Exception as e:
-        print(f"❌ Fehler beim Lesen der JSON-Datei: {e}")
-        sys.exit(1)
+        return e
+
 
-    # 3. Issue-Typ prüfen
+def _load_issue_description(issue_key: str, data) -> Optional[str]:
+    """Prüft die geladenen Issue-Daten und gibt die Beschreibung oder None (übersprungen) zurück."""
+    if data is None:
+        json_path = os.path.join(JIRA_ISSUES_DIR, f"{issue_key}.json")
+        print(f"❌ Fehler: Datei nicht gefunden: {json_path}")
+        print(f"   Bitte stellen Sie sicher, dass das Issue '{issue_key}' bereits gescraped wurde.")
+        return None
+
+    if isinstance(data, Exception):
+        print(f"❌ Fehler beim Lesen der JSON-Datei: {data}")
+        return None
+
+    # Issue-Typ prüfen
     issue_type = data.get("issue_type")
     valid_types = ["Business Epic", "Business Initiative"]
 
     if issue_type not in valid_types:
         print(f"⚠️  Ignoriert: Issue {issue_key} ist vom Typ '{issue_type}'.")
         print(f"    Erwartet: {', '.join(valid_types)}")
-        sys.exit(0)
+        return None
 
     print(f"✅ Analysiere {issue_type}: {issue_key}")
 
-    # 4. Beschreibung holen
     description = data.get("description", "")
     if not description:
-        print("⚠️  Warnung: Keine Beschreibung im Issue gefunden. Analyse wird leer sein.")
+        print(f"⚠️  Warnung: Keine Beschreibung in {issue_key} gefunden. Analyse wird leer sein.")
+    return description
+
+
+if __name__ == "__main__":
+    # 1. Argumente parsen
+    parser = argparse.ArgumentParser(description="Extract Business Impact for one or more Jira Issues.")
+    parser.add_argument("--issue", "--issues", dest="issue", required=True, nargs='+',
+                        help="One or more Jira Issue Keys, space- or comma-separated (e.g., BEB2B-1234,BEB2B-5678)")
+    args = parser.parse_args()
+    issue_keys = [key for arg in args.issue for key in arg.split(",") if key]
+
+    # 2. Issue-Dateien parallel laden, dann der Reihe nach den Issue-Typ prüfen
+    with ThreadPoolExecutor(max_workers=min(MAX_FILE_READERS, len(issue_keys) or 1)) as executor:
+        issue_data = list(executor.map(_read_issue_json, issue_keys))
+
+    items = []
+    for issue_key, data in zip(issue_keys, issue_data):
+        description = _load_issue_description(issue_key, data)
+        if description is not None:
+            items.append((issue_key, description))
+
+    if not items:
+        sys.exit(0 if len(issue_keys) == 1 else 1)
 
-    # 5. Analyse ausführen
+    # 3. Analyse ausführen
     try:
         client = DnaBotClient()
         tracker = TokenUsage(log_file_path=TOKEN_LOG_FILE)
@@ -205,24 +464,30 @@ if __name__ == "__main__":
         # Modell aus Config oder Fallback
         model = LLM_MODEL_BUSINESS_VALUE if LLM_MODEL_BUSINESS_VALUE else "gpt-oss-120b"
 
-        print(f"   Sende Anfrage an DnaBot ({model})...")
-        result = process_description(description, model, tracker, client)
-
-        # 6. Ergebnis ausgeben
-        bv = result.get("business_value", {})
-        cleaned_desc = result.get("description", "")
-
-        print("\n" + "="*60)
-        print(f"   BUSINESS IMPACT REPORT: {issue_key}")
-        print("="*60)
-
-        print(json.dumps(bv, indent=2, ensure_ascii=False))
-
-        print("\n" + "-"*60)
-        print("   BEREINIGTE BESCHREIBUNG (Vorschau):")
-        print("-"*60)
-        print(cleaned_desc[:300] + "..." if len(cleaned_desc) > 300 else cleaned_desc)
-        print("="*60 + "\n")
+        print(f"   Sende Anfrage(n) an DnaBot ({model})...")
+        if len(items) == 1:
+            issue_key, description = items[0]
+            results = {issue_key: process_description(description, model, tracker, client)}
+        else:
+            results = process_descriptions_batch(items, model, tracker, client)
+
+        # 4. Ergebnisse ausgeben
+        for issue_key, _ in items:
+            result = results.get(issue_key, {})
+            bv = result.get("business_value", {})
+            cleaned_desc = result.get("description", "")
+
+            print("\n" + "="*60)
+            print(f"   BUSINESS IMPACT REPORT: {issue_key}")
+            print("="*60)
+
+            print(json.dumps(bv, indent=2, ensure_ascii=False))
+
+            print("\n" + "-"*60)
+            print("   BEREINIGTE BESCHREIBUNG (Vorschau):")
+            print("-"*60)
+            print(cleaned_desc[:300] + "..." if len(cleaned_desc) > 300 else cleaned_desc)
+            print("="*60 + "\n")
 
     except Exception as e:
         print(f"❌ Fehler bei der Analyse: {e}")
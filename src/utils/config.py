@@ -1,52 +1,77 @@
 import os
+import functools
 from pathlib import Path
 import platform
-from dotenv import load_dotenv, find_dotenv
 
-# Lade Umgebungsvariablen aus der .env-Datei im Projekt-Root
-load_dotenv(find_dotenv())
+
+@functools.lru_cache(maxsize=None)
+def load_env() -> bool:
+    """
+    Lädt die Umgebungsvariablen aus der .env-Datei im Projekt-Root.
+
+    Wird erst von den Modulen aufgerufen, die tatsächlich Umgebungsvariablen
+    lesen, und durchsucht den Verzeichnisbaum nur einmal pro Prozess.
+    python-dotenv wird erst hier importiert, damit der reine Import der
+    Konfiguration keine Zusatzbibliotheken lädt.
+    """
+    from dotenv import load_dotenv, find_dotenv
+    return load_dotenv(find_dotenv())
+
 
 # 1. Finde das Home-Verzeichnis des Benutzers (funktioniert auf Mac & Windows)
 #    (ergibt /Users/A763630 auf macOS oder C:\Users\A763630 auf Windows)
 home_dir = Path.home()
 
-# 2. Definiere den systemspezifischen Teil des Pfades
+# 2. Systemspezifisches OneDrive-Verzeichnis (einzige plattformabhängige Stelle)
 system_name = platform.system()
 
 if system_name == "Darwin":  # "Darwin" ist der Systemname für macOS
-    # Relativer Pfad auf dem Mac
-    relative_path = "Library/CloudStorage/OneDrive-DeutscheTelekomAG/_Dokumente/GitHub/business-epic-analyzer/data"
-    JIRA_ISSUES_DIR = os.path.join(home_dir, "Library/CloudStorage/OneDrive-DeutscheTelekomAG/_Dokumente/GitHub/jira-loader/data/jira_issues")
-    DB_PATH = os.path.join(home_dir, "Library/CloudStorage/OneDrive-DeutscheTelekomAG/_Dokumente/GitHub/jira-loader/data/jira_issues.sqlite")
+    ONEDRIVE_DIR = home_dir / "Library" / "CloudStorage" / "OneDrive-DeutscheTelekomAG"
+else:
+    ONEDRIVE_DIR = home_dir / "OneDrive - Deutsche Telekom AG"
 
-elif system_name == "Windows":
-    # Relativer Pfad auf Windows
-    relative_path = "OneDrive - Deutsche Telekom AG/_Dokumente/GitHub/business-epic-analyzer/data"
-    JIRA_ISSUES_DIR = os.path.join(home_dir, "OneDrive - Deutsche Telekom AG/_Dokumente/GitHub/jira-loader/data/jira_issues")
-    DB_PATH = os.path.join(home_dir, "OneDrive - Deutsche Telekom AG/_Dokumente/GitHub/jira-loader/data/jira_issues.sqlite")
+GITHUB_DIR = ONEDRIVE_DIR / "_Dokumente" / "GitHub"
+JIRA_LOADER_DATA_DIR = GITHUB_DIR / "jira-loader" / "data"
 
-# 3. Setze den vollständigen Pfad zusammen
-#    pathlib verwendet automatisch die korrekten Slashes für das OS
-DATA_DIR = home_dir / relative_path
+# 3. Setze die vollständigen Pfade zusammen
+#    pathlib verwendet automatisch die korrekten Slashes für das OS.
+#    Die exportierten Pfade bleiben Strings, da Aufrufer sie mit os.path kombinieren.
+DATA_DIR = GITHUB_DIR / "business-epic-analyzer" / "data"
+JIRA_ISSUES_DIR = str(JIRA_LOADER_DATA_DIR / "jira_issues")
+DB_PATH = str(JIRA_LOADER_DATA_DIR / "jira_issues.sqlite")
 
 # Data subdirectories
-HTML_REPORTS_DIR = os.path.join(DATA_DIR, 'html_reports')
-ISSUE_TREES_DIR = os.path.join(DATA_DIR, 'issue_trees')
-JSON_SUMMARY_DIR = os.path.join(DATA_DIR, 'json_summary')
-PLOT_DIR = os.path.join(DATA_DIR, 'plots')
-
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-SRC_DIR = os.path.join(BASE_DIR, 'src')
-LOGS_DIR = os.path.join(BASE_DIR, 'logs')
-TEMPLATES_DIR = os.path.join(BASE_DIR, 'templates')
-PROMPTS_DIR = os.path.join(BASE_DIR, 'prompts')
+HTML_REPORTS_DIR = str(DATA_DIR / 'html_reports')
+ISSUE_TREES_DIR = str(DATA_DIR / 'issue_trees')
+JSON_SUMMARY_DIR = str(DATA_DIR / 'json_summary')
+PLOT_DIR = str(DATA_DIR / 'plots')
+
+_BASE_PATH = Path(__file__).resolve().parents[2]
+BASE_DIR = str(_BASE_PATH)
+SRC_DIR = str(_BASE_PATH / 'src')
+LOGS_DIR = str(_BASE_PATH / 'logs')
+TEMPLATES_DIR = str(_BASE_PATH / 'templates')
+PROMPTS_DIR = str(_BASE_PATH / 'prompts')
 
 TOKEN_LOG_FILE = os.path.join(LOGS_DIR, "token_usage.jsonl")
 ISSUE_LOG_FILE = os.path.join(LOGS_DIR, "failed_issues.log")
-
-# Ensure directories exist
-for directory in [LOGS_DIR, JIRA_ISSUES_DIR, HTML_REPORTS_DIR, ISSUE_TREES_DIR, JSON_SUMMARY_DIR]:
-    os.makedirs(directory, exist_ok=True)
+# Gespeicherte Browser-Session (Cookies + localStorage) nach erfolgreichem Jira-Login
+JIRA_SESSION_FILE = os.path.join(LOGS_DIR, ".jira_session.json")
+# Cache der Business-Value-Extraktion (Schlüssel: Hash aus Modell, Prompt und Beschreibung)
+BV_CACHE_FILE = os.path.join(LOGS_DIR, "bv_cache.sqlite")
+# Cache der extrahierten Issue-Daten (Schlüssel: Issue-Key, gültig solange sich Jiras 'updated' nicht ändert)
+ISSUE_EXTRACT_CACHE_FILE = os.path.join(LOGS_DIR, "issue_extract_cache.sqlite")
+# Zwischengespeicherter DnaBot-Access-Token, damit aufeinanderfolgende CLI-Läufe ihn wiederverwenden
+DNABOT_TOKEN_CACHE_FILE = str(home_dir / ".cache" / "dnabot_token.json")
+
+@functools.lru_cache(maxsize=None)
+def ensure_dirs() -> None:
+    """
+    Legt die Arbeitsverzeichnisse an. Wird einmalig von den Einstiegspunkten
+    aufgerufen statt bei jedem Import der Konfiguration.
+    """
+    for directory in (LOGS_DIR, JIRA_ISSUES_DIR, HTML_REPORTS_DIR, ISSUE_TREES_DIR, JSON_SUMMARY_DIR):
+        os.makedirs(directory, exist_ok=True)
 
 # Template file
 EPIC_HTML_TEMPLATE = os.path.join(TEMPLATES_DIR, 'epic-html_template.html')
@@ -2,7 +2,7 @@
 Modul zur Extraktion strukturierter Daten von JIRA-Issue-Webseiten.
 
 Dieses Modul bietet die Funktionalität, Daten von JIRA-Webseiten mittels
-Selenium zu parsen und zu extrahieren. Es ist darauf ausgelegt, eine Vielzahl
+Selenium zu laden und mit lxml zu parsen und zu extrahieren. Es ist darauf ausgelegt, eine Vielzahl
 von Feldern und Beziehungen aus JIRA-Issues zu verarbeiten, darunter Titel,
 Beschreibungen, Status, Verantwortliche, Story Points, Akzeptanzkriterien,
 Anhänge sowie verschiedene Arten von Issue-Verknüpfungen.
@@ -16,13 +16,220 @@ in einer einzigen, konsistenten Liste namens `issue_links`.
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from bs4 import BeautifulSoup
+import copy
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import requests
+import lxml.html
+from lxml import etree
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
 from utils.logger_config import logger
+from utils.config import ISSUE_EXTRACT_CACHE_FILE
+
+
+# Bei Änderungen an der Extraktionslogik erhöhen, damit alte Cache-Einträge ungültig werden
+EXTRACTOR_VERSION = 4
+
+# Timeout (Sekunden) für REST-Aufrufe an Jira
+REST_TIMEOUT = 30
+
+# Issue-Typen, deren Kinder über das Feld "Parent Link" verknüpft sind (wie im JiraApiLoader)
+PARENT_LINK_TYPES = ['Business Initiative', 'Business Epic', 'Portfolio Epic', 'Initiative']
+# Issue-Typen mit dem nachgeladenen "Issues in epic"-Panel (Kinder über "Epic Link")
+EPIC_PANEL_TYPES = ['Epic']
+
+# Vorkompilierte reguläre Ausdrücke
+_BROWSE_KEY_RE = re.compile(r'/browse/([A-Z][A-Z0-9]*-\d+)')
+_EPIC_KEY_RE = re.compile(r'([A-Z]+-\d+)')
+
+def _has_class(name: str) -> str:
+    """XPath-Prädikat für eine exakte CSS-Klasse (wie `.name` in CSS, nicht als Teilstring)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Vorkompilierte XPath-Ausdrücke: werden einmal beim Import übersetzt und für
+# alle Issues wiederverwendet (Parameter wie $id werden beim Aufruf übergeben).
+_XP = {
+    # Metadaten
+    "title": etree.XPath("//div[@id='summary-val']/h2"),
+    "issue_type": etree.XPath("//span[@id='type-val']"),
+    "status": etree.XPath(
+        "//a[contains(@class, 'aui-dropdown2-trigger') and contains(@class, 'opsbar-transitions__status-category_')]"
+        "//span[@class='dropdown-text']"),
+    "assignee": etree.XPath("//span[contains(@id, 'assignee') or contains(@class, 'assignee')]"),
+    "priority": etree.XPath("//span[@id='priority-val']"),
+    "resolution": etree.XPath("//span[@id='resolution-val']"),
+    "story_points": etree.XPath("//strong[@title='Story Points']/following-sibling::div[1]"),
+    "story_points_by_label": etree.XPath(
+        "//strong/label[contains(text(), 'Story Points')]/ancestor::strong/following-sibling::div[1]"),
+    "input": etree.XPath(".//input"),
+    "target_start": etree.XPath("//span[@data-name='Target start']//time[@datetime]"),
+    "target_end": etree.XPath("//span[@data-name='Target end']//time[@datetime]"),
+    "fix_versions": etree.XPath("//span[@id='fixVersions-field']//a[contains(@href, '/issues/')]"),
+    "components": etree.XPath("//span[@id='components-val']//a[contains(@href, '/issues/')]"),
+    "labels_container": etree.XPath(f"//div[{_has_class('labels-wrap')}]"),
+    "label_links": etree.XPath(f".//a[{_has_class('lozenge')}]"),
+    # Beschreibung, Business Scope und Acceptance Criteria
+    "description": etree.XPath("//div[contains(@id, 'description-val')]"),
+    "business_scope": etree.XPath("//strong[contains(., 'Business Scope')]/following-sibling::div[1]"),
+    "flooded_divs": etree.XPath(f".//div[{_has_class('flooded')}]"),
+    "ac_label": etree.XPath("//label[text()='Acceptance Criteria:']"),
+    "element_by_id": etree.XPath("//div[@id=$id]"),
+    "nutzen_panel": etree.XPath(".//div[contains(., 'Business Epic Nutzenstatement')]"),
+    "ac_header": etree.XPath(".//*[self::b or self::strong][contains(., 'In Scope / Akzeptanzkriterien')]"),
+    "parent_panel": etree.XPath(f"./ancestor::div[{_has_class('panel')}][1]"),
+    "panel_content": etree.XPath(f".//div[{_has_class('panelContent')}]"),
+    "list_items": etree.XPath(".//*[self::p or self::li]"),
+    "bv_header": etree.XPath(".//h3[contains(., 'Business Value / Cost of Delay')]"),
+    "bv_sub_headers": etree.XPath(
+        ".//p[contains(., 'Business Impact') or contains(., 'Strategic Enablement/Risk Reduktion')"
+        " or contains(., 'Time Criticality')]"),
+    "bv_table_wrap": etree.XPath(f"./following-sibling::div[{_has_class('table-wrap')}][1]"),
+    "bv_row_cells": etree.XPath("((.//table)[1]//tr)[$row]//*[self::td or self::th]"),
+    # Anhänge
+    "attachments": etree.XPath(
+        f"//ol[@id='attachment_thumbnails' and {_has_class('item-attachments')}]"
+        f"//li[{_has_class('attachment-content')}]"),
+    "attachment_size": etree.XPath(f".//dd[{_has_class('attachment-size')}]"),
+    "attachment_date": etree.XPath(".//time[@datetime]"),
+    # Verknüpfte Issues
+    "realized_by": etree.XPath(
+        f"//dl[{_has_class('links-list')}]/dt[contains(text(), 'is realized by') or @title='is realized by']"
+        f"/..//div[{_has_class('link-content')}]"),
+    "link_issue": etree.XPath(f".//a[{_has_class('issue-link')}]"),
+    "link_summary": etree.XPath(f".//span[{_has_class('link-summary')}]"),
+    "child_links": etree.XPath(f"//table[{_has_class('jpo-child-issue-table')}]//a[contains(@href, '/browse/')]"),
+    "row_cells": etree.XPath("./ancestor::tr[1]/td"),
+    "epic_issue_rows": etree.XPath(f"//*[@id='ghx-issues-in-epic-table']//tr[{_has_class('issuerow')}]"),
+    "epic_issue_summary": etree.XPath(f".//td[{_has_class('ghx-summary')}]"),
+    "link_by_href": etree.XPath(".//a[@href=$href]"),
+    # Aktivitätsstrom (Verlauf)
+    "action_details": etree.XPath(f".//div[{_has_class('action-details')}]"),
+    "action_meta": etree.XPath(f".//a[{_has_class('user-hover')}] | .//time[{_has_class('livestamp')}]"),
+    # Nur Zeilen des ersten action-body, die überhaupt eine Feldbezeichnung enthalten
+    "activity_rows": etree.XPath(
+        f"(.//div[{_has_class('action-body')}])[1]//tr[.//td[{_has_class('activity-name')}]]"),
+    "activity_cells": etree.XPath(
+        f".//td[{_has_class('activity-name')} or {_has_class('activity-old-val')} or {_has_class('activity-new-val')}]"),
+}
+
+
+# --- Persistenter Cache der extrahierten Issue-Daten ---
+_cache_lock = threading.Lock()
+_cache_conn: sqlite3.Connection | None = None
+
+
+def _get_cache_conn() -> sqlite3.Connection | None:
+    """Öffnet den SQLite-Cache beim ersten Zugriff; gibt None zurück, wenn er nicht verfügbar ist."""
+    global _cache_conn
+    if _cache_conn is None:
+        try:
+            os.makedirs(os.path.dirname(ISSUE_EXTRACT_CACHE_FILE), exist_ok=True)
+            conn = sqlite3.connect(ISSUE_EXTRACT_CACHE_FILE, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS issue_cache "
+                "(issue_key TEXT PRIMARY KEY, updated TEXT NOT NULL, version INTEGER NOT NULL, value TEXT NOT NULL)"
+            )
+            conn.commit()
+            _cache_conn = conn
+        except sqlite3.Error as e:
+            logger.warning(f"Issue-Cache nicht verfügbar ({ISSUE_EXTRACT_CACHE_FILE}): {e}")
+            return None
+    return _cache_conn
+
+
+def _cache_get(issue_key: str, updated: str) -> dict | None:
+    """Gibt die gecachten Daten zurück, sofern sie zum aktuellen 'updated'-Zeitstempel passen."""
+    with _cache_lock:
+        conn = _get_cache_conn()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT value FROM issue_cache WHERE issue_key = ? AND updated = ? AND version = ?",
+                (issue_key, updated, EXTRACTOR_VERSION)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Lesen aus dem Issue-Cache fehlgeschlagen: {e}")
+            return None
+    return json.loads(row[0]) if row else None
+
+
+def _cache_put(issue_key: str, updated: str, data: dict) -> None:
+    """Speichert die extrahierten Daten eines Issues zusammen mit seinem 'updated'-Zeitstempel."""
+    value = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    with _cache_lock:
+        conn = _get_cache_conn()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO issue_cache (issue_key, updated, version, value) VALUES (?, ?, ?, ?)",
+                (issue_key, updated, EXTRACTOR_VERSION, value)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Schreiben in den Issue-Cache fehlgeschlagen: {e}")
+
+
+# --- Bereinigung der Werte im Aktivitätsstrom ---
+def _strip_prefix_and_id(value: str) -> str:
+    """Bereinigt Werte wie "Prefix:Value[...id...]" zu "Value"."""
+    return value.split(':')[-1].split('[')[0].strip() if value else value
+
+
+def _issue_key_from(raw: str) -> str:
+    """Liefert den Issue-Key aus `raw`; ist `raw` bereits ein reiner Key, ohne Regex."""
+    project, sep, number = raw.partition('-')
+    if (sep and project.isascii() and project.isalpha() and project.isupper()
+            and number.isascii() and number.isdigit()):
+        return raw
+    match = _EPIC_KEY_RE.search(raw)
+    return match.group(1) if match else raw
+
+
+def _activity_issue_keys(old_raw: str, new_raw: str) -> tuple:
+    """Reduziert 'Epic Child'/'Epic Link'-Werte auf den Issue-Key."""
+    return _issue_key_from(old_raw), _issue_key_from(new_raw)
+
+
+def _activity_name_only(old_raw: str, new_raw: str) -> tuple:
+    """Entfernt Präfix und ID (z.B. bei 'Sprint')."""
+    return _strip_prefix_and_id(old_raw), _strip_prefix_and_id(new_raw)
+
+
+def _activity_status(old_raw: str, new_raw: str) -> tuple:
+    """Wie `_activity_name_only`, zusätzlich in Großbuchstaben."""
+    old_value, new_value = _activity_name_only(old_raw, new_raw)
+    return old_value.upper(), new_value.upper()
+
+
+def _activity_truncated(old_raw: str, new_raw: str) -> tuple:
+    """Lange Texte werden nur als '[...]' vermerkt."""
+    return old_raw, '[...]' if new_raw else ''
+
+
+# Felder, die im Aktivitätsstrom nicht ausgewertet werden
+_IGNORED_ACTIVITY_FIELDS = frozenset({'Checklists', 'Remote Link', 'Link', 'Kommentar oder Erstellung'})
+
+_ACTIVITY_HANDLERS = {
+    'Epic Child': _activity_issue_keys,
+    'Epic Link': _activity_issue_keys,
+    'Status': _activity_status,
+    'Sprint': _activity_name_only,
+    'Fix Version/s': _activity_name_only,
+    'Acceptance Criteria': _activity_truncated,
+    'Description': _activity_truncated,
+}
 
 
 class DataExtractor:
@@ -74,7 +281,37 @@ class DataExtractor:
         self.azure_client = azure_client
 
 
-    def _extract_story_points(self, driver):
+    @staticmethod
+    def _text(elem) -> str:
+        """
+        Gibt den Text eines lxml-Elements mit zusammengefassten Leerzeichen zurück
+        (entspricht `WebElement.text` bei einzeiligen Feldern).
+        """
+        return " ".join(elem.text_content().split())
+
+
+    @staticmethod
+    def _block_text(elem) -> str:
+        """Gibt den Text eines lxml-Elements zeilenweise zurück (leere Zeilen entfallen)."""
+        return "\n".join(t.strip() for t in elem.itertext() if t.strip())
+
+
+    @staticmethod
+    def _inline_text(elem) -> str:
+        """
+        Gibt die getrimmten Textstücke eines lxml-Elements ohne Trenner verbunden zurück
+        (entspricht `get_text(strip=True)` in BeautifulSoup).
+        """
+        return "".join(t.strip() for t in elem.itertext())
+
+
+    @staticmethod
+    def _href(elem) -> str:
+        """Gibt das href-Attribut als absolute URL zurück (wie `get_attribute('href')` in Selenium)."""
+        return urljoin(elem.base_url or "", elem.get("href", ""))
+
+
+    def _extract_story_points(self, tree):
         """
         Extrahiert die Story Points von der Seite mit mehreren Fallback-Strategien.
 
@@ -83,40 +320,35 @@ class DataExtractor:
         dem sichtbaren Label-Text sucht. Innerhalb beider Strategien wird geprüft,
         ob der Wert in einem <input>-Feld oder als reiner Text vorliegt.
         """
-        try:
-            # PRIMÄRE STRATEGIE: Suche via @title='Story Points'
-            value_container = driver.find_element(By.XPATH, "//strong[@title='Story Points']/following-sibling::div[1]")
-        except NoSuchElementException:
-            try:
-                # FALLBACK-STRATEGIE: Suche via <label>-Text
-                value_container = driver.find_element(By.XPATH, "//strong/label[contains(text(), 'Story Points')]/ancestor::strong/following-sibling::div[1]")
-            except NoSuchElementException:
-                # Wenn beide Strategien fehlschlagen, existiert das Feld nicht.
-                return "n/a"
-
-        # Wenn ein value_container gefunden wurde, extrahiere den Wert.
-        try:
-            # Prüfe, ob sich der Wert in einem <input>-Feld befindet
-            input_element = value_container.find_element(By.TAG_NAME, "input")
-            return input_element.get_attribute("value")
-        except NoSuchElementException:
-            # Wenn kein <input>, nimm den sichtbaren Text des Containers
-            return value_container.text.strip()
+        # PRIMÄRE STRATEGIE: Suche via @title='Story Points'
+        # FALLBACK-STRATEGIE: Suche via <label>-Text
+        value_containers = (
+            _XP["story_points"](tree)
+            or _XP["story_points_by_label"](tree)
+        )
+        if not value_containers:
+            # Wenn beide Strategien fehlschlagen, existiert das Feld nicht.
+            return "n/a"
+
+        value_container = value_containers[0]
+        # Prüfe, ob sich der Wert in einem <input>-Feld befindet
+        input_elements = _XP["input"](value_container)
+        if input_elements:
+            return input_elements[0].get("value")
+        # Wenn kein <input>, nimm den sichtbaren Text des Containers
+        return DataExtractor._text(value_container)
 
 
     @staticmethod
-    def _find_child_issues(driver):
+    def _find_child_issues(tree):
         """
         Sucht nach Child Issues in der dedizierten Tabelle auf der Seite.
         """
         child_issues = []
 
         try:
-            # Suche nach der Child-Issue-Tabelle
-            child_table = driver.find_element(By.XPATH, "//table[contains(@class, 'jpo-child-issue-table')]")
-
-            # Finde alle Links in der Tabelle
-            child_links = child_table.find_elements(By.XPATH, ".//a[contains(@href, '/browse/')]")
+            # Suche nach der Child-Issue-Tabelle und allen Links darin
+            child_links = _XP["child_links"](tree)
 
             if child_links:
                 logger.info(f"Gefunden: {len(child_links)} Child Issues")
@@ -124,10 +356,10 @@ class DataExtractor:
                 # Verarbeite jeden Child-Issue-Link
                 for child_link in child_links:
                     # Extrahiere die URL, die den verlässlichen Key enthält
-                    child_href = child_link.get_attribute("href")
+                    child_href = DataExtractor._href(child_link)
 
                     # Extrahiere den Key direkt aus der URL anstatt aus dem sichtbaren Text
-                    match = re.search(r'/browse/([A-Z][A-Z0-9]*-\d+)', child_href)
+                    match = _BROWSE_KEY_RE.search(child_href)
                     if not match:
                         continue
 
@@ -137,21 +369,9 @@ class DataExtractor:
                     logger.info(f"Child Issue gefunden: {child_key}")
 
                     # Versuche, den Summary-Text zu finden (falls vorhanden)
-                    try:
-                        # Finde das übergeordnete tr-Element
-                        parent_row = child_link.find_element(By.XPATH, "./ancestor::tr")
-
-                        # Suche nach der Zelle mit der Zusammenfassung (normalerweise die 2. oder 3. Zelle)
-                        summary_cells = parent_row.find_elements(By.XPATH, "./td")
-                        summary_text = ""
-
-                        if len(summary_cells) >= 2:
-                            # Die 2. Zelle enthält oft die Zusammenfassung
-                            summary_text = summary_cells[1].text.strip()
-
-                    except Exception as e:
-                        summary_text = ""
-                        logger.debug(f"Konnte Summary für Child Issue {child_key} nicht extrahieren")
+                    # Die 2. Zelle der übergeordneten Zeile enthält oft die Zusammenfassung
+                    summary_cells = _XP["row_cells"](child_link)
+                    summary_text = DataExtractor._text(summary_cells[1]) if len(summary_cells) >= 2 else ""
 
                     # Füge die Informationen zur child_issues-Liste hinzu
                     child_issue_item = {
@@ -162,6 +382,8 @@ class DataExtractor:
                     }
 
                     child_issues.append(child_issue_item)
+            else:
+                logger.info(f"Keine Child Issues gefunden")
 
         except Exception as e:
             logger.info(f"Keine Child Issues gefunden")
@@ -170,53 +392,43 @@ class DataExtractor:
 
 
     @staticmethod
-    def _extract_business_scope(driver):
+    def _extract_business_scope(tree):
         """
         Extrahiert den "Business Scope"-Text aus der Jira-Seite.
 
         Implementiert mehrere Fallback-Mechanismen, um den Text auch aus
         komplexeren HTML-Strukturen (z.B. 'flooded' divs) zuverlässig zu
-        extrahieren. Diese Version ist korrigiert, um das Feld basierend auf
-        seinem sichtbaren Label-Text anstatt eines 'title'-Attributs zu finden.
+        extrahieren. Das Feld wird anhand seines sichtbaren Label-Textes
+        anstatt eines 'title'-Attributs gefunden.
         """
         business_scope = ""
 
         try:
-            # --- KORREKTUR START ---
-            # Der neue XPath sucht nach einem <strong>-Tag, das den Text "Business Scope"
-            # enthält, und wählt dann das direkt folgende <div>-Geschwisterelement aus.
+            # Sucht nach einem <strong>-Tag, das den Text "Business Scope" enthält,
+            # und wählt dann das direkt folgende <div>-Geschwisterelement aus.
             # Dies ist robuster als die Suche nach einem 'title'-Attribut oder einer 'for'-ID.
-            business_scope_div = driver.find_element(By.XPATH,
-                "//strong[contains(., 'Business Scope')]/following-sibling::div[1]")
-            # --- KORREKTUR ENDE ---
-
+            business_scope_divs = _XP["business_scope"](tree)
+            if not business_scope_divs:
+                logger.info(f"Business Scope konnte nicht extrahiert werden")
+                return business_scope
+            business_scope_div = business_scope_divs[0]
 
             # Robustere Extraktion des Textes - versuche verschiedene Wege
             # 1. Versuche zuerst, direkt den Text zu holen
-            business_scope = business_scope_div.text.strip()
+            business_scope = DataExtractor._block_text(business_scope_div)
 
             # 2. Wenn der Text leer ist, versuche es mit flooded divs
             if not business_scope:
-                # Suche nach allen div-Elementen mit Klasse 'flooded' innerhalb des Haupt-divs
-                flooded_divs = business_scope_div.find_elements(By.XPATH, ".//div[contains(@class, 'flooded')]")
-
-                # Sammle den Text aus allen gefundenen Elementen
-                texts = []
-                for div in flooded_divs:
-                    div_text = div.text.strip()
-                    if div_text:
-                        texts.append(div_text)
+                # Sammle den Text aus allen div-Elementen mit Klasse 'flooded' innerhalb des Haupt-divs
+                flooded_divs = _XP["flooded_divs"](business_scope_div)
+                texts = [text for div in flooded_divs if (text := DataExtractor._block_text(div))]
 
                 # Füge alle gefundenen Texte zusammen
                 business_scope = "\n".join(texts)
 
-            # Wenn immer noch leer, extrahiere den HTML-Inhalt und versuche es manuell zu parsen
+            # Wenn immer noch leer, den gesamten Textinhalt mit zusammengefassten Leerzeichen nehmen
             if not business_scope:
-                html_content = business_scope_div.get_attribute('innerHTML')
-                # Entferne HTML-Tags mit einem einfachen Ansatz (für komplexere Fälle könnte BeautifulSoup verwendet werden)
-                import re
-                business_scope = re.sub(r'<[^>]*>', ' ', html_content)
-                business_scope = re.sub(r'\s+', ' ', business_scope).strip()
+                business_scope = " ".join(business_scope_div.text_content().split())
 
             if business_scope:
                 logger.info(f"Business Scope gefunden: {business_scope[:50]}...")
@@ -230,69 +442,77 @@ class DataExtractor:
 
 
     @staticmethod
-    def _extract_business_value_from_table(soup: BeautifulSoup) -> dict | None:
+    def _extract_business_value_from_table(desc_root) -> dict | None:
         """
         Extrahiert den Business Value direkt aus den HTML-Tabellen in der Beschreibung.
-        (Finale, robuste Version mit korrekter Sub-Header-Suche)
+        Arbeitet auf dem lxml-Element der Beschreibung und entfernt die gefundenen
+        Business-Value-Knoten daraus.
         """
         try:
             # Schritt 1: Finden der Überschrift (Anker)
-            bv_header = soup.find(lambda tag: tag.name == 'h3' and 'Business Value / Cost of Delay' in tag.get_text())
+            bv_headers = _XP["bv_header"](desc_root)
+
+            if not bv_headers:
+                return None
+
+            # Alle drei Unterüberschriften in einem Durchlauf finden; je Abschnitt zählt die erste
+            sub_headers = {}
+            for p in _XP["bv_sub_headers"](desc_root):
+                p_text = p.text_content()
+                for label in ('Business Impact', 'Strategic Enablement/Risk Reduktion', 'Time Criticality'):
+                    if label in p_text:
+                        sub_headers.setdefault(label, p)
 
-            if not bv_header:
+            if len(sub_headers) < 3:
                 return None
+            impact_header = sub_headers['Business Impact']
+            strategy_header = sub_headers['Strategic Enablement/Risk Reduktion']
+            time_header = sub_headers['Time Criticality']
 
             # Schritt 2: Verarbeiten der Tabelleninhalte
-            # Hilfsfunktion für sauberen Text
-            def get_cell_text(table, row_idx, col_idx, table_name):
-                try:
-                    cell = table.find_all('tr')[row_idx].find_all(['td', 'th'])[col_idx]
-                    text = cell.get_text(separator='\n', strip=True)
-                    return text
-                except IndexError:
-                    return ""
+            impact_wrap = _XP["bv_table_wrap"](impact_header)[0]
+            strategy_wrap = _XP["bv_table_wrap"](strategy_header)[0]
+            time_wrap = _XP["bv_table_wrap"](time_header)[0]
 
-            impact_header = soup.find(lambda tag: tag.name == 'p' and 'Business Impact' in tag.get_text())
-            strategy_header = soup.find(lambda tag: tag.name == 'p' and 'Strategic Enablement/Risk Reduktion' in tag.get_text())
-            time_header = soup.find(lambda tag: tag.name == 'p' and 'Time Criticality' in tag.get_text())
+            # Hilfsfunktion für sauberen Text
+            def get_cell_texts(table_wrap):
+                # Zellen der zweiten Tabellenzeile (erste Zeile sind die Spaltenköpfe)
+                return [DataExtractor._block_text(cell) for cell in _XP["bv_row_cells"](table_wrap, row=2)]
 
-            if not (impact_header and strategy_header and time_header):
-                return None
+            def cell(cells, col_idx):
+                return cells[col_idx] if col_idx < len(cells) else ""
 
-            impact_table = impact_header.find_next_sibling('div', class_='table-wrap').find('table')
-            strategy_table = strategy_header.find_next_sibling('div', class_='table-wrap').find('table')
-            time_table = time_header.find_next_sibling('div', class_='table-wrap').find('table')
+            impact_cells = get_cell_texts(impact_wrap)
+            strategy_cells = get_cell_texts(strategy_wrap)
+            time_cells = get_cell_texts(time_wrap)
 
             # Verarbeitung der einzelnen Tabellen
             business_impact = {
-                "scale": int(get_cell_text(impact_table, 1, 0, "Business Impact") or 0),
-                "revenue": get_cell_text(impact_table, 1, 1, "Business Impact"),
+                "scale": int(cell(impact_cells, 0) or 0),
+                "revenue": cell(impact_cells, 1),
                 "cost_saving": "",
-                "risk_loss": get_cell_text(impact_table, 1, 2, "Business Impact"),
-                "justification": get_cell_text(impact_table, 1, 3, "Business Impact")
+                "risk_loss": cell(impact_cells, 2),
+                "justification": cell(impact_cells, 3)
             }
             strategic_enablement = {
-                "scale": int(get_cell_text(strategy_table, 1, 0, "Strategic Enablement") or 0),
-                "risk_minimization": get_cell_text(strategy_table, 1, 1, "Strategic Enablement"),
-                "strat_enablement": get_cell_text(strategy_table, 1, 2, "Strategic Enablement"),
-                "justification": get_cell_text(strategy_table, 1, 3, "Strategic Enablement")
+                "scale": int(cell(strategy_cells, 0) or 0),
+                "risk_minimization": cell(strategy_cells, 1),
+                "strat_enablement": cell(strategy_cells, 2),
+                "justification": cell(strategy_cells, 3)
             }
             time_criticality = {
-                "scale": int(get_cell_text(time_table, 1, 0, "Time Criticality") or 0),
-                "time": get_cell_text(time_table, 1, 1, "Time Criticality"),
-                "justification": get_cell_text(time_table, 1, 2, "Time Criticality")
+                "scale": int(cell(time_cells, 0) or 0),
+                "time": cell(time_cells, 1),
+                "justification": cell(time_cells, 2)
             }
 
             logger.info("-> Business Value Tabelleninhalte erfolgreich verarbeitet.")
 
             # Schritt 3: Bereinigung der Beschreibung
-            bv_header.extract()
-            impact_header.find_next_sibling('div', class_='table-wrap').extract()
-            strategy_header.find_next_sibling('div', class_='table-wrap').extract()
-            time_header.find_next_sibling('div', class_='table-wrap').extract()
-            impact_header.extract()
-            strategy_header.extract()
-            time_header.extract()
+            # dict.fromkeys: ein Knoten kann mehreren Abschnitten zugeordnet sein, aber nur einmal entfernt werden
+            for node in dict.fromkeys((bv_headers[0], impact_wrap, strategy_wrap, time_wrap,
+                                       impact_header, strategy_header, time_header)):
+                node.drop_tree()
 
             return {
                 "business_impact": business_impact,
@@ -305,10 +525,152 @@ class DataExtractor:
             return None
 
 
+    @staticmethod
+    def _append_business_scope(data, business_scope):
+        """Hängt den Business Scope an die Beschreibung in `data` an."""
+        if business_scope:
+            if data["description"]:
+                data["description"] += "\n\nBusiness Scope:\n" + business_scope
+            else:
+                data["description"] = "Business Scope:\n" + business_scope
+            logger.info(f"Business Scope zur Description hinzugefügt ({len(business_scope)} Zeichen)")
+
+
+    @staticmethod
+    def _find_acceptance_field(tree):
+        """Sucht das dedizierte 'Acceptance Criteria'-Feld über sein Label; gibt None zurück, wenn es fehlt."""
+        label_elems = _XP["ac_label"](tree)
+        if not label_elems:
+            return None
+        fields = _XP["element_by_id"](tree, id=f"{label_elems[0].get('for')}-val")
+        return fields[0] if fields else None
+
+
+    @staticmethod
+    def _criteria_from(container) -> list:
+        """
+        Liest die Akzeptanzkriterien (<p>- und <li>-Einträge) aus einem lxml-Element
+        und filtert den Standard-Platzhaltertext heraus.
+        """
+        placeholder_text = "In Scope/Akzeptanzkriterien: siehe Ausfüllhilfe"
+        return [
+            text for item in _XP["list_items"](container)
+            if (text := DataExtractor._inline_text(item))
+            and placeholder_text not in item.text_content()
+        ]
+
+
+    def _extract_description_fields(self, data, desc_elem, acceptance_field):
+        """
+        Füllt Beschreibung, Business Value und Akzeptanzkriterien in `data`.
+
+        Wird sowohl für die gerenderte Issue-Seite als auch für die
+        `renderedFields` der REST-API verwendet. Der KI-Fallback wird hier nicht
+        ausgeführt: Ist er nötig, wird der Beschreibungstext zurückgegeben und von
+        `_apply_description_processor` verarbeitet.
+
+        Args:
+            data (dict): Das zu befüllende Issue-Dictionary (`issue_type` muss gesetzt sein).
+            desc_elem: lxml-Element mit dem Beschreibungs-HTML.
+            acceptance_field: lxml-Element des 'Acceptance Criteria'-Felds oder None.
+
+        Returns:
+            str | None: Der Beschreibungstext für den KI-Fallback oder None.
+        """
+        ai_input = None
+        # Kopie, da die Business-Value-Knoten beim Parsen aus der Beschreibung entfernt werden
+        desc_root = copy.deepcopy(desc_elem)
+
+        # Versuche, den Business Value direkt aus der Tabelle zu extrahieren
+        extracted_bv = self._extract_business_value_from_table(desc_root)
+
+        if extracted_bv:
+            # "Wenn-Ja"-Pfad: Tabelle wurde gefunden und geparst
+            data["business_value"] = extracted_bv
+            logger.info("Business Value direkt aus HTML-Tabelle extrahiert.")
+
+            # NEUE LOGIK: Suche gezielt nach dem "Nutzenstatement"-Panel
+            nutzen_panels = _XP["nutzen_panel"](desc_root)
+            if nutzen_panels:
+                panel_contents = _XP["panel_content"](nutzen_panels[0])
+                if panel_contents:
+                    data["description"] = self._block_text(panel_contents[0])
+                    logger.info("Nutzenstatement wurde als Beschreibung extrahiert.")
+            else:
+                logger.warning("Kein 'Nutzenstatement'-Panel gefunden. Beschreibung könnte unvollständig sein.")
+                data["description"] = self._block_text(desc_root)
+        else:
+            # "Wenn-Nein"-Pfad (Fallback zur KI)
+            logger.info("Keine strukturierte Business-Value-Tabelle gefunden. Nutze KI-Fallback.")
+            full_description_text = self._block_text(desc_elem)
+            data["description"] = full_description_text
+            if data["issue_type"] == 'Business Epic':
+                ai_input = full_description_text
+
+        # --- NEUE LOGIK FÜR ACCEPTANCE CRITERIA ---
+        # Zuerst das dedizierte Feld durchsuchen
+        try:
+            if acceptance_field is None:
+                raise LookupError("Kein 'Acceptance Criteria'-Feld vorhanden")
+            # Extrahiere die Kriterien und filtere den Standard-Platzhaltertext heraus
+            criteria_list = self._criteria_from(acceptance_field)
+
+            if criteria_list:
+                data["acceptance_criteria"].extend(criteria_list)
+                logger.info(f"{len(criteria_list)} Acceptance Criteria aus dem dedizierten Feld extrahiert und bereinigt.")
+        except Exception:
+             logger.info("Dediziertes 'Acceptance Criteria'-Feld nicht gefunden oder leer.")
+
+        # Wenn das dedizierte Feld leer war, suche im Beschreibungs-Panel
+        if not data["acceptance_criteria"]:
+            logger.info("Suche nach Akzeptanzkriterien als Fallback im Beschreibungstext...")
+            # Finde den spezifischen Header-Tag (<b> oder <strong>), um die Suche einzugrenzen
+            ac_headers = _XP["ac_header"](desc_root)
+
+            if ac_headers:
+                # Navigiere vom Header zum übergeordneten Panel-Container
+                ac_panels = _XP["parent_panel"](ac_headers[0])
+                if ac_panels:
+                    panel_contents = _XP["panel_content"](ac_panels[0])
+                    if panel_contents:
+                        # Extrahiere die Kriterien und filtere den Standard-Platzhaltertext heraus
+                        criteria_list = self._criteria_from(panel_contents[0])
+
+                        if criteria_list:
+                            data["acceptance_criteria"].extend(criteria_list)
+                            logger.info(f"{len(criteria_list)} Acceptance Criteria aus dem 'In Scope'-Panel extrahiert und bereinigt.")
+        # --- ENDE NEUE LOGIK FÜR ACCEPTANCE CRITERIA ---
+
+        return ai_input
+
+
+    def _apply_description_processor(self, data, full_description_text):
+        """
+        KI-Fallback für Business Epics ohne Business-Value-Tabelle: trennt Business
+        Value und Beschreibung per `description_processor` (sofern gesetzt).
+        """
+        if not self.description_processor:
+            return
+        try:
+            processed_text = self.description_processor(
+                full_description_text, self.model, self.token_tracker, self.azure_client
+            )
+            data["description"] = processed_text.get('description', full_description_text)
+            data["business_value"] = processed_text.get('business_value', {})
+            logger.info("Business Value per KI-Aufruf extrahiert und Beschreibung bereinigt.")
+        except Exception as bv_error:
+            logger.error(f"Fehler bei der Verarbeitung des Business Value via KI: {bv_error}")
+            data["description"] = full_description_text
+
+
     def extract_issue_data(self, driver, issue_key):
         """
         Extrahiert umfassende Daten eines Jira-Issues in ein strukturiertes Format.
         (Finale Version mit korrekter Extraktion von Business Value UND Nutzenstatement)
+
+        Der Seiteninhalt wird einmalig über `driver.page_source` abgerufen und
+        lokal mit lxml ausgewertet, statt jedes Feld per WebDriver-Befehl
+        (je ein HTTP-Roundtrip zum Browser) einzeln abzufragen.
         """
         data = {
             "key": issue_key,
@@ -331,263 +693,182 @@ class DataExtractor:
             "attachments": [],
         }
 
-        # Title
-        try:
-            title_elem = driver.find_element(By.XPATH, "//div[@id='summary-val']/h2")
-            data["title"] = title_elem.text.strip()
-            logger.info(f"Titel gefunden: {data['title']}")
-        except Exception as e:
-            logger.info(f"Titel nicht gefunden: {e}")
+        # Ein einziger WebDriver-Aufruf für den gesamten DOM-Snapshot
+        tree = lxml.html.fromstring(driver.page_source, base_url=driver.current_url)
 
-        # Issue Type (muss vor der Description-Logik extrahiert werden)
-        try:
-            issue_type_container = driver.find_element(By.XPATH, "//span[@id='type-val']")
-            data["issue_type"] = issue_type_container.text.strip()
+        # Issue Type (muss vor der Description-Logik und dem Epic-Panel extrahiert werden)
+        issue_type_elems = _XP["issue_type"](tree)
+        if issue_type_elems:
+            data["issue_type"] = self._text(issue_type_elems[0])
             logger.info(f"Issue Type gefunden: {data['issue_type']}")
-        except Exception as e:
-            logger.error(f"Issue Type konnte nicht extrahiert werden: {e}")
-
-        # --- START DER FINALEN LOGIK FÜR DESCRIPTION & BUSINESS VALUE ---
-        try:
-            desc_elem = driver.find_element(By.XPATH, "//div[contains(@id, 'description-val')]")
-            description_html = desc_elem.get_attribute('innerHTML')
-            soup = BeautifulSoup(description_html, 'lxml')
-
-            # Versuche, den Business Value direkt aus der Tabelle zu extrahieren
-            extracted_bv = self._extract_business_value_from_table(soup)
-
-            if extracted_bv:
-                # "Wenn-Ja"-Pfad: Tabelle wurde gefunden und geparst
-                data["business_value"] = extracted_bv
-                logger.info("Business Value direkt aus HTML-Tabelle extrahiert.")
-
-                # NEUE LOGIK: Suche gezielt nach dem "Nutzenstatement"-Panel
-                nutzen_panel = soup.find(lambda tag: tag.name == 'div' and "Business Epic Nutzenstatement" in tag.get_text())
-                if nutzen_panel:
-                    panel_content = nutzen_panel.find('div', class_='panelContent')
-                    if panel_content:
-                        data["description"] = panel_content.get_text(separator='\n', strip=True)
-                        logger.info("Nutzenstatement wurde als Beschreibung extrahiert.")
-                else:
-                    logger.warning("Kein 'Nutzenstatement'-Panel gefunden. Beschreibung könnte unvollständig sein.")
-                    data["description"] = soup.get_text(separator="\n", strip=True)
-            else:
-                # "Wenn-Nein"-Pfad (Fallback zur KI)
-                logger.info("Keine strukturierte Business-Value-Tabelle gefunden. Nutze KI-Fallback.")
-                full_description_text = desc_elem.text
-                if data["issue_type"] == 'Business Epic' and self.description_processor:
-                    try:
-                        processed_text = self.description_processor(
-                            full_description_text, self.model, self.token_tracker, self.azure_client
-                        )
-                        data["description"] = processed_text.get('description', full_description_text)
-                        data["business_value"] = processed_text.get('business_value', {})
-                        logger.info("Business Value per KI-Aufruf extrahiert und Beschreibung bereinigt.")
-                    except Exception as bv_error:
-                        logger.error(f"Fehler bei der Verarbeitung des Business Value via KI: {bv_error}")
-                        data["description"] = full_description_text
-                else:
-                    data["description"] = full_description_text
+        else:
+            logger.error(f"Issue Type konnte nicht extrahiert werden")
 
-            # --- NEUE LOGIK FÜR ACCEPTANCE CRITERIA ---
-            # Zuerst das dedizierte Feld durchsuchen
+        # "Issues in epic" wird nachgeladen: nur bei Epics kurz auf das Panel warten und
+        # danach einen neuen Snapshot nehmen; andere Typen nutzen den vorhandenen Snapshot
+        if data["issue_type"] in EPIC_PANEL_TYPES:
             try:
-                label_elem = driver.find_element(By.XPATH, "//label[text()='Acceptance Criteria:']")
-                field_id = label_elem.get_attribute("for")
-                acceptance_field = driver.find_element(By.XPATH, f"//div[@id='{field_id}-val']")
-                # Hier extrahieren wir den rohen HTML-Inhalt, um Listen und Umbrüche zu erhalten
-                ac_html = acceptance_field.get_attribute('innerHTML')
-                ac_soup = BeautifulSoup(ac_html, 'lxml')
-
-                # Extrahiere die Kriterien und filtere den Standard-Platzhaltertext heraus
-                placeholder_text = "In Scope/Akzeptanzkriterien: siehe Ausfüllhilfe"
-                criteria_list = [
-                    item.get_text(strip=True) for item in ac_soup.find_all(['p', 'li'])
-                    if item.get_text(strip=True) and placeholder_text not in item.get_text()
-                ]
-
-                if criteria_list:
-                    data["acceptance_criteria"].extend(criteria_list)
-                    logger.info(f"{len(criteria_list)} Acceptance Criteria aus dem dedizierten Feld extrahiert und bereinigt.")
-            except Exception:
-                 logger.info("Dediziertes 'Acceptance Criteria'-Feld nicht gefunden oder leer.")
-
-            # Wenn das dedizierte Feld leer war, suche im Beschreibungs-Panel
-            if not data["acceptance_criteria"]:
-                logger.info("Suche nach Akzeptanzkriterien als Fallback im Beschreibungstext...")
-                # Finde den spezifischen Header-Tag (<b> oder <strong>), um die Suche einzugrenzen
-                ac_header = soup.find(lambda tag: tag.name in ['b', 'strong'] and 'In Scope / Akzeptanzkriterien' in tag.get_text())
-
-                if ac_header:
-                    # Navigiere vom Header zum übergeordneten Panel-Container
-                    ac_panel = ac_header.find_parent('div', class_='panel')
-                    if ac_panel:
-                        panel_content = ac_panel.find('div', class_='panelContent')
-                        if panel_content:
-                            # Extrahiere die Kriterien und filtere den Standard-Platzhaltertext heraus
-                            placeholder_text = "In Scope/Akzeptanzkriterien: siehe Ausfüllhilfe"
-                            criteria_list = [
-                                item.get_text(strip=True) for item in panel_content.find_all(['p', 'li'])
-                                if item.get_text(strip=True) and placeholder_text not in item.get_text()
-                            ]
-
-                            if criteria_list:
-                                data["acceptance_criteria"].extend(criteria_list)
-                                logger.info(f"{len(criteria_list)} Acceptance Criteria aus dem 'In Scope'-Panel extrahiert und bereinigt.")
-            # --- ENDE NEUE LOGIK FÜR ACCEPTANCE CRITERIA ---
+                wait = WebDriverWait(driver, 2)
+                wait.until(EC.element_to_be_clickable((By.ID, "greenhopper-epics-issue-web-panel-label")))
+                tree = lxml.html.fromstring(driver.page_source, base_url=driver.current_url)
+            except TimeoutException:
+                logger.info("Abschnitt 'Issues in epic' nicht gefunden oder nicht rechtzeitig geladen.")
+            except Exception as e:
+                logger.info(f"Ein unerwarteter Fehler ist bei der Extraktion von 'Issues in epic' aufgetreten")
 
+        # Title
+        title_elems = _XP["title"](tree)
+        if title_elems:
+            data["title"] = self._text(title_elems[0])
+            logger.info(f"Titel gefunden: {data['title']}")
+        else:
+            logger.info(f"Titel nicht gefunden")
+
+        # --- START DER FINALEN LOGIK FÜR DESCRIPTION & BUSINESS VALUE ---
+        ai_input = None
+        try:
+            desc_elem = _XP["description"](tree)[0]
+            ai_input = self._extract_description_fields(data, desc_elem, self._find_acceptance_field(tree))
         except Exception as e:
             logger.info(f"Beschreibung, BV und AC konnten nicht extrahiert werden: {e}")
+        if ai_input is not None:
+            self._apply_description_processor(data, ai_input)
 
 
         # Business Scope extrahieren und zur Description hinzufügen:
         try:
-            business_scope = DataExtractor._extract_business_scope(driver)
-            if business_scope:
-                if data["description"]:
-                    data["description"] += "\n\nBusiness Scope:\n" + business_scope
-                else:
-                    data["description"] = "Business Scope:\n" + business_scope
-                logger.info(f"Business Scope zur Description hinzugefügt ({len(business_scope)} Zeichen)")
+            DataExtractor._append_business_scope(data, DataExtractor._extract_business_scope(tree))
         except Exception as e:
             logger.info(f"Business Scope konnte nicht extrahiert werden")
 
         # Status
-        try:
-            status_button = driver.find_element(By.XPATH, "//a[contains(@class, 'aui-dropdown2-trigger') and contains(@class, 'opsbar-transitions__status-category_')]")
-            status_span = status_button.find_element(By.XPATH, ".//span[@class='dropdown-text']")
-            data["status"] = status_span.text
-            logger.info(f"Status gefunden: {status_span.text}")
-        except Exception as e:
+        status_spans = _XP["status"](tree)
+        if status_spans:
+            data["status"] = self._text(status_spans[0])
+            logger.info(f"Status gefunden: {data['status']}")
+        else:
             logger.info(f"Status nicht gefunden")
 
         # Story Points
-        data["story_points"] = self._extract_story_points(driver)
+        data["story_points"] = self._extract_story_points(tree)
         logger.info(f"Story Points direkt extrahiert: {data['story_points']}")
 
         # Assignee
-        try:
-            assignee_elem = driver.find_element(By.XPATH, "//span[contains(@id, 'assignee') or contains(@class, 'assignee')]")
-            data["assignee"] = assignee_elem.text
-            logger.info(f"Assignee gefunden: {assignee_elem.text}")
-        except Exception as e:
+        assignee_elems = _XP["assignee"](tree)
+        if assignee_elems:
+            data["assignee"] = self._text(assignee_elems[0])
+            logger.info(f"Assignee gefunden: {data['assignee']}")
+        else:
             logger.info(f"Assignee nicht gefunden")
 
         # Priority
-        try:
-            priority_elem = driver.find_element(By.XPATH, "//span[@id='priority-val']")
-            data["priority"] = priority_elem.text.strip()
+        priority_elems = _XP["priority"](tree)
+        if priority_elems:
+            data["priority"] = self._text(priority_elems[0])
             logger.info(f"Priority gefunden: {data['priority']}")
-        except Exception as e:
+        else:
             logger.info(f"Priority nicht gefunden")
 
         # Resolution
-        try:
-            resolution_elem = driver.find_element(By.XPATH, "//span[@id='resolution-val']")
-            data["resolution"] = resolution_elem.text.strip()
+        resolution_elems = _XP["resolution"](tree)
+        if resolution_elems:
+            data["resolution"] = self._text(resolution_elems[0])
             logger.info(f"Resolution gefunden: {data['resolution']}")
-        except Exception as e:
+        else:
             logger.info(f"Resolution nicht gefunden (normal bei 'Unresolved' Issues)")
 
         # fixVersion Daten
-        try:
-           fix_version_span = driver.find_element(By.XPATH, "//span[@id='fixVersions-field']")
-           fix_version_links = fix_version_span.find_elements(By.XPATH, ".//a[contains(@href, '/issues/')]")
-           for link in fix_version_links:
-               link_html = link.get_attribute("outerHTML")
-               match = re.search(r'>([^<]+)</a>', link_html)
-               if match:
-                   version = match.group(1).strip()
-                   if version and version not in data["fix_versions"]:
-                       data["fix_versions"].append(version)
-           logger.info(f"{len(data['fix_versions'])} Fix Versions gefunden: {', '.join(data['fix_versions'])}")
-        except Exception as e:
-           logger.info(f"Fix Versions nicht gefunden")
+        fix_version_links = _XP["fix_versions"](tree)
+        if fix_version_links:
+            # dict.fromkeys: reihenfolgeerhaltende Deduplizierung
+            data["fix_versions"] = list(dict.fromkeys(
+                version for link in fix_version_links if (version := link.text_content().strip())
+            ))
+            logger.info(f"{len(data['fix_versions'])} Fix Versions gefunden: {', '.join(data['fix_versions'])}")
+        else:
+            logger.info(f"Fix Versions nicht gefunden")
 
         # Target Start und Target End Daten
-        try:
-            target_start_span = driver.find_element(By.XPATH, "//span[@data-name='Target start']")
-            target_start_time = target_start_span.find_element(By.XPATH, ".//time[@datetime]")
-            data["target_start"] = target_start_time.get_attribute("datetime")
+        target_start_times = _XP["target_start"](tree)
+        if target_start_times:
+            data["target_start"] = target_start_times[0].get("datetime")
             logger.info(f"Target Start-Datum gefunden: {data['target_start']}")
-        except Exception as e:
+        else:
             logger.info(f"Target Start-Datum nicht gefunden")
-        try:
-            target_end_span = driver.find_element(By.XPATH, "//span[@data-name='Target end']")
-            target_end_time = target_end_span.find_element(By.XPATH, ".//time[@datetime]")
-            data["target_end"] = target_end_time.get_attribute("datetime")
+        target_end_times = _XP["target_end"](tree)
+        if target_end_times:
+            data["target_end"] = target_end_times[0].get("datetime")
             logger.info(f"Target End-Datum gefunden: {data['target_end']}")
-        except Exception as e:
+        else:
             logger.info(f"Target End-Datum nicht gefunden")
 
         # Attachments
-        try:
-            attachments_list = driver.find_element(By.XPATH, "//ol[@id='attachment_thumbnails' and contains(@class, 'item-attachments')]")
-            attachment_items = attachments_list.find_elements(By.XPATH, ".//li[contains(@class, 'attachment-content')]")
-            for item in attachment_items:
-                try:
-                    download_url = item.get_attribute("data-downloadurl")
-                    if download_url:
-                        parts = download_url.split(":", 2)
-                        if len(parts) >= 3:
-                            attachment_item = {
-                                "filename": parts[1], "url": parts[2], "mime_type": parts[0],
-                                "size": item.find_element(By.XPATH, ".//dd[contains(@class, 'attachment-size')]").text.strip(),
-                                "date": item.find_element(By.XPATH, ".//time[@datetime]").get_attribute("datetime")
-                            }
-                            data["attachments"].append(attachment_item)
-                except Exception as item_error:
-                    logger.info(f"Fehler beim Extrahieren eines Anhangs: {item_error}")
-            logger.info(f"{len(data['attachments'])} Anhänge gefunden")
-        except Exception as e:
-            logger.info(f"Keine Anhänge gefunden")
+        attachment_items = _XP["attachments"](tree)
+        for item in attachment_items:
+            try:
+                download_url = item.get("data-downloadurl")
+                if download_url:
+                    parts = download_url.split(":", 2)
+                    if len(parts) >= 3:
+                        attachment_item = {
+                            "filename": parts[1], "url": parts[2], "mime_type": parts[0],
+                            "size": self._text(_XP["attachment_size"](item)[0]),
+                            "date": _XP["attachment_date"](item)[0].get("datetime")
+                        }
+                        data["attachments"].append(attachment_item)
+            except Exception as item_error:
+                logger.info(f"Fehler beim Extrahieren eines Anhangs: {item_error}")
+        logger.info(f"{len(data['attachments'])} Anhänge gefunden")
 
 
         # Components
-        try:
-            components_container = driver.find_element(By.XPATH, "//span[@id='components-val']")
-            component_links = components_container.find_elements(By.XPATH, ".//a[contains(@href, '/issues/')]")
-            for comp_link in component_links:
-                component_code = comp_link.text.strip()
-                if component_code: data["components"].append({"code": component_code, "title": comp_link.get_attribute("title")})
+        component_links = _XP["components"](tree)
+        for comp_link in component_links:
+            component_code = self._text(comp_link)
+            if component_code: data["components"].append({"code": component_code, "title": comp_link.get("title")})
+        if data["components"]:
             logger.info(f"{len(data['components'])} Components gefunden: {', '.join([comp['code'] for comp in data['components']])}")
-        except Exception as e:
+        else:
             logger.info(f"Keine Components gefunden")
 
         # Labels
-        try:
-            labels_container = driver.find_element(By.XPATH, "//div[contains(@class, 'labels-wrap')]")
-            label_links = labels_container.find_elements(By.XPATH, ".//a[contains(@class, 'lozenge')]")
-            for label_link in label_links:
-                label_text = label_link.text.strip()
+        labels_containers = _XP["labels_container"](tree)
+        if labels_containers:
+            for label_link in _XP["label_links"](labels_containers[0]):
+                label_text = self._text(label_link)
                 if label_text:
                     data["labels"].append(label_text)
             if data["labels"]:
                 logger.info(f"{len(data['labels'])} Labels gefunden: {', '.join(data['labels'])}")
             else:
                 logger.info("Label-Container gefunden, aber keine Labels darin.")
-        except Exception as e:
+        else:
             logger.info(f"Keine Labels gefunden")
 
+        # Bereits in 'issue_links' enthaltene Keys (für die Duplikatprüfung aller Link-Arten)
+        seen_link_keys = set()
+
         # "is realized by" Links
         try:
-            link_elements = driver.find_elements(By.XPATH,
-                "//dl[contains(@class, 'links-list')]/dt[contains(text(), 'is realized by') or @title='is realized by']"
-                "/..//a[contains(@class, 'issue-link')]")
-            for link in link_elements:
-                issue_key_attr = (link.get_attribute("data-issue-key") or link.text.strip()).replace('\u200b', '')
-                summary_text = ""
-                try:
-                    parent_element = link.find_element(By.XPATH, "./ancestor::div[contains(@class, 'link-content')]")
-                    summary_element = parent_element.find_element(By.XPATH, ".//span[contains(@class, 'link-summary')]")
-                    summary_text = summary_element.text.strip()
-                except:
-                    pass
+            # Je Link ein 'link-content'-Container mit Issue-Link und Summary (kein Rückweg über ancestor::)
+            link_containers = _XP["realized_by"](tree)
+            link_elements = []
+            for container in link_containers:
+                issue_links = _XP["link_issue"](container)
+                if not issue_links:
+                    continue
+                link = issue_links[0]
+                link_elements.append(link)
+                link_text = self._text(link)
+                issue_key_attr = (link.get("data-issue-key") or link_text).replace('\u200b', '')
+                summary_elems = _XP["link_summary"](container)
+                summary_text = self._text(summary_elems[0]) if summary_elems else ""
                 link_item = {
-                    "key": issue_key_attr, "title": link.text.strip(), "summary": summary_text,
-                    "url": link.get_attribute("href"), "relation_type": "realized_by"
+                    "key": issue_key_attr, "title": link_text, "summary": summary_text,
+                    "url": self._href(link), "relation_type": "realized_by"
                 }
-                if not any(item["key"] == link_item["key"] for item in data["issue_links"]):
+                if link_item["key"] not in seen_link_keys:
+                    seen_link_keys.add(link_item["key"])
                     data["issue_links"].append(link_item)
             if link_elements:
                 logger.info(f"{len(link_elements)} 'is realized by' Links zu 'issue_links' hinzugefügt.")
@@ -596,10 +877,11 @@ class DataExtractor:
 
         # Child Issues
         try:
-            child_issues = DataExtractor._find_child_issues(driver)
+            child_issues = DataExtractor._find_child_issues(tree)
             initial_link_count = len(data["issue_links"])
             for child in child_issues:
-                if not any(item["key"] == child["key"] for item in data["issue_links"]):
+                if child["key"] not in seen_link_keys:
+                    seen_link_keys.add(child["key"])
                     child["relation_type"] = "child"
                     data["issue_links"].append(child)
             added_children = len(data["issue_links"]) - initial_link_count
@@ -608,34 +890,339 @@ class DataExtractor:
         except Exception as e:
              logger.info(f"Fehler bei der Verarbeitung von Child Issues")
 
-        # "Issues in epic"
+        # "Issues in epic" (nur vorhanden, wenn das Panel im Snapshot geladen ist)
+        issue_rows = _XP["epic_issue_rows"](tree)
+        if issue_rows:
+            logger.info(f"{len(issue_rows)} 'Issues in epic' in der Tabelle gefunden.")
+            for row in issue_rows:
+                try:
+                    key = row.get('data-issuekey')
+                    if key not in seen_link_keys:
+                        url_element = _XP["link_by_href"](row, href=f"/browse/{key}")[0]
+                        title_element = _XP["epic_issue_summary"](row)[0]
+                        title_text = self._text(title_element)
+                        data["issue_links"].append({
+                            "key": key, "title": title_text, "summary": title_text,
+                            "url": self._href(url_element), "relation_type": "issue_in_epic"
+                        })
+                        seen_link_keys.add(key)
+                except Exception as row_error:
+                    logger.warning(f"Konnte eine Zeile im 'Issues in epic'-Panel nicht parsen: {row_error}")
+
+        return data
+
+
+    @staticmethod
+    def _rest_session(driver) -> requests.Session:
+        """Erzeugt eine requests-Session, die die Jira-Cookies des angemeldeten WebDrivers verwendet."""
+        session = requests.Session()
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie["name"], cookie["value"],
+                                domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        return session
+
+
+    @staticmethod
+    def _fetch_issue_json(session: requests.Session, base_url: str, issue_key: str) -> dict | None:
+        """
+        Lädt ein Issue über die Jira-REST-API inklusive gerenderter Felder.
+        (GET /rest/api/2/issue/{key}?expand=renderedFields,names)
+
+        Wie im `JiraApiLoader` werden die Custom-Field-IDs in `fields` und
+        `renderedFields` anhand der `names`-Map auf ihre lesbaren Namen abgebildet.
+
+        Returns:
+            dict | None: Die normalisierte API-Antwort oder None bei Fehlern.
+        """
         try:
-            wait = WebDriverWait(driver, 2)
-            wait.until(EC.element_to_be_clickable((By.ID, "greenhopper-epics-issue-web-panel-label")))
-            issue_table = driver.find_element(By.ID, "ghx-issues-in-epic-table")
-            issue_rows = issue_table.find_elements(By.XPATH, ".//tr[contains(@class, 'issuerow')]")
-            if issue_rows:
-                logger.info(f"{len(issue_rows)} 'Issues in epic' in der Tabelle gefunden.")
-                for row in issue_rows:
-                    try:
-                        key = row.get_attribute('data-issuekey')
-                        if not any(item["key"] == key for item in data["issue_links"]):
-                            url_element = row.find_element(By.XPATH, f".//a[@href='/browse/{key}']")
-                            title_element = row.find_element(By.XPATH, ".//td[contains(@class, 'ghx-summary')]")
-                            data["issue_links"].append({
-                                "key": key, "title": title_element.text.strip(), "summary": title_element.text.strip(),
-                                "url": url_element.get_attribute('href'), "relation_type": "issue_in_epic"
-                            })
-                    except Exception as row_error:
-                        logger.warning(f"Konnte eine Zeile im 'Issues in epic'-Panel nicht parsen: {row_error}")
-        except TimeoutException:
-            logger.info("Abschnitt 'Issues in epic' nicht gefunden oder nicht rechtzeitig geladen.")
+            response = session.get(f"{base_url}rest/api/2/issue/{issue_key}",
+                                   params={"expand": "renderedFields,names"}, timeout=REST_TIMEOUT)
+            response.raise_for_status()
+            issue_json = response.json()
+        except (requests.RequestException, ValueError) as e:
+            logger.info(f"REST-Abruf für {issue_key} fehlgeschlagen, nutze die Issue-Seite: {e}")
+            return None
+        name_map = issue_json.get("names", {})
+        for section in ("fields", "renderedFields"):
+            issue_json[section] = {name_map.get(k, k): v for k, v in (issue_json.get(section) or {}).items()}
+        return issue_json
+
+
+    @staticmethod
+    def _search_related_issues(session: requests.Session, base_url: str, jql: str) -> list:
+        """Liefert die per JQL gefundenen Issues (nur Key und Summary); bei Fehlern eine leere Liste."""
+        try:
+            response = session.get(f"{base_url}rest/api/2/search",
+                                   params={"jql": jql, "fields": "summary", "maxResults": 1000},
+                                   timeout=REST_TIMEOUT)
+            response.raise_for_status()
+            return response.json().get("issues", [])
+        except (requests.RequestException, ValueError) as e:
+            logger.info(f"JQL-Suche '{jql}' fehlgeschlagen: {e}")
+            return []
+
+
+    @staticmethod
+    def _fetch_epic_issues(session: requests.Session, base_url: str, epic_key: str) -> list | None:
+        """
+        Liefert die Issues eines Epics über die Jira-Agile-API (seitenweise, nur Key und Summary).
+        Gibt None zurück, wenn die API nicht verfügbar ist, damit auf JQL ausgewichen werden kann.
+        """
+        issues = []
+        start_at = 0
+        try:
+            while True:
+                response = session.get(f"{base_url}rest/agile/1.0/epic/{epic_key}/issue",
+                                       params={"fields": "summary", "startAt": start_at, "maxResults": 100},
+                                       timeout=REST_TIMEOUT)
+                response.raise_for_status()
+                page = response.json()
+                batch = page.get("issues", [])
+                issues.extend(batch)
+                start_at += len(batch)
+                if not batch or page.get("isLast") or start_at >= page.get("total", 0):
+                    return issues
+        except (requests.RequestException, ValueError) as e:
+            logger.info(f"Agile-API für Epic {epic_key} nicht verfügbar, nutze JQL: {e}")
+            return None
+
+
+    def _issue_data_from_json(self, base_url: str, issue_json: dict) -> tuple:
+        """
+        Baut das Issue-Dictionary (gleiches Schema wie `extract_issue_data`) aus der REST-Antwort.
+
+        Einfache Felder werden direkt übernommen. Beschreibung, Business Value und
+        Akzeptanzkriterien durchlaufen mit den `renderedFields` (HTML) dieselbe Logik
+        wie die Issue-Seite. Enthält nur Daten des Issues selbst (inkl. 'is realized by');
+        Child Issues und 'Issues in epic' ergänzt `_append_related_issues`.
+
+        Der KI-Fallback und das Anhängen des Business Scope werden bewusst nicht
+        ausgeführt, damit das Ergebnis unabhängig von Modell und LLM-Aufruf gecacht
+        werden kann (siehe `_finish_issue_data`).
+
+        Returns:
+            tuple: (data, ai_input, business_scope) - `ai_input` ist der Beschreibungstext
+                für den KI-Fallback oder None.
+        """
+        fields = issue_json["fields"]
+        rendered = issue_json["renderedFields"]
+        issue_key = issue_json.get("key")
+
+        def get_name(obj): return obj.get("name", "") if isinstance(obj, dict) else ""
+        def fragment(html_content): return lxml.html.fragment_fromstring(html_content or "", create_parent="div")
+
+        story_points = fields.get("Story Points")
+        data = {
+            "key": issue_key,
+            "issue_type": get_name(fields.get("Issue Type")),
+            "title": fields.get("Summary") or "",
+            "status": get_name(fields.get("Status")),
+            "resolution": get_name(fields.get("Resolution")),
+            "story_points": f"{story_points:g}" if isinstance(story_points, (int, float)) else "n/a",
+            "description": "",
+            "business_value": {},
+            "assignee": (fields.get("Assignee") or {}).get("displayName", ""),
+            "priority": get_name(fields.get("Priority")),
+            "target_start": fields.get("Target start") or "",
+            "target_end": fields.get("Target end") or "",
+            "fix_versions": list(dict.fromkeys(v["name"] for v in fields.get("Fix Version/s") or [] if v.get("name"))),
+            "acceptance_criteria": [],
+            "components": [{"code": c.get("name"), "title": c.get("description")} for c in fields.get("Component/s") or []],
+            "labels": list(fields.get("Labels") or []),
+            "issue_links": [],
+            "attachments": [
+                {"filename": a.get("filename"), "url": a.get("content"), "mime_type": a.get("mimeType"),
+                 "size": f"{round(a.get('size', 0) / 1024)} kB", "date": a.get("created")}
+                for a in fields.get("Attachment") or []
+            ],
+        }
+
+        ai_input = None
+        try:
+            ac_html = rendered.get("Acceptance Criteria")
+            ai_input = self._extract_description_fields(data, fragment(rendered.get("Description")),
+                                                        fragment(ac_html) if ac_html else None)
         except Exception as e:
-            logger.info(f"Ein unerwarteter Fehler ist bei der Extraktion von 'Issues in epic' aufgetreten")
+            logger.info(f"Beschreibung, BV und AC konnten nicht extrahiert werden: {e}")
+        business_scope = self._block_text(fragment(rendered["Business Scope"])) if rendered.get("Business Scope") else ""
+
+        # 'is realized by'-Links stehen im Issue selbst und ändern dessen 'updated'-Zeitstempel
+        seen_link_keys = set()
+        for link in fields.get("Linked Issues") or []:
+            issue = link.get("inwardIssue")
+            key = issue.get("key") if issue else None
+            if key and key not in seen_link_keys and link.get("type", {}).get("outward") == "realizes":
+                seen_link_keys.add(key)
+                data["issue_links"].append(self._link_entry(
+                    base_url, key, key, issue.get("fields", {}).get("summary", ""), "realized_by"))
+
+        return data, ai_input, business_scope
+
+
+    def _finish_issue_data(self, data: dict, ai_input, business_scope: str) -> None:
+        """Führt den KI-Fallback aus (falls nötig) und hängt danach den Business Scope an."""
+        if ai_input is not None:
+            self._apply_description_processor(data, ai_input)
+        self._append_business_scope(data, business_scope)
+
+
+    @staticmethod
+    def _link_entry(base_url: str, key: str, title: str, summary: str, relation_type: str) -> dict:
+        """Ein Eintrag für `issue_links` im Schema von `extract_issue_data`."""
+        return {"key": key, "title": title, "summary": summary,
+                "url": f"{base_url}browse/{key}", "relation_type": relation_type}
 
+
+    def _append_related_issues(self, session: requests.Session, base_url: str, data: dict) -> None:
+        """
+        Ergänzt Child Issues (Parent Link, per JQL) und 'Issues in epic' (Agile-API, Fallback JQL).
+
+        Diese Beziehungen sind an den *anderen* Issues gespeichert; ihr Hinzufügen oder
+        Entfernen ändert den 'updated'-Zeitstempel dieses Issues nicht. Sie werden daher
+        nie gecacht, sondern bei jedem Aufruf neu gesucht.
+        """
+        issue_key = data["key"]
+        seen_link_keys = {link["key"] for link in data["issue_links"]}
+
+        def add_link(key, title, summary, relation_type):
+            if key and key not in seen_link_keys:
+                seen_link_keys.add(key)
+                data["issue_links"].append(self._link_entry(base_url, key, title, summary, relation_type))
+
+        if data["issue_type"] in PARENT_LINK_TYPES:
+            for child in self._search_related_issues(session, base_url, f'"Parent Link" = "{issue_key}"'):
+                add_link(child.get("key"), child.get("key"), child.get("fields", {}).get("summary", ""), "child")
+        elif data["issue_type"] in EPIC_PANEL_TYPES:
+            epic_issues = self._fetch_epic_issues(session, base_url, issue_key)
+            if epic_issues is None:
+                epic_issues = self._search_related_issues(session, base_url, f'"Epic Link" = "{issue_key}"')
+            for child in epic_issues:
+                summary = child.get("fields", {}).get("summary", "")
+                add_link(child.get("key"), summary, summary, "issue_in_epic")
+
+        logger.info(f"{issue_key} über die REST-API extrahiert ({len(data['issue_links'])} verknüpfte Issues).")
+
+
+    def extract_issue_data_cached(self, driver, issue_key, base_url: str, session: requests.Session | None = None):
+        """
+        Extrahiert ein Issue bevorzugt über die Jira-REST-API und überspringt unveränderte Issues.
+
+        Das Issue wird mit den Session-Cookies des angemeldeten WebDrivers per REST
+        geladen. Stimmt sein 'updated'-Zeitstempel mit dem Cache-Eintrag überein,
+        werden die gecachten Felder verwendet; andernfalls werden sie aus der
+        REST-Antwort aufgebaut und gecacht. Gecacht wird der Stand vor dem
+        KI-Fallback; `description_processor` läuft bei jedem Aufruf. Child Issues und 'Issues in epic' werden
+        in beiden Fällen neu gesucht, da sie 'updated' nicht verändern. Nur wenn der REST-Abruf scheitert,
+        wird die Issue-Seite im Browser geladen und mit `extract_issue_data` ausgewertet.
+
+        Args:
+            driver (webdriver.Chrome): Angemeldete Selenium-WebDriver-Instanz.
+            issue_key (str): Der JIRA-Issue-Key.
+            base_url (str): Jira-Basis-URL, z.B. "https://jira.telekom.de/".
+            session (requests.Session, optional): Wiederverwendbare Session (Keep-Alive);
+                wird sonst aus den Cookies des Drivers erzeugt.
+
+        Returns:
+            dict: Die extrahierten (oder gecachten) Issue-Daten.
+        """
+        session = session or self._rest_session(driver)
+        issue_json = self._fetch_issue_json(session, base_url, issue_key)
+        if issue_json is None:
+            driver.get(f"{base_url}browse/{issue_key}")
+            return self.extract_issue_data(driver, issue_key)
+
+        updated = issue_json["fields"].get("Updated") or issue_json["fields"].get("updated")
+        entry = _cache_get(issue_key, updated) if updated else None
+        if entry is not None:
+            logger.info(f"{issue_key} unverändert seit {updated}, verwende gecachte Felder.")
+            data, ai_input, business_scope = entry["data"], entry["ai_input"], entry["business_scope"]
+        else:
+            data, ai_input, business_scope = self._issue_data_from_json(base_url, issue_json)
+            if updated:
+                # Stand vor dem KI-Schritt: Modell, Prozessor und LLM-Fehler fließen nicht in den Cache ein
+                _cache_put(issue_key, updated, {"data": data, "ai_input": ai_input, "business_scope": business_scope})
+
+        # Der KI-Fallback nutzt den Ergebnis-Cache des description_processor und ist daher günstig
+        self._finish_issue_data(data, ai_input, business_scope)
+        self._append_related_issues(session, base_url, data)
         return data
 
 
+    def batch_extract(self, issue_keys, driver_pool, base_url: str, max_workers: int = 5):
+        """
+        Extrahiert mehrere Issues parallel über einen Pool bereits eingeloggter WebDriver.
+
+        Jeder Worker leiht sich über `driver_pool.acquire()` einen Driver, ruft die
+        Issue-Seite auf, extrahiert die Daten und gibt den Driver anschließend zurück. So
+        überlappen sich die Ladezeiten der Seiten, während jeder Browser zu jedem
+        Zeitpunkt nur von einem Thread benutzt wird.
+
+        Gedacht für den `JiraScraper` (`utils.jira_scraper`, nicht Teil dieses
+        Repositories), der die Ergebnisse per `issue_data` an
+        `FileExporter.process_and_save_issue` übergibt.
+
+        Args:
+            issue_keys (Iterable[str]): Die zu extrahierenden Issue-Keys.
+            driver_pool (DriverPool): Pool angemeldeter Browser (siehe `utils.login_handler`).
+            base_url (str): Jira-Basis-URL, z.B. "https://jira.telekom.de/".
+            max_workers (int): Maximale Anzahl paralleler Extraktionen
+                (effektiv begrenzt durch die Anzahl der Driver im Pool).
+
+        Yields:
+            tuple: (issue_key, data) in Reihenfolge der Fertigstellung; `data` ist
+                None, wenn die Extraktion fehlgeschlagen ist.
+        """
+        # Eine REST-Session je Driver, damit die HTTP-Verbindungen wiederverwendet werden
+        sessions = {}
+
+        def _extract(issue_key):
+            with driver_pool.acquire() as driver:
+                session = sessions.get(id(driver))
+                if session is None:
+                    session = sessions[id(driver)] = self._rest_session(driver)
+                return self.extract_issue_data_cached(driver, issue_key, base_url, session=session)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(_extract, issue_key): issue_key for issue_key in issue_keys}
+                for future in as_completed(futures):
+                    issue_key = futures[future]
+                    try:
+                        yield issue_key, future.result()
+                    except Exception as e:
+                        logger.error(f"Extraktion für {issue_key} fehlgeschlagen: {e}")
+                        yield issue_key, None
+        finally:
+            for session in sessions.values():
+                session.close()
+
+
+    @staticmethod
+    def _iter_action_containers(html_content, chunk_size: int = 64 * 1024):
+        """
+        Liefert die 'actionContainer'-Elemente des Aktivitätsstroms, während das HTML
+        stückweise mit einem Pull-Parser eingelesen wird.
+
+        Bereits ausgewertete Container werden danach geleert und aus dem Baum entfernt,
+        sodass nie der vollständige DOM des Verlaufs im Speicher gehalten wird.
+        """
+        parser = etree.HTMLPullParser(events=('end',), tag='div')
+        chunks = (html_content[i:i + chunk_size] for i in range(0, len(html_content), chunk_size))
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is None:
+                parser.close()
+            else:
+                parser.feed(chunk)
+            for _, elem in parser.read_events():
+                if 'actionContainer' not in (elem.get('class') or '').split():
+                    continue
+                yield elem
+                elem.clear()
+                # Bereits verarbeitete Vorgänger freigeben
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+
     def extract_activity_details(self, html_content):
         """
         Extrahiert und verarbeitet Aktivitätsdetails aus dem HTML-Inhalt.
@@ -652,83 +1239,71 @@ class DataExtractor:
         Feldern wie 'Epic Link' standardisiert. Dies gewährleistet saubere und
         konsistente Ausgabedaten für die weitere Analyse.
         """
-        soup = BeautifulSoup(html_content, 'lxml')
-        action_containers = soup.find_all('div', class_='actionContainer')
+        if not html_content or not html_content.strip():
+            return []
 
-        extracted_data = []
-        ignored_fields = ['Checklists', 'Remote Link', 'Link', 'Kommentar oder Erstellung']
+        # appendleft: die Liste entsteht direkt in chronologischer Reihenfolge
+        extracted_data = deque()
 
-        for container in action_containers:
+        for container in self._iter_action_containers(html_content):
             # Benutzer und Zeitstempel gelten für alle Änderungen in diesem Container
             user_name = "N/A"
             timestamp_iso = "N/A"
 
-            details_block = container.find('div', class_='action-details')
-            if not details_block:
+            details_blocks = _XP["action_details"](container)
+            if not details_blocks:
                 continue
+            details_block = details_blocks[0]
 
-            user_tag = details_block.find('a', class_='user-hover')
-            if user_tag:
-                user_name = user_tag.get_text(strip=True)
-
-            time_tag = details_block.find('time', class_='livestamp')
-            if time_tag:
-                timestamp_iso = time_tag.get('datetime', 'N/A')
-
-            body_block = container.find('div', class_='action-body')
-            if body_block:
-                # NEUE LOGIK: Finde alle Zeilen (tr) mit Änderungen
-                change_rows = body_block.find_all('tr')
-                for row in change_rows:
-                    activity_name_tag = row.find('td', class_='activity-name')
-                    if not activity_name_tag:
-                        continue
+            # Benutzer-Link und Zeitstempel in einem XPath-Aufruf; je Tag zählt der erste Treffer
+            meta = {}
+            for node in _XP["action_meta"](details_block):
+                meta.setdefault(node.tag, node)
 
-                    activity_name = activity_name_tag.get_text(strip=True)
-                    if activity_name in ignored_fields:
-                        continue
+            user_tag = meta.get('a')
+            if user_tag is not None:
+                user_name = self._inline_text(user_tag)
 
-                    # Roh-Werte extrahieren, um sie sauber verarbeiten zu können
-                    old_value_raw = row.find('td', class_='activity-old-val').get_text(strip=True) if row.find('td', class_='activity-old-val') else ""
-                    new_value_raw = row.find('td', class_='activity-new-val').get_text(strip=True) if row.find('td', class_='activity-new-val') else ""
+            time_tag = meta.get('time')
+            if time_tag is not None:
+                timestamp_iso = time_tag.get('datetime', 'N/A')
 
+            # Änderungszeilen (tr) direkt per XPath, ohne Umweg über den action-body
+            for row in _XP["activity_rows"](container):
+                # Name, alter und neuer Wert in einem XPath-Aufruf; je Klasse zählt die erste Zelle
+                cells = {}
+                for td in _XP["activity_cells"](row):
+                    for css_class in (td.get('class') or '').split():
+                        cells.setdefault(css_class, td)
+
+                activity_name_tag = cells.get('activity-name')
+                if activity_name_tag is None:
+                    continue
+
+                activity_name = self._inline_text(activity_name_tag)
+                if activity_name in _IGNORED_ACTIVITY_FIELDS:
+                    continue
+
+                # Roh-Werte extrahieren, um sie sauber verarbeiten zu können
+                old_value_tag = cells.get('activity-old-val')
+                new_value_tag = cells.get('activity-new-val')
+                old_value_raw = self._inline_text(old_value_tag) if old_value_tag is not None else ""
+                new_value_raw = self._inline_text(new_value_tag) if new_value_tag is not None else ""
+
+                # Feldspezifische Bereinigung der Werte (siehe _ACTIVITY_HANDLERS)
+                handler = _ACTIVITY_HANDLERS.get(activity_name)
+                if handler:
+                    old_value, new_value = handler(old_value_raw, new_value_raw)
+                else:
                     old_value, new_value = old_value_raw, new_value_raw
 
-                    # START DER ÄNDERUNG: Zentralisierte und erweiterte Verarbeitungslogik
-                    if activity_name in ['Epic Child', 'Epic Link']:
-                        old_match = re.search(r'([A-Z]+-\d+)', old_value_raw)
-                        old_value = old_match.group(1) if old_match else old_value_raw
-                        new_match = re.search(r'([A-Z]+-\d+)', new_value_raw)
-                        new_value = new_match.group(1) if new_match else new_value_raw
-
-                    elif activity_name in ['Status', 'Sprint', 'Fix Version/s']:
-                        # Bereinigt Werte wie "Prefix:Value[...id...]" zu "Value" für alte und neue Werte
-                        if old_value_raw:
-                            old_value = old_value_raw.split(':')[-1].split('[')[0].strip()
-                        if new_value_raw:
-                            new_value = new_value_raw.split(':')[-1].split('[')[0].strip()
-
-                        # Für Status, den Wert zusätzlich in Großbuchstaben umwandeln
-                        if activity_name == 'Status':
-                            old_value = old_value.upper()
-                            new_value = new_value.upper()
-
-                    elif activity_name == 'Fix Version/s':
-                        match = re.search(r'(Q\d_\d{2})', new_value_raw)
-                        new_value = match.group(1) if match else new_value_raw
-
-                    elif activity_name in ['Acceptance Criteria', 'Description']:
-                        new_value = '[...]' if new_value_raw else ''
-                    # ENDE DER ÄNDERUNG
-
-                    # Erstelle für jede einzelne Änderung einen eigenen Eintrag
-                    extracted_data.append({
-                        'benutzer': user_name,
-                        'feld_name': activity_name,
-                        'alter_wert': old_value,
-                        'neuer_wert': new_value,
-                        'zeitstempel_iso': timestamp_iso
-                    })
-
-        # Die finale Liste wird wie gewohnt umgedreht, um chronologisch zu sein
-        return extracted_data[::-1]
+                # Erstelle für jede einzelne Änderung einen eigenen Eintrag
+                extracted_data.appendleft({
+                    'benutzer': user_name,
+                    'feld_name': activity_name,
+                    'alter_wert': old_value,
+                    'neuer_wert': new_value,
+                    'zeitstempel_iso': timestamp_iso
+                })
+
+        return list(extracted_data)
@@ -16,6 +16,12 @@
         (eingeschlossen in `<think>...</think>` Tags), sowohl im Stream als auch im
         Gesamttext, um dem Endnutzer nur die finale Antwort zu präsentieren.
     * **Fehlerbehandlung:** Logging von Fehlern und Weiterleitung von API-Exceptions.
+    * **Connection-Pooling:** Alle Instanzen nutzen eine gemeinsame `requests.Session`
+        mit Keep-Alive-Pool, sodass TLS-Handshakes nicht pro Anfrage anfallen.
+    * **Rate-Limit:** Chat-Anfragen aller Instanzen teilen sich einen Token-Bucket
+        (`DNABOT_REQUESTS_PER_MINUTE`), damit parallele Aufrufer keine 429-Fehler auslösen.
+    * **Token-Cache:** Der Access Token wird bis zu seinem Ablauf in
+        `DNABOT_TOKEN_CACHE_FILE` gespeichert und von späteren Läufen wiederverwendet.
 
     Voraussetzungen (Umgebungsvariablen):
     -------------------------------------
@@ -51,19 +57,188 @@ Beispiel:
 """
 import requests
 import os
-import re
 import time
 import json
 import sys
 import logging
+import threading
+from functools import lru_cache
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import RequestException
 from utils.logger_config import logger
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-from dotenv import load_dotenv, find_dotenv
-load_dotenv(find_dotenv())
+from utils.config import load_env, DNABOT_TOKEN_CACHE_FILE
+
+# Größe des HTTP-Connection-Pools (Keep-Alive) für alle DnaBot-Anfragen
+HTTP_POOL_SIZE = 64
+# Timeouts (Verbindungsaufbau, Lesen) in Sekunden; das Lesen kann bei großen Antworten dauern
+TOKEN_TIMEOUT = (5, 30)
+CHAT_TIMEOUT = (5, 180)
+# Lesepuffer für Streaming-Antworten (Server-Sent Events) in Bytes
+STREAM_CHUNK_SIZE = 8192
+# Automatische Wiederholung bei Überlast/Gateway-Fehlern. Read-Fehler werden nicht
+# wiederholt, damit eine bereits verarbeitete Anfrage nicht doppelt gesendet wird.
+HTTP_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    status=3,
+    backoff_factor=0.2,
+    status_forcelist=[429, 502, 503, 504],
+    allowed_methods=None, # auch POST wiederholen (Status-Codes oben bedeuten: nicht verarbeitet)
+    respect_retry_after_header=True,
+    raise_on_status=False, # der letzte Fehlerstatus wird über raise_for_status() gemeldet
+)
+
+# Obergrenze für Chat-Anfragen pro Minute über alle Threads des Prozesses
+# (überschreibbar per DNABOT_REQUESTS_PER_MINUTE, 0 deaktiviert die Begrenzung)
+DEFAULT_REQUESTS_PER_MINUTE = 240
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+_session = None
+_session_lock = threading.Lock()
+_rate_limiter = None
+_rate_limiter_ready = False
+
+
+def _get_session() -> requests.Session:
+    """
+    Gibt die prozessweite HTTP-Session zurück und erstellt sie bei Bedarf.
+
+    Alle DnaBotClient-Instanzen teilen sich diese Session, sodass TCP- und
+    TLS-Verbindungen über Anfragen und Instanzen hinweg wiederverwendet werden.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=HTTP_RETRY)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+class RateLimiter:
+    """
+    Threadsicherer Token-Bucket: erlaubt höchstens `max_rate` Anfragen pro
+    `time_period` Sekunden. Parallele Aufrufer warten in `acquire()`, statt die
+    API mit Anfragen zu fluten und 429-Antworten samt Backoff zu provozieren.
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.fill_rate = max_rate / time_period
+        self.tokens = float(max_rate)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.max_rate, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+def _get_rate_limiter():
+    """Gibt den prozessweiten RateLimiter zurück (oder None, wenn deaktiviert)."""
+    global _rate_limiter, _rate_limiter_ready
+    if not _rate_limiter_ready:
+        with _session_lock:
+            if not _rate_limiter_ready:
+                max_rate = int(os.getenv("DNABOT_REQUESTS_PER_MINUTE", DEFAULT_REQUESTS_PER_MINUTE))
+                _rate_limiter = RateLimiter(max_rate) if max_rate > 0 else None
+                _rate_limiter_ready = True
+    return _rate_limiter
+
+
+def _partial_tag_start(buf: str, tag: str) -> int:
+    """Position, ab der das Pufferende ein angeschnittener Anfang von tag sein könnte."""
+    start = buf.rfind("<", max(0, len(buf) - len(tag) + 1))
+    if start != -1 and tag.startswith(buf[start:].lower()):
+        return start
+    return len(buf)
+
+
+class _ThinkFilter:
+    """
+    Zustandsautomat, der <think>...</think> Blöcke (inklusive Tags) aus einem
+    Textstrom entfernt. Tags dürfen über Chunk-Grenzen verteilt sein; zurückgehalten
+    wird dabei höchstens ein möglicher Tag-Anfang, nie der ganze Reasoning-Block.
+
+    Fehlt das schließende </think> (z.B. Abbruch bei max_tokens), wird eine Warnung
+    geloggt. Mit `keep_unclosed=True` liefert `flush()` den offenen Block dann
+    unverändert (inklusive <think>) zurück, sonst wird er verworfen.
+    """
+
+    def __init__(self, keep_unclosed: bool = False):
+        self._buf = ""
+        self._inside = False
+        self._keep_unclosed = keep_unclosed
+        # Bisheriger Text des offenen Blocks (nur mit keep_unclosed)
+        self._open_block = []
+
+    def feed(self, text: str) -> str:
+        """Nimmt das nächste Fragment auf und liefert den sichtbaren Anteil."""
+        buf = self._buf + text
+        out = []
+        while buf:
+            tag = _THINK_CLOSE if self._inside else _THINK_OPEN
+            pos = buf.lower().find(tag)
+            if pos == -1:
+                keep = _partial_tag_start(buf, tag)
+                if not self._inside:
+                    out.append(buf[:keep])
+                elif self._keep_unclosed:
+                    self._open_block.append(buf[:keep])
+                buf = buf[keep:]
+                break
+            if self._inside:
+                self._open_block = []
+            else:
+                out.append(buf[:pos])
+                if self._keep_unclosed:
+                    self._open_block = [buf[pos:pos + len(tag)]]
+            buf = buf[pos + len(tag):]
+            self._inside = not self._inside
+        self._buf = buf
+        return "".join(out)
+
+    def flush(self) -> str:
+        """Gibt den zurückgehaltenen Rest frei und behandelt einen nicht geschlossenen Block."""
+        rest = self._buf
+        if self._inside:
+            if self._keep_unclosed:
+                logger.warning("Kein schließendes </think> gefunden; Text ab <think> bleibt unverändert.")
+                rest = "".join(self._open_block) + rest
+            else:
+                logger.warning("Kein schließendes </think> gefunden; offener Reasoning-Block wird verworfen.")
+                rest = ""
+        self._buf = ""
+        self._inside = False
+        self._open_block = []
+        return rest
+
+
+@lru_cache(maxsize=1024)
+def _clean_reasoning_text_cached(text: str) -> str:
+    """Entfernt <think>...</think> Blöcke; gecacht, da gleiche Antworten (z.B. JSON-Klassifikationen) häufig wiederkehren."""
+    # Wie zuvor per Regex: ein nicht geschlossenes <think> lässt den restlichen Text unverändert
+    think_filter = _ThinkFilter(keep_unclosed=True)
+    return (think_filter.feed(text) + think_filter.flush()).strip()
+
 
 class DnaBotClient:
     """
@@ -73,6 +248,7 @@ class DnaBotClient:
     TOKEN_EXPIRATION_BUFFER = 30
 
     def __init__(self, verify_ssl: bool = True):
+        load_env()
         self.TOKEN_URL = os.getenv("DNABOT_TOKEN_URL")
         self.CHAT_ENDPOINT = os.getenv("DNABOT_CHAT_ENDPOINT")
         self.CLIENT_ID = os.getenv("DNABOT_CLIENT_ID")
@@ -83,11 +259,58 @@ class DnaBotClient:
             raise ValueError("Fehlende DNA-Bot-Credentials.")
 
         self.verify_ssl = verify_ssl
+        self.session = _get_session()
+        self.rate_limiter = _get_rate_limiter()
         self.access_token = None
         self.token_expires_at = 0
-        self.last_stream_usage = {}
+        # Serialisiert Token-Abrufe; der Timer erneuert den Token kurz vor Ablauf im Hintergrund
+        self._token_lock = threading.Lock()
+        self._refresh_timer = None
+        # Usage-Daten des letzten Streams pro Thread, damit parallele Streams
+        # über denselben Client sich nicht gegenseitig überschreiben
+        self._stream_state = threading.local()
+        self._load_cached_token()
         logger.info("DnaBotClient initialisiert.")
 
+    @property
+    def last_stream_usage(self) -> dict:
+        """Usage-Daten des zuletzt im aktuellen Thread konsumierten Streams."""
+        return getattr(self._stream_state, "usage", {})
+
+    @last_stream_usage.setter
+    def last_stream_usage(self, usage: dict):
+        self._stream_state.usage = usage
+
+    def _load_cached_token(self):
+        """Übernimmt einen gespeicherten, noch gültigen Access Token für diese Client-ID."""
+        try:
+            with open(DNABOT_TOKEN_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+        if cached.get("client_id") != self.CLIENT_ID or cached.get("token_url") != self.TOKEN_URL:
+            return
+        if cached.get("expires_at", 0) > time.time() and cached.get("access_token"):
+            self.access_token = cached["access_token"]
+            self.token_expires_at = cached["expires_at"]
+            logger.info("Gespeicherten Access Token wiederverwendet.")
+            self._schedule_token_refresh()
+
+    def _save_cached_token(self):
+        """Speichert den aktuellen Access Token (nur für den Benutzer lesbar)."""
+        try:
+            os.makedirs(os.path.dirname(DNABOT_TOKEN_CACHE_FILE), exist_ok=True)
+            fd = os.open(DNABOT_TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "client_id": self.CLIENT_ID,
+                    "token_url": self.TOKEN_URL,
+                    "access_token": self.access_token,
+                    "expires_at": self.token_expires_at,
+                }, f)
+        except OSError as e:
+            logger.warning(f"Konnte Access Token nicht zwischenspeichern: {e}")
+
     def _get_access_token(self):
         logger.info(f"Hole neuen Access Token von {self.TOKEN_URL}...")
         token_payload = {
@@ -96,8 +319,8 @@ class DnaBotClient:
             "client_secret": self.CLIENT_SECRET,
         }
         try:
-            response = requests.post(
-                self.TOKEN_URL, data=token_payload, verify=self.verify_ssl
+            response = self.session.post(
+                self.TOKEN_URL, data=token_payload, verify=self.verify_ssl, timeout=TOKEN_TIMEOUT
             )
             response.raise_for_status()
             token_data = response.json()
@@ -108,25 +331,51 @@ class DnaBotClient:
             if not self.access_token:
                 raise ValueError("Konnte Access Token nicht extrahieren.")
             logger.info("Access Token erfolgreich erhalten.")
+            self._save_cached_token()
+            self._schedule_token_refresh()
         except RequestException as e:
             logger.error(f"Fehler beim Holen des Access Tokens: {e}")
             self.access_token = None
             self.token_expires_at = 0
             raise
 
+    def _schedule_token_refresh(self):
+        """Plant die Erneuerung des Tokens TOKEN_EXPIRATION_BUFFER Sekunden vor dessen Ablauf."""
+        delay = self.token_expires_at - time.time() - self.TOKEN_EXPIRATION_BUFFER
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        if delay <= 0:
+            self._refresh_timer = None
+            return
+        self._refresh_timer = threading.Timer(delay, self._refresh_token_in_background)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _refresh_token_in_background(self):
+        try:
+            self._refresh_token(force=True)
+        except (RequestException, ValueError) as e:
+            # Der nächste Aufruf holt den Token dann synchron über _ensure_token_valid
+            logger.warning(f"Hintergrund-Erneuerung des Access Tokens fehlgeschlagen: {e}")
+
+    def _refresh_token(self, force: bool = False):
+        with self._token_lock:
+            # Ein anderer Thread hat den Token inzwischen bereits erneuert
+            if not force and time.time() < self.token_expires_at:
+                return
+            self._get_access_token()
+
     def _ensure_token_valid(self):
+        # Im Normalfall hat der Hintergrund-Timer den Token schon erneuert
         if time.time() >= self.token_expires_at:
-            self._get_access_token()
+            self._refresh_token()
 
 
     def _clean_reasoning_text(self, text: str) -> str:
         """Entfernt den <think>...</think> Block aus dem Text."""
         if not text:
             return text
-        # Regex, um den gesamten Block von <think> bis </think> (inklusive Tags und Inhalt) zu entfernen.
-        # re.DOTALL stellt sicher, dass der Match auch über Zeilenumbrüche geht.
-        cleaned_text = re.sub(r'<think>.*?<\/think>', '', text, flags=re.DOTALL | re.IGNORECASE).strip()
-        return cleaned_text
+        return _clean_reasoning_text_cached(text)
 
 
     def completion(self,
@@ -177,14 +426,17 @@ class DnaBotClient:
 
         logger.info(f"Sende Anfrage (Modell: {model_name}, Stream: {stream})...")
 
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
         try:
             # Wichtig: stream=True auch im requests.post Aufruf
-            response = requests.post(
+            response = self.session.post(
                 self.CHAT_ENDPOINT,
                 headers=chat_headers,
                 json=chat_payload,
                 verify=self.verify_ssl,
-                timeout=180,
+                timeout=CHAT_TIMEOUT,
                 stream=stream
             )
 
@@ -212,49 +464,62 @@ class DnaBotClient:
                 logger.error(f"API-Antwort: {e.response.text}")
             raise e
 
+    @staticmethod
+    def _iter_sse_payloads(response):
+        """
+        Liefert die Nutzdaten (Bytes) der 'data: '-Zeilen eines SSE-Streams bis '[DONE]'.
+        Liest größere Blöcke und trennt die Zeilen selbst, statt iter_lines() zu verwenden.
+        """
+        pending = b""
+        for block in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            if not block:
+                continue
+            lines = (pending + block).split(b"\n")
+            # Die letzte (evtl. unvollständige) Zeile bis zum nächsten Block zurückhalten
+            pending = lines.pop()
+            for line in lines:
+                if line.startswith(b"data: "):
+                    payload = line[6:].strip()
+                    if payload == b"[DONE]":
+                        return
+                    yield payload
+        if pending.startswith(b"data: "):
+            payload = pending[6:].strip()
+            if payload != b"[DONE]":
+                yield payload
+
     def _process_stream(self, response):
         """Generator für Streaming-Chunks. Ignoriert <think>...</think> Blöcke."""
 
-        # NEU: Zustandsvariable zur Erkennung des Reasoning-Blocks
-        in_reasoning_block = False
-
-        for line in response.iter_lines():
-            if line:
-                decoded = line.decode('utf-8').strip()
-                if decoded.startswith("data: "):
-                    data_str = decoded[6:]
-                    if data_str == "[DONE]":
-                        break
-                    try:
-                        chunk = json.loads(data_str)
-
-                        # Usage Stats im letzten Chunk speichern
-                        if "usage" in chunk and chunk["usage"]:
-                            self.last_stream_usage = chunk["usage"]
-
-                        # Content Delta extrahieren
-                        if "choices" in chunk and chunk["choices"]:
-                            delta = chunk["choices"][0].get("delta", {})
-                            content = delta.get("content", "")
-
-                            if content:
-                                # Start-Tag prüfen (robuster gegen Whitespace)
-                                if content.strip().startswith("<think>"):
-                                    in_reasoning_block = True
-                                    continue
-
-                                # Ende-Tag prüfen
-                                if "</think>" in content:
-                                    in_reasoning_block = False
-                                    # Yield den Teil NACH </think>
-                                    content_after_think = content.split("</think>", 1)[-1]
-                                    if content_after_think:
-                                        yield content_after_think
-                                    continue
-
-                                # Regulären Inhalt yielden, wenn nicht im Block
-                                if not in_reasoning_block:
-                                    yield content
-
-                    except json.JSONDecodeError:
-                        continue
+        # Entfernt Reasoning-Blöcke auch dann, wenn ein Tag über mehrere Chunks verteilt ist
+        think_filter = _ThinkFilter()
+        # Pro Chunk aufgerufene Funktionen einmalig lokal binden
+        loads = json.loads
+
+        for payload in self._iter_sse_payloads(response):
+            try:
+                # json.loads dekodiert UTF-8-Bytes selbst
+                chunk = loads(payload)
+            except ValueError:
+                continue
+            get = chunk.get
+
+            # Usage Stats im letzten Chunk speichern
+            usage = get("usage")
+            if usage:
+                self.last_stream_usage = usage
+
+            # Content Delta extrahieren
+            choices = get("choices")
+            if choices:
+                delta = choices[0].get("delta") or {}
+                content = delta.get("content")
+
+                if content:
+                    visible = think_filter.feed(content)
+                    if visible:
+                        yield visible
+
+        rest = think_filter.flush()
+        if rest:
+            yield rest
@@ -55,6 +55,8 @@ class EpicHtmlGenerator:
         self.template_html = self._load_template()
         self.token_tracker = token_tracker
         self.prompt_template = load_prompt_template("html_generator_prompt.yaml", "user_prompt_template")
+        # Bereits kodierte Bilder: Pfad -> ((mtime_ns, size), Data-URI); spart Lesen und Base64 bei Wiederholung
+        self._data_uri_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
 
         # Mimetypes initialisieren
         if not mimetypes.inited:
@@ -103,6 +105,30 @@ class EpicHtmlGenerator:
         # Wenn nichts gefunden wurde, vollständige Antwort zurückgeben
         return response
 
+    def _file_to_data_uri(self, path: str) -> str:
+        """
+        Liefert die Bilddatei als Data-URI. Das Ergebnis wird pro Pfad gecacht und nur
+        neu kodiert, wenn sich Änderungszeit oder Größe der Datei geändert haben.
+        """
+        st = os.stat(path)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._data_uri_cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        # Bild-MIME-Typ ermitteln
+        mime_type, _ = mimetypes.guess_type(path)
+        if not mime_type:
+            mime_type = 'image/png'  # Standard-Fallback
+
+        # Bild lesen und als Base64 kodieren
+        with open(path, 'rb') as img_file:
+            img_base64 = base64.b64encode(img_file.read()).decode('ascii')
+
+        data_uri = f'data:{mime_type};base64,{img_base64}'
+        self._data_uri_cache[path] = (signature, data_uri)
+        return data_uri
+
     def _embed_images_in_html(self, html_content: str, BE_key: str) -> str:
         """
         Bettet alle lokalen Bilder aus vordefinierten Verzeichnissen direkt
@@ -114,6 +140,10 @@ class EpicHtmlGenerator:
         # Finde alle Bild-Tags im HTML
         img_pattern = re.compile(r'<img\s+[^>]*src=["\']([^"\']+)["\'][^>]*>')
 
+        # Pro Dokument: src-Wert -> gefundener Pfad (None, wenn nicht vorhanden), damit
+        # mehrfach referenzierte Bilder nur einmal in den Verzeichnissen gesucht werden
+        found_paths: Dict[str, Optional[str]] = {}
+
         # finditer() wird verwendet, um eine veränderbare Kopie für die Iteration zu erstellen
         for match in list(img_pattern.finditer(html_content)):
             img_tag = match.group(0)
@@ -123,32 +153,26 @@ class EpicHtmlGenerator:
             if img_src.startswith('data:') or img_src.startswith('http'):
                 continue
 
-            # GEÄNDERT: Verallgemeinerte Logik zur Dateisuche
-            found_path = None
             filename = os.path.basename(img_src) # Isoliert den Dateinamen
 
-            for search_dir in SEARCH_DIRS:
-                potential_path = os.path.join(search_dir, filename)
-                if os.path.exists(potential_path):
-                    found_path = potential_path
-                    logger.info(f"Bild '{filename}' gefunden in '{search_dir}'")
-                    break # Stoppe die Suche, sobald die Datei gefunden wurde
+            if img_src in found_paths:
+                found_path = found_paths[img_src]
+            else:
+                # GEÄNDERT: Verallgemeinerte Logik zur Dateisuche
+                found_path = None
+                for search_dir in SEARCH_DIRS:
+                    potential_path = os.path.join(search_dir, filename)
+                    if os.path.exists(potential_path):
+                        found_path = potential_path
+                        logger.info(f"Bild '{filename}' gefunden in '{search_dir}'")
+                        break # Stoppe die Suche, sobald die Datei gefunden wurde
+                found_paths[img_src] = found_path
 
             # Wenn die Bilddatei in einem der Verzeichnisse gefunden wurde...
             if found_path:
                 try:
-                    # Bild-MIME-Typ ermitteln
-                    mime_type, _ = mimetypes.guess_type(found_path)
-                    if not mime_type:
-                        mime_type = 'image/png'  # Standard-Fallback
-
-                    # Bild lesen und als Base64 kodieren
-                    with open(found_path, 'rb') as img_file:
-                        img_data = img_file.read()
-                        img_base64 = base64.b64encode(img_data).decode('utf-8')
-
-                    # Data-URI erstellen
-                    data_uri = f'data:{mime_type};base64,{img_base64}'
+                    # Data-URI erstellen (gecacht über Dokumente hinweg)
+                    data_uri = self._file_to_data_uri(found_path)
 
                     # Ersetze das src-Attribut im img-Tag
                     new_img_tag = img_tag.replace(img_src, data_uri)
@@ -4,12 +4,16 @@ Modul zur Übersetzung von HTML-Berichten mittels einer Batch-Strategie.
 Diese Datei enthält die Klasse `HtmlTranslator`, die darauf spezialisiert ist,
 HTML-Dateien mit Fachjargon aus der Telekommunikations- und IT-Branche präzise
 von Deutsch nach Englisch zu übersetzen. Sie nutzt eine Batch-Verarbeitung, um
-Effizienz und Übersetzungsqualität zu maximieren.
+Effizienz und Übersetzungsqualität zu maximieren. Die Textelemente werden in
+mehrere Batches aufgeteilt, die parallel an das LLM gesendet werden, sodass die
+Laufzeit pro Datei vom langsamsten Batch statt von der Summe aller Aufrufe
+bestimmt wird.
 """
 import os
 import sys
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup, NavigableString
 from typing import Any # <-- NEU: Importiere 'Any' für Flexibilität
 
@@ -38,6 +42,11 @@ Your response must be a valid JSON object and nothing else.
 # Liste von Tags, deren Inhalt übersetzt werden soll
 TRANSLATABLE_TAGS = ['p', 'h1', 'h2', 'h3', 'li', 'td', 'th', 'title', 'div', 'strong', 'b', 'em']
 
+# Maximale Anzahl an Textelementen pro API-Aufruf
+TRANSLATION_BATCH_SIZE = 40
+# Maximale Anzahl paralleler Übersetzungs-Aufrufe
+MAX_CONCURRENT_TRANSLATIONS = 8
+
 class HtmlTranslator:
     """
     Eine Klasse zur Übersetzung von HTML-Dateien unter Beibehaltung der Struktur.
@@ -66,7 +75,7 @@ class HtmlTranslator:
         self.system_prompt = SYSTEM_PROMPT_TRANSLATOR 
         
         # Falls es der alte AzureAIClient ist, setzen wir das Attribut weiterhin
-        if isinstance(self.ai_client, AzureAIClient):
+        if hasattr(self.ai_client, 'system_prompt'):
              self.ai_client.system_prompt = SYSTEM_PROMPT_TRANSLATOR
         # --- ENDE ANPASSUNG ---
              
@@ -78,8 +87,9 @@ class HtmlTranslator:
         Übersetzt eine einzelne HTML-Berichtsdatei vom Deutschen ins Englische.
 
         Implementiert eine Batch-Strategie, um alle Textknoten und 'alt'-Attribute
-        zu extrahieren, in einer einzigen Anfrage zu übersetzen und die Ergebnisse
-        wieder an den ursprünglichen Positionen im HTML einzufügen.
+        zu extrahieren, in parallelen Batches von bis zu TRANSLATION_BATCH_SIZE
+        Elementen zu übersetzen und die Ergebnisse wieder an den ursprünglichen
+        Positionen im HTML einzufügen.
 
         Args:
             issue_key (str): Der Jira-Key des Epics (z.B. "BEMABU-1410"), der als
@@ -127,9 +137,58 @@ class HtmlTranslator:
 
         logging.info(f"{len(texts_for_api)} Elemente zur Batch-Übersetzung extrahiert.")
 
-        # --- PHASE 2: Einzelner API-Aufruf mit allen Texten ---
+        # --- PHASE 2: Parallele API-Aufrufe, ein Aufruf pro Batch ---
+        batches = [
+            texts_for_api[i:i + TRANSLATION_BATCH_SIZE]
+            for i in range(0, len(texts_for_api), TRANSLATION_BATCH_SIZE)
+        ]
+        logging.info(f"Sende {len(batches)} Übersetzungs-Batch(es) parallel an die API.")
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_TRANSLATIONS, len(batches))) as executor:
+            # executor.map liefert die Ergebnisse in Dokumentreihenfolge
+            batch_results = list(executor.map(lambda batch: self._translate_batch(batch, issue_key), batches))
+
+        if any(result is None for result in batch_results):
+            logging.error(f"Mindestens ein Übersetzungs-Batch für {issue_key} ist fehlgeschlagen. Datei wird nicht gespeichert.")
+            return
+
+        translations = [item for result in batch_results for item in result]
+
+        # --- PHASE 3: Inhalte wieder einfügen ---
+        if len(translations) != len(nodes_to_translate):
+            logging.warning(f"Anzahl der Übersetzungen ({len(translations)}) stimmt nicht mit Originaltexten ({len(nodes_to_translate)}) überein!")
+
+        for item in translations:
+            item_id = item.get("id")
+            translated_text = item.get("text", "").strip()
+            if isinstance(item_id, int) and 0 <= item_id < len(nodes_to_translate):
+                target = nodes_to_translate[item_id]
+                if target['type'] == 'text':
+                    target['node'].replace_with(NavigableString(translated_text))
+                elif target['type'] == 'attribute':
+                    target['node'][target['attr_name']] = translated_text
+
+        # Speichere die übersetzte HTML-Datei
+        with open(output_filepath, "w", encoding='utf-8') as f:
+            f.write(str(soup))
+
+        logging.info(f"Übersetzte Datei erfolgreich gespeichert: {output_filepath}\n")
+
+    def _translate_batch(self, batch: list, issue_key: str) -> list | None:
+        """
+        Übersetzt einen einzelnen Batch von Textelementen mit einem API-Aufruf.
+
+        Args:
+            batch (list): Liste von Dictionaries mit "id" und "text".
+            issue_key (str): Der Jira-Key des Epics (für das Token-Tracking).
+
+        Returns:
+            list | None: Die Liste der Übersetzungen ({"id", "text"}) oder None,
+                         falls der Aufruf oder das Parsen fehlschlägt.
+        """
+        response = None
         try:
-            api_payload = {"texts_to_translate": texts_for_api}
+            api_payload = {"texts_to_translate": batch}
             user_prompt_json = json.dumps(api_payload, ensure_ascii=False, indent=2)
 
             # --- ANPASSUNG FÜR DNA-BOT-CLIENT ---
@@ -171,36 +230,16 @@ class HtmlTranslator:
                     entity_id=issue_key
                 )
 
-            # --- PHASE 3: Antwort verarbeiten und Inhalte wieder einfügen ---
             # Der 'text'-Schlüssel ist bei beiden Clients identisch
             translated_data = json.loads(response['text'] if isinstance(response, dict) else response.choices[0].message.content)
-            translations = translated_data.get("translations", [])
-
-            if len(translations) != len(nodes_to_translate):
-                logging.warning(f"Anzahl der Übersetzungen ({len(translations)}) stimmt nicht mit Originaltexten ({len(nodes_to_translate)}) überein!")
-
-            for item in translations:
-                item_id = item.get("id")
-                translated_text = item.get("text", "").strip()
-                if 0 <= item_id < len(nodes_to_translate):
-                    target = nodes_to_translate[item_id]
-                    if target['type'] == 'text':
-                        target['node'].replace_with(NavigableString(translated_text))
-                    elif target['type'] == 'attribute':
-                        target['node'][target['attr_name']] = translated_text
+            return translated_data.get("translations", [])
 
         except json.JSONDecodeError:
             logging.error("Fehler beim Parsen der JSON-Antwort von der API.", exc_info=True)
             # Anpassung, um die Antwort aus beiden möglichen Strukturen zu holen
             raw_response_text = response.get('text', 'Keine Antwort') if isinstance(response, dict) else getattr(response.choices[0].message, 'content', 'Keine Antwort')
             logging.debug(f"Erhaltene Antwort: {raw_response_text}")
-            return
+            return None
         except Exception as e:
             logging.error(f"Ein Fehler ist während des API-Aufrufs aufgetreten: {e}", exc_info=True)
-            return
-
-        # Speichere die übersetzte HTML-Datei
-        with open(output_filepath, "w", encoding='utf-8') as f:
-            f.write(str(soup))
-
-        logging.info(f"Übersetzte Datei erfolgreich gespeichert: {output_filepath}\n")
\ No newline at end of file
+            return None
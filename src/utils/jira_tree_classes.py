@@ -46,7 +46,7 @@ class JiraTreeGenerator:
     """
 
     # +++ KORRIGIERTER CONSTRUCTOR +++
-    def __init__(self, json_dir=JIRA_ISSUES_DIR, allowed_types=None, db_conn: sqlite3.Connection = None):
+    def __init__(self, json_dir=JIRA_ISSUES_DIR, allowed_types=None, db_conn: sqlite3.Connection = None, issue_cache: dict = None):
         """
         Initialisiert den JiraTreeGenerator.
 
@@ -64,12 +64,17 @@ class JiraTreeGenerator:
             db_conn (sqlite3.Connection, optional): Eine bestehende SQLite-Datenbankverbindung.
                                                     Wenn diese angegeben wird, wird das Lesen
                                                     aus dem 'json_dir' ignoriert.
+            issue_cache (dict, optional): Ein Dictionary {key: Issue-Daten}, das als
+                                          Cache dient. Bereits enthaltene Issues werden
+                                          nicht erneut gelesen, neu gelesene werden
+                                          ergänzt. Wenn None, wird nicht gecacht.
         """
         self.json_dir = json_dir
         # Verwende die übergebene Konfiguration, oder greife auf den Standard zurück
         self.allowed_hierarchy_types = allowed_types if allowed_types is not None else JIRA_TREE_MANAGEMENT
         # +++ KORRIGIERTE ZEILE +++
         self.db_conn = db_conn # Speichert die DB-Verbindung (kann None sein)
+        self.issue_cache = issue_cache
 
     # +++ ENDE DER KORREKTUR +++
 
@@ -96,7 +101,20 @@ class JiraTreeGenerator:
 
     def _fetch_issue_data(self, key: str) -> dict | None:
         """
-        Holt die Rohdaten für einen einzelnen Issue-Key, entweder aus der DB oder aus einer Datei.
+        Holt die Rohdaten für einen einzelnen Issue-Key, bevorzugt aus dem
+        Issue-Cache, sonst aus der DB oder aus einer Datei.
+        """
+        if self.issue_cache is not None and key in self.issue_cache:
+            return self.issue_cache[key]
+
+        data = self._load_issue_data(key)
+        if data is not None and self.issue_cache is not None:
+            self.issue_cache[key] = data
+        return data
+
+    def _load_issue_data(self, key: str) -> dict | None:
+        """
+        Liest die Rohdaten für einen einzelnen Issue-Key, entweder aus der DB oder aus einer Datei.
         """
         # Priorität 1: Datenbank-Verbindung nutzen
         if self.db_conn:
@@ -34,11 +34,13 @@ from requests.exceptions import RequestException
 import os
 from utils.config import (
     JIRA_ISSUES_DIR, ISSUE_LOG_FILE,
-    DB_PATH  # <--- HINZUGEFÜGT
+    DB_PATH,  # <--- HINZUGEFÜGT
+    load_env
 )
 from utils.logger_config import logger
 from utils.jira_data_transformer import JiraDataTransformer
 
+load_env()
 JIRA_SERVER = os.getenv("JIRA_SERVER_URL", "https://jira.telekom.de")
 JIRA_API_TOKEN = os.getenv("JIRA_ACCESS_TOKEN")
 
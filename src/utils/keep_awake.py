@@ -11,6 +11,7 @@ in einem separaten Thread als Daemon zu laufen und auf ein
 'threading.Event' zu warten, um sich sauber zu beenden.
 """
 
+import os
 import sys
 import logging
 import subprocess
@@ -29,10 +30,52 @@ if sys.platform == "win32":
     except Exception:
         logging.critical("Konnte kernel32.dll nicht laden. Keep-Awake wird fehlschlagen.")
         kernel32 = None # Sicherstellen, dass die Variable existiert
-elif sys.platform != "darwin":
+# --- Plattformspezifische Imports für macOS (IOKit Power-Assertions) ---
+elif sys.platform == "darwin":
+    import ctypes
+    import ctypes.util
+    kIOPMAssertionLevelOn = 255
+    kCFStringEncodingUTF8 = 0x08000100
+    try:
+        iokit = ctypes.cdll.LoadLibrary(ctypes.util.find_library("IOKit"))
+        corefoundation = ctypes.cdll.LoadLibrary(ctypes.util.find_library("CoreFoundation"))
+        corefoundation.CFStringCreateWithCString.restype = ctypes.c_void_p
+        corefoundation.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        corefoundation.CFRelease.argtypes = [ctypes.c_void_p]
+        iokit.IOPMAssertionCreateWithName.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+        iokit.IOPMAssertionRelease.argtypes = [ctypes.c_uint32]
+    except Exception:
+        logging.warning("Konnte IOKit nicht laden. Keep-Awake nutzt 'caffeinate' als Fallback.")
+        iokit = None
+else:
     logging.warning(f"Keep-Awake-Funktion ist auf der Plattform '{sys.platform}' nicht implementiert.")
 
 
+def _create_power_assertions(reason: str) -> list:
+    """
+    Erstellt IOKit Power-Assertions, die Display- und System-Ruhezustand verhindern
+    (entspricht 'caffeinate -di', aber ohne eigenen Prozess).
+
+    Returns:
+        list: Die IDs der erstellten Assertions (leer, falls fehlgeschlagen).
+    """
+    assertion_ids = []
+    cf_reason = corefoundation.CFStringCreateWithCString(None, reason.encode('utf-8'), kCFStringEncodingUTF8)
+    try:
+        for assertion_type in (b"PreventUserIdleDisplaySleep", b"PreventUserIdleSystemSleep"):
+            cf_type = corefoundation.CFStringCreateWithCString(None, assertion_type, kCFStringEncodingUTF8)
+            assertion_id = ctypes.c_uint32(0)
+            result = iokit.IOPMAssertionCreateWithName(cf_type, kIOPMAssertionLevelOn, cf_reason, ctypes.byref(assertion_id))
+            corefoundation.CFRelease(cf_type)
+            if result == 0:
+                assertion_ids.append(assertion_id.value)
+            else:
+                logging.warning(f"Keep-Awake (macOS): Assertion {assertion_type.decode()} fehlgeschlagen (Code {result}).")
+    finally:
+        corefoundation.CFRelease(cf_reason)
+    return assertion_ids
+
+
 def prevent_screensaver(stop_event: threading.Event):
     """
     Läuft in einem separaten Thread und verhindert den System-Ruhezustand/Sperre.
@@ -63,23 +106,32 @@ def prevent_screensaver(stop_event: threading.Event):
                  logging.warning("Keep-Awake (Windows): Reset-Aufruf fehlgeschlagen.")
 
         elif sys.platform == "darwin":
-            while not stop_event.is_set():
-                # Warte 8 Minuten (480 Sekunden).
-                # Wenn das Event gesetzt wird, bricht wait() frühzeitig ab.
-                if stop_event.wait(480):
-                    break
-                # Doppelte Prüfung, falls wait() ohne Event abläuft
-                if stop_event.is_set():
-                    break
-
-                # Simuliere einen Tastendruck (keyCode 49 = Leertaste)
-                # um den Mac wach zu halten
-                script = 'tell application "System Events" to key code 49'
-                subprocess.run(
-                    ['osascript', '-e', script],
-                    check=True, capture_output=True, text=True
-                )
-                logging.info("Keep-Awake (macOS): Leertaste simuliert.")
+            # Bevorzugt: native IOKit-Assertions, einmalig gesetzt und am Ende freigegeben
+            assertion_ids = _create_power_assertions("business-epic-analyzer") if iokit else []
+            if assertion_ids:
+                logging.info("Keep-Awake (macOS): IOKit Power-Assertions gesetzt.")
+                try:
+                    stop_event.wait()
+                finally:
+                    for assertion_id in assertion_ids:
+                        iokit.IOPMAssertionRelease(assertion_id)
+                    logging.info("Keep-Awake (macOS): IOKit Power-Assertions freigegeben.")
+            else:
+                # Fallback: 'caffeinate' wird einmalig gestartet und hält das System wach,
+                # bis der Prozess beendet wird - kein periodisches Polling nötig.
+                # -d: Display, -i: Idle-Sleep, -m: Disk, -s: System (Netzteil), -u: Benutzeraktivität
+                # -w: beendet sich automatisch mit diesem Prozess (auch bei Absturz)
+                caffeinate = subprocess.Popen(['caffeinate', '-dimsu', '-w', str(os.getpid())])
+                logging.info("Keep-Awake (macOS): caffeinate gestartet.")
+                try:
+                    stop_event.wait()
+                finally:
+                    caffeinate.terminate()
+                    try:
+                        caffeinate.wait(timeout=2)
+                    except subprocess.TimeoutExpired:
+                        caffeinate.kill()
+                    logging.info("Keep-Awake (macOS): caffeinate beendet.")
         else:
             logging.info(f"Keep-Awake: Funktion nicht unterstützt auf Plattform '{sys.platform}'.")
             # Warte einfach auf das Stop-Event
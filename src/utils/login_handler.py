@@ -14,7 +14,10 @@ Zertifikatsauswahl) zu steuern, die für Selenium unzugänglich sind.
 """
 
 import os
-from dotenv import load_dotenv
+import json
+import queue
+import contextlib
+from urllib.parse import urljoin
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -23,10 +26,19 @@ from selenium.webdriver.support import expected_conditions as EC
 import time
 import subprocess
 from utils.logger_config import logger
+from utils.config import JIRA_SESSION_FILE, load_env
 
 # Note: You need to have python-dotenv installed (`pip install python-dotenv`)
 # and a .env file with your JIRA_PASSWORD in the same directory.
-load_dotenv()
+load_env()
+
+# Ressourcen, die für das Scraping nicht benötigt werden und nur Ladezeit kosten.
+# Stylesheets werden bewusst nicht blockiert, da die Klickbarkeits-Prüfungen
+# (Login-Buttons, "Mehr anzeigen"-Links) vom Layout abhängen.
+BLOCKED_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico",
+                        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+PAGE_LOAD_TIMEOUT = 30
+SCRIPT_TIMEOUT = 20
 
 class BrowserHandler:
     """
@@ -47,7 +59,8 @@ class BrowserHandler:
 
         Setzt einen Standard-User-Agent und startet den Browser im
         maximierten Fenstermodus, um eine konsistente Darstellung von
-        Webseiten zu gewährleisten.
+        Webseiten zu gewährleisten. Bilder und Web-Fonts werden blockiert,
+        um Ladezeit und Speicherbedarf pro Seite zu reduzieren.
 
         Returns:
             webdriver.Chrome: Die initialisierte Browser-Instanz.
@@ -55,10 +68,26 @@ class BrowserHandler:
         options = Options()
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-extensions")
         options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
 
-        self.driver = webdriver.Chrome(options=options)
+        # keep_alive: alle WebDriver-Befehle laufen über eine persistente HTTP-Verbindung
+        # zum chromedriver, statt pro Befehl eine neue TCP-Verbindung aufzubauen
+        self.driver = webdriver.Chrome(options=options, keep_alive=True)
         self.driver.maximize_window()
+        self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        self.driver.set_script_timeout(SCRIPT_TIMEOUT)
+        # Kein impliziter Wait: fehlende optionale Felder dürfen nie blockieren,
+        # gewartet wird nur gezielt per WebDriverWait
+        self.driver.implicitly_wait(0)
+
+        # Fonts und restliche Bild-Requests zusätzlich über das DevTools-Protokoll blockieren
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Konnte Ressourcen-Blockierung nicht aktivieren: {e}")
         return self.driver
 
     def press_enter_with_applescript(self):
@@ -83,6 +112,56 @@ class BrowserHandler:
         except Exception as e:
             logger.error(f"Fehler beim Ausführen von AppleScript: {e}")
 
+    def save_state(self, path: str = JIRA_SESSION_FILE):
+        """
+        Speichert Cookies und localStorage der aktuellen Seite in eine Datei,
+        damit spätere Läufe die Sitzung ohne erneuten Login wiederherstellen können.
+        Die Datei enthält Session-Cookies und wird daher nur für den Benutzer lesbar angelegt.
+        """
+        if not self.driver:
+            return
+        try:
+            state = {
+                "cookies": self.driver.get_cookies(),
+                "local_storage": self.driver.execute_script("return Object.assign({}, window.localStorage);"),
+            }
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            logger.info(f"Browser-Session gespeichert: {path}")
+        except Exception as e:
+            logger.warning(f"Konnte Browser-Session nicht speichern: {e}")
+
+    def load_state(self, url: str, path: str = JIRA_SESSION_FILE) -> bool:
+        """
+        Lädt gespeicherte Cookies und localStorage in den Browser.
+
+        Cookies können nur für die aktuell geöffnete Domain gesetzt werden,
+        daher wird zuerst `url` aufgerufen.
+
+        Returns:
+            bool: True, wenn ein gespeicherter Zustand geladen wurde.
+        """
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+
+            self.driver.get(url)
+            for cookie in state.get("cookies", []):
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    # Cookies fremder Domains (z.B. Microsoft-Login) können hier nicht gesetzt werden
+                    continue
+            for key, value in state.get("local_storage", {}).items():
+                self.driver.execute_script("window.localStorage.setItem(arguments[0], arguments[1]);", key, value)
+            return True
+        except Exception as e:
+            logger.warning(f"Konnte gespeicherte Browser-Session nicht laden: {e}")
+            return False
+
     def close(self):
         """Schließt den Browser und gibt alle damit verbundenen Ressourcen frei."""
         if self.driver:
@@ -104,11 +183,30 @@ class JiraLoginHandler(BrowserHandler):
         """Initialisiert den JiraLoginHandler."""
         super().__init__()
 
+    def _restore_session(self, url) -> bool:
+        """
+        Versucht, eine gespeicherte Sitzung wiederherzustellen, und prüft über
+        den REST-Endpunkt `/rest/api/2/myself`, ob sie noch gültig ist.
+        """
+        if not self.load_state(url):
+            return False
+
+        self.driver.get(urljoin(url, "/rest/api/2/myself"))
+        if '"name"' in self.driver.page_source:
+            logger.info("Gespeicherte Jira-Session ist gültig. Login wird übersprungen.")
+            return True
+
+        logger.info("Gespeicherte Jira-Session ist abgelaufen. Führe vollständigen Login durch.")
+        self.driver.delete_all_cookies()
+        return False
+
     def login(self, url, email, password):
         """
         Führt den vollständigen, mehrstufigen Login-Prozess für Jira durch.
 
-        Der Prozess umfasst die folgenden automatisierten Schritte:
+        Liegt eine gespeicherte, noch gültige Sitzung vor (siehe `save_state`),
+        wird der interaktive Login übersprungen. Andernfalls umfasst der Prozess
+        die folgenden automatisierten Schritte:
         1.  Klick auf den "Windows Account"-Button auf der Jira-Startseite.
         2.  Eingabe der E-Mail-Adresse auf der Microsoft-Anmeldeseite.
         3.  Eingabe des Passworts.
@@ -130,6 +228,12 @@ class JiraLoginHandler(BrowserHandler):
         if not self.driver:
             self.init_browser()
 
+        try:
+            if self._restore_session(url):
+                return True
+        except Exception as e:
+            logger.warning(f"Wiederherstellen der Jira-Session fehlgeschlagen: {e}")
+
         try:
             logger.info(f"Öffne URL: {url}")
             self.driver.get(url)
@@ -191,6 +295,7 @@ class JiraLoginHandler(BrowserHandler):
             )
 
             logger.info("Login erfolgreich! Jira-Dashboard wurde geladen.")
+            self.save_state()
             return True
 
         except Exception as e:
@@ -198,6 +303,64 @@ class JiraLoginHandler(BrowserHandler):
             self.driver.save_screenshot("login_error.png") # Speichert einen Screenshot bei Fehlern
             return False
 
+class DriverPool:
+    """
+    Pool angemeldeter Browser-Sessions, die über viele Issue-Extraktionen
+    hinweg wiederverwendet werden.
+
+    Die Browser werden einmalig gestartet und nacheinander angemeldet: Der erste
+    Login speichert die Sitzung (`save_state`), alle weiteren Browser übernehmen
+    sie über `_restore_session` ohne erneute MFA. Anschließend werden die Driver
+    per `acquire()` verliehen, statt pro Issue einen neuen Chrome-Prozess zu starten.
+
+    Example:
+        >>> with DriverPool(3, url, email, password) as pool:
+        ...     with pool.acquire() as driver:
+        ...         extractor.extract_issue_data(driver, issue_key)
+    """
+
+    def __init__(self, size: int, url: str, email: str, password: str = None):
+        self._handlers = []
+        self._available = queue.Queue()
+
+        for index in range(1, size + 1):
+            handler = JiraLoginHandler()
+            if handler.login(url, email, password):
+                self._handlers.append(handler)
+                self._available.put(handler.driver)
+                logger.info(f"DriverPool: Browser {index}/{size} angemeldet.")
+            else:
+                logger.error(f"DriverPool: Login für Browser {index}/{size} fehlgeschlagen.")
+                handler.close()
+
+        if not self._handlers:
+            raise RuntimeError("DriverPool: Kein Browser konnte angemeldet werden.")
+
+    def __len__(self):
+        return len(self._handlers)
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """Leiht einen freien Driver aus (blockiert, bis einer verfügbar ist) und gibt ihn danach zurück."""
+        driver = self._available.get()
+        try:
+            yield driver
+        finally:
+            self._available.put(driver)
+
+    def close(self):
+        """Beendet alle Browser des Pools."""
+        for handler in self._handlers:
+            handler.close()
+        self._handlers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 # Beispiel für die Verwendung (Example Usage)
 # if __name__ == '__main__':
 #     jira_url = "DEINE_JIRA_URL"
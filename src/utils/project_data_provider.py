@@ -38,9 +38,15 @@ class ProjectDataProvider:
         hierarchy_config (dict, optional): Konfiguration für den `JiraTreeGenerator`,
             die bestimmt, welche Issue-Typen und Link-Typen im Baum enthalten sein
             sollen (z.B. `JIRA_TREE_FULL`).
+        preloaded_issues (dict, optional): Ein gemeinsamer Cache {key: Issue-Daten}.
+            Bereits enthaltene Issues werden weder aus der DB noch aus Dateien
+            erneut gelesen; neu gelesene Issues werden ergänzt. So können mehrere
+            Provider mit unterschiedlicher `hierarchy_config` für dasselbe Epic
+            die Rohdaten nur einmal laden.
 """
-    def __init__(self, epic_id: str, hierarchy_config: dict = None):
+    def __init__(self, epic_id: str, hierarchy_config: dict = None, preloaded_issues: Dict[str, dict] = None):
         self.epic_id = epic_id
+        self.preloaded_issues = preloaded_issues if preloaded_issues is not None else {}
         self.db_conn = None
         self.use_db = False
         self.json_dir = JIRA_ISSUES_DIR
@@ -69,13 +75,15 @@ class ProjectDataProvider:
         if self.use_db:
             self.tree_generator = JiraTreeGenerator(
                 allowed_types=hierarchy_config,
-                db_conn=self.db_conn
+                db_conn=self.db_conn,
+                issue_cache=self.preloaded_issues
             )
         else:
             self.tree_generator = JiraTreeGenerator(
                 json_dir=self.json_dir, # Fallback auf das OneDrive-Verzeichnis
                 allowed_types=hierarchy_config,
-                db_conn=None
+                db_conn=None,
+                issue_cache=self.preloaded_issues
             )
 
         # 3. Baum erstellen (liest jetzt entweder aus DB oder Dateien)
@@ -91,9 +99,8 @@ class ProjectDataProvider:
                 self._load_data_from_db() # Neue, schnelle DB-Methode
                 logger.info(f"ProjectDataProvider für Epic '{epic_id}' mit {len(self.issue_tree.nodes())} Issues initialisiert (via SQLite).")
             else:
-                # Alte Datei-Methoden als Fallback nutzen
-                self.all_activities = self._gather_all_activities()
-                self.issue_details = self._build_issue_details_cache()
+                # Datei-Methode als Fallback nutzen
+                self._load_data_from_files()
                 logger.info(f"ProjectDataProvider für Epic '{epic_id}' mit {len(self.issue_tree.nodes())} Issues initialisiert (via JSON-Dateien).")
             # --- ENDE DATENLADE-LOGIK ---
 
@@ -107,63 +114,40 @@ class ProjectDataProvider:
         """
         Lädt alle Details und Aktivitäten für die Issues im Baum
         in einer einzigen, effizienten Batch-Operation aus der DB.
+        Issues, die bereits im Cache liegen, werden nicht erneut abgefragt.
         """
         if not self.issue_tree or not self.db_conn:
             return
 
         node_keys = list(self.issue_tree.nodes())
+        missing_keys = [key for key in node_keys if key not in self.preloaded_issues]
 
         try:
-            cursor = self.db_conn.cursor()
-            placeholders = ",".join("?" * len(node_keys))
-            query = f"SELECT key, data FROM issues WHERE key IN ({placeholders})"
-            cursor.execute(query, node_keys)
-            rows = cursor.fetchall()
+            if missing_keys:
+                cursor = self.db_conn.cursor()
+                placeholders = ",".join("?" * len(missing_keys))
+                query = f"SELECT key, data FROM issues WHERE key IN ({placeholders})"
+                cursor.execute(query, missing_keys)
+                rows = cursor.fetchall()
+
+                for key, data_str in rows:
+                    try:
+                        self.preloaded_issues[key] = json.loads(data_str)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Konnte JSON-Daten für Key {key} aus DB nicht parsen.")
 
             # Verbindung schließen, sobald Daten geholt wurden
             self._close_db_connection()
 
-            for key, data_str in rows:
-                try:
-                    data = json.loads(data_str)
-                except json.JSONDecodeError:
-                    logger.warning(f"Konnte JSON-Daten für Key {key} aus DB nicht parsen.")
-                    continue
-
-                # --- Logik aus altem _gather_all_activities ---
-                activities = data.get('activities', [])
-                for activity in activities:
-                    activity['issue_key'] = key
-                self.all_activities.extend(activities)
-
-                # --- Logik aus altem _build_issue_details_cache ---
-                points = 0
-                story_points_value = data.get('story_points')
-                if story_points_value is not None:
-                    try: points = int(story_points_value)
-                    except (ValueError, TypeError): points = 0
-
-                self.issue_details[key] = {
-                    'type': data.get('issue_type'),
-                    'title': data.get('title'),
-                    'description': data.get('description'),
-                    'acceptance_criteria': data.get('acceptance_criteria'),
-                    'business_value': data.get('business_value'),
-                    'status': data.get('status'),
-                    'resolution': data.get('resolution'),
-                    'points': points,
-                    'target_start': data.get('target_start'),
-                    'target_end': data.get('target_end'),
-                    'fix_versions': data.get('fix_versions'),
-                    'created': data.get('Created'),
-                    'resolved': data.get('Resolved'),
-                    'closed_date': data.get('Closed Date')
-                }
-
         except sqlite3.Error as e:
             logger.error(f"Fehler beim Laden der Batch-Daten aus SQLite: {e}")
             self._close_db_connection()
 
+        for key in node_keys:
+            data = self.preloaded_issues.get(key)
+            if data is not None:
+                self._add_issue_data(key, data)
+
     # +++ NEUE HILFSMETHODEN für DB-Verwaltung +++
     def _close_db_connection(self):
         """Schließt die Datenbankverbindung sicher."""
@@ -180,62 +164,58 @@ class ProjectDataProvider:
         return self.issue_tree is not None and len(self.issue_tree.nodes()) > 0
 
 
-    def _gather_all_activities(self) -> list:
-        """Sammelt die Aktivitäten aller Issues im Baum."""
-        all_activities = []
-        if not self.issue_tree: return []
-        for issue_key in self.issue_tree.nodes():
-            file_path = os.path.join(self.json_dir, f"{issue_key}.json")
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    issue_data = json.load(f)
-                    activities = issue_data.get('activities', [])
-                    for activity in activities:
-                        activity['issue_key'] = issue_key
-                    all_activities.extend(activities)
-            except (FileNotFoundError, json.JSONDecodeError) as e:
-                logger.warning(f"Datei für Issue '{issue_key}' nicht gefunden oder fehlerhaft: {e}")
-                continue
-        return all_activities
-
-    def _build_issue_details_cache(self) -> dict:
-        """Erstellt einen zentralen Cache mit aufbereiteten Details zu jedem Issue."""
-        cache = {}
-        if not self.issue_tree: return {}
+    def _load_data_from_files(self):
+        """
+        Lädt Details und Aktivitäten aller Issues im Baum aus den JSON-Dateien.
+        Jede Datei wird höchstens einmal gelesen; Issues aus dem Cache werden
+        direkt übernommen.
+        """
+        if not self.issue_tree:
+            return
         for issue_key in self.issue_tree.nodes():
-            file_path = os.path.join(self.json_dir, f"{issue_key}.json")
+            data = self.preloaded_issues.get(issue_key)
+            if data is None:
+                file_path = os.path.join(self.json_dir, f"{issue_key}.json")
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (FileNotFoundError, json.JSONDecodeError) as e:
+                    logger.warning(f"Datei für Issue '{issue_key}' nicht gefunden oder fehlerhaft: {e}")
+                    continue
+                self.preloaded_issues[issue_key] = data
+            self._add_issue_data(issue_key, data)
+
+    def _add_issue_data(self, key: str, data: dict):
+        """Übernimmt Aktivitäten und aufbereitete Details eines Issues."""
+        activities = data.get('activities', [])
+        for activity in activities:
+            activity['issue_key'] = key
+        self.all_activities.extend(activities)
+
+        points = 0
+        story_points_value = data.get('story_points')
+        if story_points_value is not None:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    points = 0
-                    story_points_value = data.get('story_points')
-                    if story_points_value is not None:
-                        try:
-                            points = int(story_points_value)
-                        except (ValueError, TypeError):
-                            points = 0
-
-                    cache[issue_key] = {
-                        'type': data.get('issue_type'),
-                        'title': data.get('title'),
-                        'description': data.get('description'),
-                        'acceptance_criteria': data.get('acceptance_criteria'),
-                        'business_value': data.get('business_value'),
-                        'status': data.get('status'),
-                        'resolution': data.get('resolution'),
-                        'points': points,
-                        'target_start': data.get('target_start'),
-                        'target_end': data.get('target_end'),
-                        'fix_versions': data.get('fix_versions'),
-                        'created': data.get('Created'),
-                        'resolved': data.get('Resolved'),
-                        'closed_date': data.get('Closed Date')
-                    }
-
-            except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Konnte Details für Issue '{issue_key}' nicht laden: {e}")
-                continue
-        return cache
+                points = int(story_points_value)
+            except (ValueError, TypeError):
+                points = 0
+
+        self.issue_details[key] = {
+            'type': data.get('issue_type'),
+            'title': data.get('title'),
+            'description': data.get('description'),
+            'acceptance_criteria': data.get('acceptance_criteria'),
+            'business_value': data.get('business_value'),
+            'status': data.get('status'),
+            'resolution': data.get('resolution'),
+            'points': points,
+            'target_start': data.get('target_start'),
+            'target_end': data.get('target_end'),
+            'fix_versions': data.get('fix_versions'),
+            'created': data.get('Created'),
+            'resolved': data.get('Resolved'),
+            'closed_date': data.get('Closed Date')
+        }
 
 
     def get_epic_json_summary(self, epic_id: str) -> dict | None:
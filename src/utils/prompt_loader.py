@@ -5,6 +5,13 @@ from .logger_config import logger # Annahme, dass logger_config in utils liegt
 
 from utils.config import PROMPTS_DIR
 
+# Der C-basierte LibYAML-Loader ist um ein Vielfaches schneller als der reine
+# Python-Parser. Fallback, falls PyYAML ohne LibYAML-Bindings installiert ist.
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
+
 def load_prompt_template(filename: str, key: str) -> str:
     """
     Lädt eine Prompt-Vorlage aus einer YAML-Datei im PROMPTS_DIR.
@@ -19,7 +26,7 @@ def load_prompt_template(filename: str, key: str) -> str:
     file_path = os.path.join(PROMPTS_DIR, filename)
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            prompts = yaml.safe_load(file)
+            prompts = yaml.load(file, Loader=CSafeLoader)
             return prompts[key]
     except FileNotFoundError:
         logger.error(f"Prompt-Datei nicht gefunden: {file_path}")
@@ -27,3 +34,21 @@ def load_prompt_template(filename: str, key: str) -> str:
     except KeyError:
         logger.error(f"Schlüssel '{key}' nicht in der Prompt-Datei '{filename}' gefunden.")
         sys.exit(1)
+
+def split_prompt_template(template: str, field: str) -> tuple[str, str]:
+    """
+    Zerlegt eine Prompt-Vorlage einmalig am Platzhalter `{field}`.
+
+    Beide Teile werden dabei wie von `str.format` entschärft ('{{' -> '{'),
+    sodass der fertige Prompt später per `prefix + wert + suffix` ohne
+    erneuten Durchlauf der Format-Maschinerie zusammengesetzt werden kann.
+
+    Args:
+        template (str): Die Prompt-Vorlage mit genau einem Platzhalter `{field}`.
+        field (str): Der Name des Platzhalters (z.B. 'json_context').
+
+    Returns:
+        tuple[str, str]: Der Text vor und nach dem Platzhalter.
+    """
+    prefix, suffix = template.split(f"{{{field}}}", 1)
+    return prefix.format(), suffix.format()
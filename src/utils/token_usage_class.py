@@ -20,8 +20,10 @@ Key features:
 
 import json
 import os
+import atexit
 import datetime
 import argparse
+import threading
 from typing import Dict, List, Optional, Tuple, Union
 import pandas as pd
 from pathlib import Path
@@ -63,6 +65,10 @@ class TokenUsage:
     The class uses a JSONL file format for storage, enabling continuous logging and
     easy retrieval of historical data. Each log entry captures timestamp, model, token
     counts, calculated costs, and optional metadata.
+
+    Log entries are buffered in memory and written with a single write call by
+    `flush()`. Pending entries are flushed automatically before usage data is
+    read and when the interpreter exits.
     """
 
     # Preisstruktur für verschiedene Modelle (in USD pro 1000 Tokens)
@@ -116,6 +122,11 @@ class TokenUsage:
             # Stelle sicher, dass das Verzeichnis existiert
             self.log_file_path.parent.mkdir(exist_ok=True, parents=True)
 
+        # Puffer für noch nicht geschriebene Einträge (thread-sicher)
+        self._pending: List[Dict] = []
+        self._pending_lock = threading.Lock()
+        atexit.register(self.flush)
+
     def log_usage(self,
                  model: str,
                  input_tokens: int,
@@ -167,12 +178,26 @@ class TokenUsage:
         if metadata:
             usage_entry["metadata"] = metadata
 
-        # Schreibe den Eintrag in die Log-Datei (im JSONL-Format: eine JSON-Zeile pro Eintrag)
-        with open(self.log_file_path, "a", encoding="utf-8") as log_file:
-            log_file.write(json.dumps(usage_entry) + "\n")
+        # Eintrag puffern; geschrieben wird gesammelt in flush()
+        with self._pending_lock:
+            self._pending.append(usage_entry)
 
         return usage_entry
 
+    def flush(self) -> None:
+        """
+        Schreibt alle gepufferten Einträge mit einem einzigen Schreibvorgang
+        in die Log-Datei (im JSONL-Format: eine JSON-Zeile pro Eintrag).
+        """
+        with self._pending_lock:
+            if not self._pending:
+                return
+            entries, self._pending = self._pending, []
+
+        lines = "".join(json.dumps(entry) + "\n" for entry in entries)
+        with open(self.log_file_path, "a", encoding="utf-8") as log_file:
+            log_file.write(lines)
+
     def _calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
         """
         Berechnet die Kosten für einen API-Aufruf basierend auf dem Modell und der Tokenanzahl.
@@ -204,6 +229,9 @@ class TokenUsage:
         Returns:
             DataFrame mit allen Token-Nutzungsdaten
         """
+        # Gepufferte Einträge zuerst schreiben, damit sie im Ergebnis enthalten sind
+        self.flush()
+
         if not os.path.exists(self.log_file_path):
             return pd.DataFrame()
 